@@ -1,7 +1,12 @@
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
+import bisect
 import uuid
 
+def _session_date(session: Dict[str, Any]) -> str:
+    """Sort key for study sessions (ISO dates sort chronologically as strings)"""
+    return session.get("date") or ""
+
 class AcademicTracker:
     """
     Tracks academic performance, courses, assignments, and study patterns
@@ -17,7 +22,15 @@ class AcademicTracker:
         self.tasks = data_manager.load_data(student_id, "academic", "tasks") or []
         self.performance = data_manager.load_data(student_id, "academic", "performance") or []
         self.study_sessions = data_manager.load_data(student_id, "academic", "study_sessions") or []
+        # Study sessions are kept in ascending date order so callers can slice recent entries directly
+        self.study_sessions.sort(key=_session_date)
         self.goals = data_manager.load_data(student_id, "academic", "goals") or []
+        
+        # Bumped whenever courses, study sessions or semester results change, so cached views can be invalidated
+        self.courses_version = 0
+        self.study_version = 0
+        self.performance_version = 0
+        self._cgpa_cache = None
     
     def get_courses(self, current_only: bool = False) -> List[Dict[str, Any]]:
         """Get the student's courses, optionally only current ones"""
@@ -37,6 +50,7 @@ class AcademicTracker:
         
         # Add the course
         self.courses.append(course_data)
+        self.courses_version += 1
         
         # Save the updated courses list
         success = self.data_manager.save_data(
@@ -50,6 +64,7 @@ class AcademicTracker:
         for i, course in enumerate(self.courses):
             if course.get("course_id") == course_id:
                 self.courses[i].update(updates)
+                self.courses_version += 1
                 
                 # Save the updated courses list
                 return self.data_manager.save_data(
@@ -64,6 +79,8 @@ class AcademicTracker:
         self.courses = [course for course in self.courses if course.get("course_id") != course_id]
         
         if len(self.courses) < original_len:
+            self.courses_version += 1
+            
             # Save the updated courses list
             return self.data_manager.save_data(
                 self.student_id, "academic", "courses", self.courses
@@ -187,6 +204,8 @@ class AcademicTracker:
         
         # Add the performance data
         self.performance.append(performance_data)
+        self.performance_version += 1
+        self._cgpa_cache = None
         
         # Save the updated performance list
         success = self.data_manager.save_data(
@@ -197,6 +216,12 @@ class AcademicTracker:
     
     def get_current_cgpa(self) -> float:
         """Get the student's current CGPA"""
+        if self._cgpa_cache is None:
+            self._cgpa_cache = self._compute_cgpa()
+        return self._cgpa_cache
+    
+    def _compute_cgpa(self) -> float:
+        """Read the CGPA recorded for the latest semester"""
         if not self.performance:
             return 0.0
         
@@ -222,8 +247,9 @@ class AcademicTracker:
         if "created_at" not in session_data:
             session_data["created_at"] = datetime.now().isoformat()
         
-        # Add the session
-        self.study_sessions.append(session_data)
+        # Add the session, keeping the list in date order
+        bisect.insort(self.study_sessions, session_data, key=_session_date)
+        self.study_version += 1
         
         # Save the updated sessions list
         success = self.data_manager.save_data(
@@ -233,7 +259,7 @@ class AcademicTracker:
         return success
     
     def get_study_hours_history(self) -> List[Dict[str, Any]]:
-        """Get the student's study hours history"""
+        """Get the student's study hours history, oldest session first"""
         if not self.study_sessions:
             # Return sample data for new students
             sample_dates = [
@@ -1,7 +1,14 @@
 import os
 import json
+import time
 import requests
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+# Seconds a cached answer is reused before the question is sent to the API again
+ADVICE_CACHE_TTL = 3600
+# Answers kept at most; the least recently used one is dropped past this
+ADVICE_CACHE_MAX_ENTRIES = 256
 
 class GroqAdvisor:
     """
@@ -15,6 +22,9 @@ class GroqAdvisor:
         self.api_url = "https://api.groq.com/openai/v1/chat/completions"
         self.model = "llama3-8b-8192"  # Using Llama 3 8B model
         
+        # Successful answers, with the time they were fetched, keyed by normalized query, domain and student context
+        self._advice_cache: "OrderedDict[tuple, Tuple[float, str]]" = OrderedDict()
+        
         # Domain-specific system prompts
         self.domain_prompts = {
             "mental_health": """You are a supportive mental wellness advisor for Indian college students.
@@ -41,6 +51,10 @@ class GroqAdvisor:
                 government schemes, bank loans, and financial support systems available specifically
                 for Indian students. Focus on realistic financial strategies for students."""
         }
+    
+    def update_key(self, api_key: Optional[str]) -> None:
+        """Swap the Groq API key in place without rebuilding the advisor"""
+        self.api_key = api_key or os.environ.get("GROQ_API_KEY")
         
     def get_advice(self, query: str, domain: str, student_context: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -57,6 +71,20 @@ class GroqAdvisor:
         if not self.api_key:
             return "Error: Groq API key is not configured. Please set up the API key in settings."
         
+        # Repeated questions (ignoring case and spacing) in the same context reuse the earlier answer
+        cache_key = (
+            " ".join(query.lower().split()),
+            domain,
+            json.dumps(student_context, sort_keys=True, default=str)
+        )
+        cached = self._advice_cache.get(cache_key)
+        if cached is not None:
+            fetched_at, advice = cached
+            if time.monotonic() - fetched_at < ADVICE_CACHE_TTL:
+                self._advice_cache.move_to_end(cache_key)
+                return advice
+            del self._advice_cache[cache_key]
+        
         # Select the appropriate system prompt
         system_prompt = self.domain_prompts.get(domain, self.domain_prompts["academic"])
         
@@ -94,6 +122,9 @@ class GroqAdvisor:
             # Parse the response
             result = response.json()
             advice = result["choices"][0]["message"]["content"]
+            self._advice_cache[cache_key] = (time.monotonic(), advice)
+            if len(self._advice_cache) > ADVICE_CACHE_MAX_ENTRIES:
+                self._advice_cache.popitem(last=False)
             
             return advice
         
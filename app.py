@@ -1,13 +1,16 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import os
 import json
 import time
+import uuid
+import heapq
+from collections import defaultdict
+from statistics import fmean
+from concurrent.futures import ThreadPoolExecutor
 import requests
 from PIL import Image
 from io import BytesIO
@@ -23,9 +26,86 @@ from modules.ai_advisor import GroqAdvisor  # Import for the AI advisor
 
 # Import utilities
 from utils.data_manager import DataManager
-from utils.visualization import create_gauge_chart, create_trend_chart, create_pie_chart
 from utils.prediction_engine import PredictiveEngine
 
+# Static form options shared by the pages below
+_DEGREES = (
+    "B.Tech/B.E.", "BBA", "B.Sc.", "B.Com.", "B.A.",
+    "M.Tech/M.E.", "MBA", "M.Sc.", "M.Com.", "M.A.",
+    "BCA", "MCA", "Ph.D.", "Diploma", "Other"
+)
+_YEARS = ("1st Year", "2nd Year", "3rd Year", "4th Year", "5th Year", "Final Year")
+_DOMAIN_OPTIONS = {
+    "Let AI detect the topic": None,
+    "Mental Wellness": "mental_health",
+    "Academic Success": "academic",
+    "Career Planning": "career",
+    "Financial Wellbeing": "financial"
+}
+_TASK_TYPES = ("Assignment", "Exam", "Project", "Study", "Meeting")
+_TREND_OPTIONS = ("Academic Performance", "Mood & Well-being", "Financial Overview", "Study Hours")
+_EXPENSE_CATEGORIES = (
+    "Food & Dining", "Transportation", "Books & Supplies",
+    "Rent & Utilities", "Entertainment", "Personal Care",
+    "Mobile & Internet", "Clothing", "Miscellaneous"
+)
+_INCOME_CATEGORIES = (
+    "Pocket Money", "Salary/Stipend", "Scholarship",
+    "Investment Returns", "Gifts", "Other Income"
+)
+_BUDGET_CATEGORIES = _EXPENSE_CATEGORIES
+
+# st.fragment (Streamlit >= 1.37, st.experimental_fragment from 1.33) limits a rerun to the
+# decorated function; on older Streamlit releases the function just runs with the full page
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+# st.html (Streamlit >= 1.33) inserts raw HTML without the markdown parser; for pure-HTML cards
+# on older releases it falls back to markdown with HTML allowed
+_html = getattr(st, "html", None) or (lambda body: st.markdown(body, unsafe_allow_html=True))
+
+# Sample data for empty states, showing students what the charts will look like
+_SAMPLE_CGPA = (
+    {"semester": "Sem 1", "cgpa": 7.8, "semester_index": 1},
+    {"semester": "Sem 2", "cgpa": 8.1, "semester_index": 2},
+    {"semester": "Sem 3", "cgpa": 8.4, "semester_index": 3}
+)
+_SAMPLE_PERFORMANCE = (
+    {"semester": "Semester 1", "sgpa": 8.1, "cgpa": 8.1, "semester_index": 1},
+    {"semester": "Semester 2", "sgpa": 8.3, "cgpa": 8.2, "semester_index": 2},
+    {"semester": "Semester 3", "sgpa": 7.9, "cgpa": 8.1, "semester_index": 3},
+    {"semester": "Semester 4", "sgpa": 8.5, "cgpa": 8.2, "semester_index": 4}
+)
+_SAMPLE_EXPENSES = (
+    {"category": "Food", "amount": 4000},
+    {"category": "Transportation", "amount": 1200},
+    {"category": "Books & Supplies", "amount": 2500},
+    {"category": "Entertainment", "amount": 800},
+    {"category": "Other", "amount": 1500}
+)
+_SAMPLE_MOOD_SCORES = (6, 7, 5, 6, 8, 7, 9)
+_SAMPLE_STUDY_SESSIONS = (
+    (2.5, "Math"), (3.0, "Physics"), (1.5, "English"), (4.0, "CS"),
+    (2.0, "History"), (3.5, "CS"), (2.0, "Math")
+)
+
+@st.cache_resource
+def _executor():
+    """Process-wide pool for slow, Streamlit-free loads (disk reads) that can overlap page rendering"""
+    return ThreadPoolExecutor(max_workers=4)
+
+def _sample_week(today):
+    """The seven dates before today as YYYY-MM-DD strings"""
+    return tuple((today - timedelta(days=i)).isoformat() for i in range(7, 0, -1))
+
+def _sample_mood_data(today):
+    """Sample week of mood scores ending yesterday"""
+    return [{"date": d, "score": s} for d, s in zip(_sample_week(today), _SAMPLE_MOOD_SCORES)]
+
+def _sample_study_data(today):
+    """Sample week of study sessions ending yesterday"""
+    return [{"date": d, "hours": h, "subject": subj}
+            for d, (h, subj) in zip(_sample_week(today), _SAMPLE_STUDY_SESSIONS)]
+
 def patch_missing_methods():
     """Patch missing methods to ensure application doesn't crash"""
     from modules.financial_planner import FinancialPlanner
@@ -112,40 +192,43 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Initialize session state variables if they don't exist
-if 'student_profile' not in st.session_state:
-    st.session_state.student_profile = None
-if 'data_manager' not in st.session_state:
-    st.session_state.data_manager = DataManager()
-if 'current_page' not in st.session_state:
-    st.session_state.current_page = "Home"
-if 'is_first_run' not in st.session_state:
-    st.session_state.is_first_run = True
-if 'show_welcome' not in st.session_state:
-    st.session_state.show_welcome = True
-if 'ai_advisor' not in st.session_state:
-    st.session_state.ai_advisor = GroqAdvisor()  # Initialize AI advisor
-if 'first_visit_sections' not in st.session_state:
-    st.session_state.first_visit_sections = {
+def _ensure_session_state():
+    """Establish all cheap session-state defaults in a single pass"""
+    state = st.session_state
+    state.setdefault('student_profile', None)
+    state.setdefault('current_page', "Home")
+    state.setdefault('is_first_run', True)
+    state.setdefault('show_welcome', True)
+    state.setdefault('first_visit_sections', {
         "Finance": True,
         "Academics": True,
         "Wellness": True,
         "Career": True,
         "Resources": True
-    }
-if 'groq_api_key' not in st.session_state:
-    st.session_state.groq_api_key = None
-if 'last_trend_update' not in st.session_state:
-    st.session_state.last_trend_update = None
-if 'cached_content' not in st.session_state:
-    st.session_state.cached_content = {
+    })
+    state.setdefault('groq_api_key', None)
+    state.setdefault('last_trend_update', None)
+    state.setdefault('cached_content', {
         "academic_trends": None,
         "financial_tips": None,
         "wellness_tips": None,
         "career_insights": None,
         "resources": {},
         "last_updated": None
-    }
+    })
+    
+    # Chat histories for the advisor page and each section's chatbot tab
+    for key in ('chat_history', 'academic_chat_history', 'finance_chat_history',
+                'wellness_chat_history', 'career_chat_history', 'resource_chat_history'):
+        state.setdefault(key, [])
+
+# Initialize session state variables if they don't exist
+_ensure_session_state()
+# Objects that are expensive to build keep the membership check so they are only constructed once
+if 'data_manager' not in st.session_state:
+    st.session_state.data_manager = DataManager()
+if 'ai_advisor' not in st.session_state:
+    st.session_state.ai_advisor = GroqAdvisor()  # Initialize AI advisor
 
 # Patch function to ensure FinancialPlanner has the needed method
 # This is a fix for the error where get_all_transactions might not exist
@@ -177,7 +260,7 @@ class AIAdvisorAgent:
     def set_api_key(self, api_key):
         """Set GROQ API key"""
         self.api_key = api_key
-        self.initialized = True
+        self.initialized = api_key is not None
         return True
     
     def _make_groq_request(self, model, messages, temperature=0.7, max_tokens=800):
@@ -979,6 +1062,35 @@ def update_content_cache(force=False):
         print(f"Error updating content cache: {e}")
         # We'll fall back to default values if the update fails
 
+# Static headlines shown until AI news has been fetched for the session
+_FALLBACK_NEWS = {
+    "education": [
+        {"title": "NEP 2020: New Changes Coming for Engineering Programs", "date": "April 5, 2025", "source": "Education Times"},
+        {"title": "Top 10 Universities in India Announce Special Scholarships", "date": "April 2, 2025", "source": "India Today"},
+        {"title": "Digital Learning Platforms See 45% Growth in Indian Student Adoption", "date": "March 28, 2025", "source": "Tech Education"}
+    ],
+    "finance": [
+        {"title": "New Government Financial Aid Scheme for STEM Students Announced", "date": "April 6, 2025", "source": "Financial Express"},
+        {"title": "Student Credit Card with Special Benefits Launched by SBI", "date": "April 1, 2025", "source": "Banking News"},
+        {"title": "How to Apply for Education Loan: Updated Guidelines for 2025", "date": "March 25, 2025", "source": "Student Finance"}
+    ],
+    "wellness": [
+        {"title": "Study Shows Direct Link Between Sleep Quality and Exam Performance", "date": "April 4, 2025", "source": "Health Times"},
+        {"title": "Campus Mental Health Programs See Positive Results", "date": "March 30, 2025", "source": "Wellness Today"},
+        {"title": "Mindfulness Apps Specifically Designed for Student Stress Released", "date": "March 20, 2025", "source": "Digital Wellness"}
+    ],
+    "career": [
+        {"title": "Top In-Demand Skills for 2025 Graduates in India", "date": "April 7, 2025", "source": "Career Guide"},
+        {"title": "Major Tech Companies Announce Increased Hiring for Indian Graduates", "date": "April 3, 2025", "source": "Tech Careers"},
+        {"title": "Remote Work Opportunities for Students Rise by 60%", "date": "March 29, 2025", "source": "Future of Work"}
+    ],
+    "resources": [
+        {"title": "5 New Digital Libraries Offering Free Resources to Indian Students", "date": "April 6, 2025", "source": "Education Resources"},
+        {"title": "NPTEL Launches 50 New Free Certification Courses", "date": "April 2, 2025", "source": "Online Learning"},
+        {"title": "Government Launches National Digital Skills Portal for Students", "date": "March 28, 2025", "source": "Digital India"}
+    ]
+}
+
 # Function to fetch trending news
 def fetch_trending_news(topic, max_items=3):
     """Get trending news either from cache or fallback data"""
@@ -988,35 +1100,7 @@ def fetch_trending_news(topic, max_items=3):
         return st.session_state.cached_content[cache_key][:max_items]
     
     # Fallback data if not in cache
-    news_data = {
-        "education": [
-            {"title": "NEP 2020: New Changes Coming for Engineering Programs", "date": "April 5, 2025", "source": "Education Times"},
-            {"title": "Top 10 Universities in India Announce Special Scholarships", "date": "April 2, 2025", "source": "India Today"},
-            {"title": "Digital Learning Platforms See 45% Growth in Indian Student Adoption", "date": "March 28, 2025", "source": "Tech Education"}
-        ],
-        "finance": [
-            {"title": "New Government Financial Aid Scheme for STEM Students Announced", "date": "April 6, 2025", "source": "Financial Express"},
-            {"title": "Student Credit Card with Special Benefits Launched by SBI", "date": "April 1, 2025", "source": "Banking News"},
-            {"title": "How to Apply for Education Loan: Updated Guidelines for 2025", "date": "March 25, 2025", "source": "Student Finance"}
-        ],
-        "wellness": [
-            {"title": "Study Shows Direct Link Between Sleep Quality and Exam Performance", "date": "April 4, 2025", "source": "Health Times"},
-            {"title": "Campus Mental Health Programs See Positive Results", "date": "March 30, 2025", "source": "Wellness Today"},
-            {"title": "Mindfulness Apps Specifically Designed for Student Stress Released", "date": "March 20, 2025", "source": "Digital Wellness"}
-        ],
-        "career": [
-            {"title": "Top In-Demand Skills for 2025 Graduates in India", "date": "April 7, 2025", "source": "Career Guide"},
-            {"title": "Major Tech Companies Announce Increased Hiring for Indian Graduates", "date": "April 3, 2025", "source": "Tech Careers"},
-            {"title": "Remote Work Opportunities for Students Rise by 60%", "date": "March 29, 2025", "source": "Future of Work"}
-        ],
-        "resources": [
-            {"title": "5 New Digital Libraries Offering Free Resources to Indian Students", "date": "April 6, 2025", "source": "Education Resources"},
-            {"title": "NPTEL Launches 50 New Free Certification Courses", "date": "April 2, 2025", "source": "Online Learning"},
-            {"title": "Government Launches National Digital Skills Portal for Students", "date": "March 28, 2025", "source": "Digital India"}
-        ]
-    }
-    
-    return news_data.get(topic, [])[0:max_items]
+    return _FALLBACK_NEWS.get(topic, [])[0:max_items]
 
 # Function to generate relevant opportunities based on student profile
 def generate_personalized_opportunities(student):
@@ -1949,6 +2033,7 @@ def ensure_logo_exists():
         os.makedirs('assets', exist_ok=True)
         # Create a simple placeholder logo using matplotlib
         try:
+            import matplotlib.pyplot as plt
             plt.figure(figsize=(6, 2))
             plt.text(0.5, 0.5, 'HARMONY-India', 
                    fontsize=30, ha='center', va='center', 
@@ -2098,8 +2183,7 @@ def sidebar_navigation():
                 if st.sidebar.button("🔄 Refresh Data"):
                     with st.sidebar.spinner("Updating data..."):
                         update_content_cache(force=True)
-                    st.sidebar.success("Data refreshed!")
-                    time.sleep(1)
+                    st.toast("Data refreshed!", icon="✅")
                     st.rerun()
     
     # Show app information in sidebar
@@ -2119,8 +2203,53 @@ def sidebar_navigation():
     current_date = datetime.now().strftime("%d %b %Y")
     st.sidebar.caption(f"© 2025 HARMONY-India | {current_date}")
 
+def _validate_new_profile():
+    """Submit callback for the new profile form; flags it for creation only when required fields are set"""
+    state = st.session_state
+    valid = bool(state.get("new_profile_full_name") and state.get("new_profile_college_name"))
+    state.new_profile_submitted = valid
+    state.new_profile_invalid = not valid
+
+def _create_profile_from_form(now):
+    """Save the validated new profile form values and open the dashboard"""
+    state = st.session_state
+    
+    # Generate a unique student ID
+    student_id = str(uuid.uuid4())
+    
+    # Create student profile
+    dob = state.get("new_profile_dob")
+    profile_data = {
+        "full_name": state.new_profile_full_name,
+        "college_name": state.new_profile_college_name,
+        "degree": state.new_profile_degree,
+        "year_of_study": state.new_profile_year_of_study,
+        "dob": dob.strftime("%Y-%m-%d") if dob else None,
+        "email": state.get("new_profile_email", ""),
+        "created_at": now.isoformat()
+    }
+    
+    # Save profile
+    if state.data_manager.save_student_profile(student_id, profile_data):
+        st.toast("Profile created!", icon="✅")
+        
+        # Initialize modules with the new profile
+        with st.spinner("Setting up your personalized dashboard..."):
+            if initialize_modules(student_id):
+                state.current_page = "Dashboard"
+                # Show onboarding tips
+                state.show_welcome = True
+                st.rerun()
+            else:
+                st.error("Error initializing your profile. Please try again.")
+    else:
+        st.error("Error creating profile. Please try again.")
+
 # Welcome/login page with improved UI
 def show_welcome_page():
+    # Single timestamp for this render
+    _now = datetime.now()
+    
     st.markdown("# 🎓 HARMONY-India")
     st.markdown("## Your Personalized Success Platform")
     
@@ -2192,73 +2321,47 @@ def show_welcome_page():
                 login_option = "Create New Profile"
                 
         if login_option == "Create New Profile":
-            with st.form("new_profile_form"):
+            # Create the profile once the submit callback has validated the form
+            if st.session_state.pop("new_profile_submitted", False):
+                _create_profile_from_form(_now)
+            
+            with st.form("new_profile_form", clear_on_submit=False):
                 st.subheader("Create Your Profile")
                 
                 # Enhanced form with clear labels and placeholders
-                full_name = st.text_input("👤 Full Name*", placeholder="Enter your full name")
-                college_name = st.text_input("🏫 College/University Name*", placeholder="Enter your college/university name")
+                st.text_input("👤 Full Name*", placeholder="Enter your full name", key="new_profile_full_name")
+                st.text_input("🏫 College/University Name*", placeholder="Enter your college/university name",
+                              key="new_profile_college_name")
                 
                 col1, col2 = st.columns(2)
                 with col1:
-                    degree = st.selectbox("🎓 Degree Program*", [
-                        "B.Tech/B.E.", "BBA", "B.Sc.", "B.Com.", "B.A.", 
-                        "M.Tech/M.E.", "MBA", "M.Sc.", "M.Com.", "M.A.",
-                        "BCA", "MCA", "Ph.D.", "Diploma", "Other"
-                    ])
+                    st.selectbox("🎓 Degree Program*", _DEGREES, key="new_profile_degree")
                     
                 with col2:
-                    year_of_study = st.selectbox("📚 Year of Study*", [
-                        "1st Year", "2nd Year", "3rd Year", "4th Year", "5th Year", "Final Year"
-                    ])
+                    st.selectbox("📚 Year of Study*", _YEARS, key="new_profile_year_of_study")
                 
-                dob = st.date_input("🗓️ Date of Birth", 
-                                   min_value=datetime(1980, 1, 1),
-                                   max_value=datetime.now() - timedelta(days=365*16))  # Minimum 16 years old
+                st.date_input("🗓️ Date of Birth", 
+                              min_value=datetime(1980, 1, 1),
+                              max_value=_now - timedelta(days=365*16),  # Minimum 16 years old
+                              key="new_profile_dob")
                 
-                email = st.text_input("📧 Email Address", placeholder="your.email@example.com")
+                st.text_input("📧 Email Address", placeholder="your.email@example.com", key="new_profile_email")
                 
                 st.info("Fields marked with * are required")
                 
-                submitted = st.form_submit_button("Create Profile & Get Started")
+                st.form_submit_button("Create Profile & Get Started", on_click=_validate_new_profile)
                 
-                if submitted:
-                    if not full_name or not college_name:
-                        st.error("Please fill in all required fields marked with *")
-                    else:
-                        # Generate a unique student ID
-                        import uuid
-                        student_id = str(uuid.uuid4())
-                        
-                        # Create student profile
-                        profile_data = {
-                            "full_name": full_name,
-                            "college_name": college_name,
-                            "degree": degree,
-                            "year_of_study": year_of_study,
-                            "dob": dob.strftime("%Y-%m-%d") if dob else None,
-                            "email": email,
-                            "created_at": datetime.now().isoformat()
-                        }
-                        
-                        # Save profile
-                        if st.session_state.data_manager.save_student_profile(student_id, profile_data):
-                            st.success("Profile created successfully!")
-                            
-                            # Initialize modules with the new profile
-                            with st.spinner("Setting up your personalized dashboard..."):
-                                if initialize_modules(student_id):
-                                    st.session_state.current_page = "Dashboard"
-                                    # Show onboarding tips
-                                    st.session_state.show_welcome = True
-                                    st.rerun()
-                                else:
-                                    st.error("Error initializing your profile. Please try again.")
-                        else:
-                            st.error("Error creating profile. Please try again.")
+                if st.session_state.pop("new_profile_invalid", False):
+                    st.error("Please fill in all required fields marked with *")
         
         st.markdown("</div>", unsafe_allow_html=True)
 
+def _apply_api_key(api_key):
+    """Store the Groq API key once and hand it to both AI clients"""
+    st.session_state.groq_api_key = api_key
+    st.session_state.ai_agent.set_api_key(api_key)
+    st.session_state.ai_advisor.update_key(api_key)  # Also update the chatbot advisor
+
 # AI Settings configuration
 def show_ai_settings():
     st.subheader("🤖 AI Advisor Configuration")
@@ -2287,10 +2390,8 @@ def show_ai_settings():
         
         if st.button("Save API Key", key="save_groq_key"):
             if api_key.startswith("gsk_"):
-                st.session_state.groq_api_key = api_key
-                st.session_state.ai_agent.set_api_key(api_key)
-                st.session_state.ai_advisor = GroqAdvisor(api_key=api_key)  # Also update the chatbot advisor
-                st.success("API key saved! AI features are now enabled across all sections.")
+                _apply_api_key(api_key)
+                st.toast("API key saved! AI features are now enabled across all sections.", icon="✅")
                 
                 # Reset trend data to force refresh with AI
                 st.session_state.cached_content["last_updated"] = None
@@ -2299,13 +2400,10 @@ def show_ai_settings():
                 with st.spinner("Fetching personalized content..."):
                     update_content_cache(force=True)
                 
-                # Add a small delay before rerun
-                time.sleep(1)
                 st.rerun()
             elif api_key == "":
-                st.warning("API key removed. AI personalization features will be limited.")
-                st.session_state.groq_api_key = None
-                time.sleep(1)
+                st.toast("API key removed. AI personalization features will be limited.", icon="⚠️")
+                _apply_api_key(None)
                 st.rerun()
             else:
                 st.error("Invalid API key format. Groq keys start with 'gsk_'")
@@ -2348,8 +2446,7 @@ def show_ai_settings():
         if st.button("Refresh All Content Now"):
             with st.spinner("Fetching latest information with AI..."):
                 update_content_cache(force=True)
-            st.success("All content refreshed successfully!")
-            time.sleep(1)
+            st.toast("All content refreshed successfully!", icon="✅")
             st.rerun()
     
     # AI Usage Statistics
@@ -2418,24 +2515,12 @@ def show_ai_advisor_page():
     
     # Domain selection
     st.markdown("### What would you like advice on?")
-    domain_options = {
-        "Let AI detect the topic": None,
-        "Mental Wellness": "mental_health",
-        "Academic Success": "academic", 
-        "Career Planning": "career",
-        "Financial Wellbeing": "financial"
-    }
-    
     selected_domain_label = st.selectbox(
         "Choose a topic or let AI detect the best category",
-        options=list(domain_options.keys())
+        options=tuple(_DOMAIN_OPTIONS)
     )
     
-    selected_domain = domain_options[selected_domain_label]
-    
-    # Initialize chat history if it doesn't exist
-    if 'chat_history' not in st.session_state:
-        st.session_state.chat_history = []
+    selected_domain = _DOMAIN_OPTIONS[selected_domain_label]
     
     # Chat interface
     st.markdown("### Ask Your Question")
@@ -2462,14 +2547,7 @@ def show_ai_advisor_page():
             st.session_state.chat_history.append(("user", user_query))
             
             # Prepare student context for more personalized answers
-            student_context = None
-            if st.session_state.student_profile:
-                profile = st.session_state.student_profile
-                student_context = {
-                    "degree": profile.get_degree(),
-                    "year": profile.get_year_of_study(),
-                    "college": profile.get_college_name()
-                }
+            student_context = _student_context()
             
             # Determine domain if auto-detection is selected
             query_domain = selected_domain
@@ -2488,8 +2566,200 @@ def show_ai_advisor_page():
             # Force a rerun to show the updated chat
             st.rerun()
 
+# Dashboard card templates, filled with str.format
+_TASK_GROUP_TEMPLATES = (
+    ("<h4 style='color: #d32f2f;'>⚠️ Overdue Tasks</h4>", (
+        '<div style="background-color: #ffebee; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #d32f2f;">\n'
+        '<strong>{title}</strong> - {course_code} ({days} days ago)\n</div>')),
+    ("<h4 style='color: #ff9800;'>⏰ Due Today</h4>", (
+        '<div style="background-color: #fff3e0; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #ff9800;">\n'
+        '<strong>{title}</strong> - {course_code}\n</div>')),
+    ("<h4 style='color: #2196f3;'>🔜 Due Soon</h4>", (
+        '<div style="background-color: #e3f2fd; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #2196f3;">\n'
+        '<strong>{title}</strong> - {course_code} ({days} days left)\n</div>')),
+    ("<h4 style='color: #4caf50;'>📝 Upcoming</h4>", (
+        '<div style="background-color: #e8f5e9; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #4caf50;">\n'
+        '<strong>{title}</strong> - {course_code} ({days} days left)\n</div>')),
+)
+_RECOMMENDATION_TEMPLATES = {
+    "high": (
+        '<div style="background-color: #ffebee; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #d32f2f;">\n'
+        '<strong style="color: #c62828;">❗ {title}</strong><br>\n'
+        '<span style="color: #333333;">{description}</span>\n</div>'),
+    "medium": (
+        '<div style="background-color: #fff3e0; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #ff9800;">\n'
+        '<strong style="color: #e65100;">⚠️ {title}</strong><br>\n'
+        '<span style="color: #333333;">{description}</span>\n</div>'),
+    "low": (
+        '<div style="background-color: #e8f5e9; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #4caf50;">\n'
+        '<strong style="color: #2e7d32;">💡 {title}</strong><br>\n'
+        '<span style="color: #333333;">{description}</span>\n</div>'),
+}
+_NEWS_CARD_TEMPLATE = '<div class="news-card">\n<h4>{title}</h4>\n<p>{date} • {source}</p>\n</div>'
+_TREND_CARD_TEMPLATE = (
+    '<div class="trend-card">\n<h4>{trend}</h4>\n'
+    '<p><strong>Description:</strong> {description}</p>\n'
+    '<p><strong>Benefit:</strong> {benefit}</p>\n</div>'
+)
+
+def _points(data, *keys):
+    """Hashable (x, y, ...) tuples from a list of dicts, used as figure cache keys"""
+    return tuple(tuple(entry.get(key) for key in keys) for entry in data)
+
+# Figure caches are process-wide and keyed on each student's data, so every one of them is bounded
+@st.cache_data(show_spinner=False, max_entries=64)
+def _trend_fig(points, x_key, y_key, title, color, render_mode="auto"):
+    """create_trend_chart() memoized on the points it plots"""
+    from utils.visualization import WEBGL_MAX_POINTS, WEBGL_MIN_POINTS, create_trend_chart, downsample_points
+    data = [{x_key: x, y_key: y} for x, y in points]
+    # Decimate server-side so the browser only receives what it can draw: WebGL copes with far
+    # more points than SVG, but no series is sent unbounded
+    if render_mode != "svg" and len(data) >= WEBGL_MIN_POINTS:
+        data = downsample_points(data, y_key, max_points=WEBGL_MAX_POINTS)
+    else:
+        data = downsample_points(data, y_key)
+    return create_trend_chart(data=data, x_key=x_key, y_key=y_key, title=title, color=color,
+                              render_mode=render_mode)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _pie_fig(slices, labels_key, values_key, title):
+    """create_pie_chart() memoized on the slices it plots"""
+    from utils.visualization import create_pie_chart
+    data = [{labels_key: label, values_key: value} for label, value in slices]
+    return create_pie_chart(data=data, labels_key=labels_key, values_key=values_key, title=title)
+
+def _versioned(name, version, loader):
+    """Session-cached result of loader(), reused until version changes"""
+    # Versions hold the owning objects themselves rather than id(): the entry keeps them alive, so a
+    # replacement object starting from the same counter value can never match a stale entry
+    cached = st.session_state.get(name)
+    if cached is None or cached[0] != version:
+        cached = (version, loader())
+        st.session_state[name] = cached
+    return cached[1]
+
+def _recommendations_version():
+    # Deadlines and the last week of mood move with the clock, so the hour expires an unchanged copy too
+    return (st.session_state.student_profile.student_id, st.session_state.data_manager.version,
+            datetime.now().strftime("%Y-%m-%d %H"))
+
+def _build_recommendations(engine):
+    """Recommendations rebuilt from stored data, bypassing the engine's own hourly cache"""
+    engine.recommendations_cache = None
+    return engine.get_personalized_recommendations()
+
+def _prefetch_recommendations():
+    """Start building recommendations on a worker thread when the cached copy is stale"""
+    version = _recommendations_version()
+    cached = st.session_state.get('recommendations_cache')
+    if cached is not None and cached[0] == version:
+        return
+    # A run cut short by st.rerun() leaves its future here; reuse it rather than racing a second
+    # build against the same engine, and never start one while another is still running
+    pending = st.session_state.get('recommendations_pending')
+    if pending is not None and (pending[0] == version or not pending[1].done()):
+        return
+    st.session_state.recommendations_pending = (
+        version, _executor().submit(_build_recommendations, st.session_state.prediction_engine))
+
+def _cached_recommendations():
+    """Personalized recommendations, recomputed after the student's stored data changes or the hour turns"""
+    pending = st.session_state.pop('recommendations_pending', None)
+    if pending is not None:
+        # Stored under the version the build started from, so a save made meanwhile still triggers a rebuild
+        version, future = pending
+        st.session_state.recommendations_cache = (version, future.result())
+    engine = st.session_state.prediction_engine
+    return _versioned('recommendations_cache', _recommendations_version(),
+                      lambda: _build_recommendations(engine))
+
+def _current_courses(academic):
+    """Current courses, reused until a course is added, edited or removed"""
+    return _versioned('current_courses_cache', (academic, academic.courses_version),
+                      lambda: academic.get_courses(current_only=True))
+
+def _student_context(**extra):
+    """Degree, year and college for advisor prompts, rebuilt only when the profile changes"""
+    profile = st.session_state.student_profile
+    if not profile:
+        return None
+    # Settings saves swap in a fresh StudentProfile at version 0, so the profile object itself is part of the key
+    base = _versioned('student_context_cache', (profile.student_id, profile, profile.version), lambda: {
+        "degree": profile.get_degree(),
+        "year": profile.get_year_of_study(),
+        "college": profile.get_college_name()
+    })
+    return {**base, **extra} if extra else base
+
+# Chat transcripts render as one scrollable markdown element; only the newest messages stay inline
+_CHAT_HISTORY_LIMIT = 50
+_CHAT_CONTAINER_TEMPLATE = '<div style="background-color: #f8f9fa; padding: 15px; border-radius: 8px; margin-bottom: 20px; max-height: 400px; overflow-y: auto;">{}</div>'
+_USER_BUBBLE_TEMPLATE = '<div style="background-color: #e7f5fe; padding: 10px; border-radius: 15px 15px 5px 15px; margin-bottom: 10px; margin-left: 20px;"><strong>You:</strong> {message}</div>'
+_ASSISTANT_BUBBLE_TEMPLATE = '<div style="background-color: #f0f0f0; padding: 10px; border-radius: 15px 15px 15px 5px; margin-bottom: 10px;"><strong>{label}:</strong> {message}</div>'
+
+def _chat_html(messages, assistant_label):
+    """(role, message) pairs as a single block of chat bubbles"""
+    return _CHAT_CONTAINER_TEMPLATE.format("".join(
+        _USER_BUBBLE_TEMPLATE.format(message=message) if role == "user"
+        else _ASSISTANT_BUBBLE_TEMPLATE.format(label=assistant_label, message=message)
+        for role, message in messages
+    ))
+
+def _render_chat_history(history, assistant_label):
+    """Latest chat messages in one element, with older ones collapsed in an expander"""
+    if not history:
+        return
+    earlier, recent = history[:-_CHAT_HISTORY_LIMIT], history[-_CHAT_HISTORY_LIMIT:]
+    # Through st.markdown, not _html: advisor replies are markdown (bold, bullets, paragraphs)
+    if earlier:
+        with st.expander(f"Show earlier messages ({len(earlier)})"):
+            st.markdown(_chat_html(earlier, assistant_label), unsafe_allow_html=True)
+    st.markdown(_chat_html(recent, assistant_label), unsafe_allow_html=True)
+
+def _opportunities(student):
+    """Personalized opportunities, rebuilt only when the profile or the cached career insights change"""
+    insights = st.session_state.cached_content.get("career_insights")
+    return _versioned('opportunities_cache', (student, student.version, insights),
+                      lambda: generate_personalized_opportunities(student))
+
+def _career_context(career):
+    """Career interests and target roles for advisor prompts, rebuilt only when saved data changes"""
+    def build():
+        career_profile = career.get_career_profile() or {}
+        return {
+            "career_interests": ", ".join(career_profile.get('interests', [])) or "Not specified",
+            "target_roles": ", ".join(career_profile.get('target_roles', [])) or "Not specified"
+        }
+    # The career profile lives in the data manager, whose version moves on every save
+    return _versioned('career_context_cache', (career, career.data_manager.version), build)
+
+def _mood_history(wellness):
+    """Logged mood history, reused until a new mood entry is logged; empty until the first one"""
+    # get_mood_history() fills in random sample rows for new students; the pages draw their own empty state
+    return _versioned('mood_history_cache', (wellness, wellness.mood_version),
+                      lambda: wellness.get_mood_history() if wellness.mood_entries else [])
+
+def _study_data(academic):
+    """Study hours history, reused until a new study session is logged"""
+    return _versioned('study_history_cache', (academic, academic.study_version),
+                      academic.get_study_hours_history)
+
+def _performance_data(academic):
+    """Semester performance history, reused until a new semester result is added"""
+    return _versioned('performance_history_cache', (academic, academic.performance_version),
+                      academic.get_performance_history)
+
+@st.cache_data(show_spinner=False)
+def _gauge_svg(current_value, min_value, max_value, threshold, title, is_percent=False):
+    """Render a KPI gauge as inline SVG, cached per distinct reading"""
+    from utils.visualization import create_gauge_svg
+    return create_gauge_svg(current_value, min_value, max_value, threshold, title, is_percent)
+
 # Dashboard page with improved UI
 def show_dashboard():
+    # Single timestamp shared by every date calculation in this render
+    _now = datetime.now()
+    
     st.title("Your Student Dashboard")
     
     # Show onboarding tips for new users with better UX
@@ -2519,8 +2789,11 @@ def show_dashboard():
     wellness = st.session_state.mental_wellness
     career = st.session_state.career_guide
     
+    # Recommendations read several JSON files; load them in the background while the page renders
+    _prefetch_recommendations()
+    
     # Current date display
-    current_date = datetime.now().strftime("%A, %d %B %Y")
+    current_date = _now.strftime("%A, %d %B %Y")
     st.markdown(f"### {current_date}")
     
     # First row - Overview cards with improved visualizations
@@ -2532,14 +2805,14 @@ def show_dashboard():
         current_cgpa = academic.get_current_cgpa()
         cgpa_goal = academic.get_cgpa_goal()
         
-        fig = create_gauge_chart(
+        gauge = _gauge_svg(
             current_value=current_cgpa,
             min_value=0,
             max_value=10,
             threshold=cgpa_goal,
             title="Current CGPA"
         )
-        st.plotly_chart(fig, use_container_width=True)
+        st.markdown(gauge, unsafe_allow_html=True)
         
         if current_cgpa >= 8.5:
             st.success("Excellent academic performance!")
@@ -2552,7 +2825,7 @@ def show_dashboard():
         st.markdown("### Financial Health")
         budget_adherence = financial.get_budget_adherence()
         
-        fig = create_gauge_chart(
+        gauge = _gauge_svg(
             current_value=budget_adherence,
             min_value=0,
             max_value=100,
@@ -2560,7 +2833,7 @@ def show_dashboard():
             title="Budget Adherence %",
             is_percent=True
         )
-        st.plotly_chart(fig, use_container_width=True)
+        st.markdown(gauge, unsafe_allow_html=True)
         
         if budget_adherence >= 90:
             st.success("Excellent budget management!")
@@ -2573,14 +2846,14 @@ def show_dashboard():
         st.markdown("### Well-being")
         wellness_score = wellness.get_current_wellness_score()
         
-        fig = create_gauge_chart(
+        gauge = _gauge_svg(
             current_value=wellness_score,
             min_value=0,
             max_value=10,
             threshold=7,
             title="Well-being Score"
         )
-        st.plotly_chart(fig, use_container_width=True)
+        st.markdown(gauge, unsafe_allow_html=True)
         
         if wellness_score >= 8:
             st.success("Great mental well-being!")
@@ -2593,7 +2866,7 @@ def show_dashboard():
         st.markdown("### Career Readiness")
         career_readiness = career.get_career_readiness_score()
         
-        fig = create_gauge_chart(
+        gauge = _gauge_svg(
             current_value=career_readiness,
             min_value=0,
             max_value=100,
@@ -2601,7 +2874,7 @@ def show_dashboard():
             title="Career Readiness %",
             is_percent=True
         )
-        st.plotly_chart(fig, use_container_width=True)
+        st.markdown(gauge, unsafe_allow_html=True)
         
         if career_readiness >= 80:
             st.success("Well-prepared for career challenges!")
@@ -2619,7 +2892,8 @@ def show_dashboard():
         upcoming_tasks = academic.get_upcoming_tasks(limit=5)
         if upcoming_tasks:
             task_df = pd.DataFrame(upcoming_tasks)
-            task_df['days_left'] = task_df['due_date'].apply(lambda x: (datetime.fromisoformat(x) - datetime.now()).days if x else None)
+            due = pd.to_datetime(task_df['due_date'], errors='coerce')
+            task_df['days_left'] = (due - pd.Timestamp(_now)).dt.days
             
             # Group tasks by urgency
             overdue_tasks = task_df[task_df['days_left'] < 0]
@@ -2627,42 +2901,19 @@ def show_dashboard():
             due_soon = task_df[(task_df['days_left'] > 0) & (task_df['days_left'] <= 3)]
             upcoming = task_df[task_df['days_left'] > 3]
             
-            # Display tasks by group with distinctive styling
-            if not overdue_tasks.empty:
-                st.markdown("<h4 style='color: #d32f2f;'>⚠️ Overdue Tasks</h4>", unsafe_allow_html=True)
-                for _, task in overdue_tasks.iterrows():
-                    st.markdown(f"""
-                    <div style="background-color: #ffebee; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #d32f2f;">
-                        <strong>{task['title']}</strong> - {task['course_code']} ({abs(task['days_left'])} days ago)
-                    </div>
-                    """, unsafe_allow_html=True)
-            
-            if not due_today.empty:
-                st.markdown("<h4 style='color: #ff9800;'>⏰ Due Today</h4>", unsafe_allow_html=True)
-                for _, task in due_today.iterrows():
-                    st.markdown(f"""
-                    <div style="background-color: #fff3e0; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #ff9800;">
-                        <strong>{task['title']}</strong> - {task['course_code']}
-                    </div>
-                    """, unsafe_allow_html=True)
-            
-            if not due_soon.empty:
-                st.markdown("<h4 style='color: #2196f3;'>🔜 Due Soon</h4>", unsafe_allow_html=True)
-                for _, task in due_soon.iterrows():
-                    st.markdown(f"""
-                    <div style="background-color: #e3f2fd; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #2196f3;">
-                        <strong>{task['title']}</strong> - {task['course_code']} ({task['days_left']} days left)
-                    </div>
-                    """, unsafe_allow_html=True)
+            # Display tasks by group with distinctive styling, emitted as one HTML block
+            html_parts = []
+            for group, (header, template) in zip((overdue_tasks, due_today, due_soon, upcoming), _TASK_GROUP_TEMPLATES):
+                if group.empty:
+                    continue
+                html_parts.append(header)
+                html_parts.extend(
+                    template.format(title=task.title, course_code=task.course_code, days=abs(task.days_left))
+                    for task in group.itertuples(index=False)
+                )
             
-            if not upcoming.empty:
-                st.markdown("<h4 style='color: #4caf50;'>📝 Upcoming</h4>", unsafe_allow_html=True)
-                for _, task in upcoming.iterrows():
-                    st.markdown(f"""
-                    <div style="background-color: #e8f5e9; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #4caf50;">
-                        <strong>{task['title']}</strong> - {task['course_code']} ({task['days_left']} days left)
-                    </div>
-                    """, unsafe_allow_html=True)
+            if html_parts:
+                st.markdown("\n".join(html_parts), unsafe_allow_html=True)
         else:
             # Better empty state
             st.markdown("""
@@ -2675,17 +2926,17 @@ def show_dashboard():
     with col2:
         st.subheader("Quick Add Task")
         
-        with st.form("quick_add_form"):
-            task_type = st.selectbox("Task Type", ["Assignment", "Exam", "Project", "Study", "Meeting"])
-            task_title = st.text_input("Title", placeholder="e.g., Research Paper")
-            due_date = st.date_input("Due Date", min_value=datetime.now())
+        with st.form("quick_add_form", clear_on_submit=False):
+            task_type = st.selectbox("Task Type", _TASK_TYPES, key="quick_add_type")
+            task_title = st.text_input("Title", placeholder="e.g., Research Paper", key="quick_add_title")
+            due_date = st.date_input("Due Date", min_value=_now, key="quick_add_due_date")
             courses = academic.get_courses()
             
             if courses:
-                course = st.selectbox("Course", courses)
+                course = st.selectbox("Course", courses, key="quick_add_course")
             else:
                 st.info("First, add a course in Academics section")
-                course = st.text_input("Course Code", placeholder="e.g., CS101")
+                course = st.text_input("Course Code", placeholder="e.g., CS101", key="quick_add_course_code")
             
             st.markdown('<div style="text-align: center;">', unsafe_allow_html=True)
             submitted = st.form_submit_button("Add Task")
@@ -2701,8 +2952,7 @@ def show_dashboard():
                         "status": "pending"
                     }
                     if academic.add_task(new_task):
-                        st.success("Task added successfully!")
-                        time.sleep(1)
+                        st.toast("Task added successfully!", icon="✅")
                         st.rerun()
                     else:
                         st.error("Failed to add task.")
@@ -2719,20 +2969,15 @@ def show_dashboard():
         
         trend_option = st.selectbox(
             "Select trend to view:",
-            ["Academic Performance", "Mood & Well-being", "Financial Overview", "Study Hours"],
+            _TREND_OPTIONS,
             help="View different aspects of your student life over time"
         )
         
         if trend_option == "Academic Performance":
-            performance_data = academic.get_performance_history()
+            performance_data = _performance_data(academic)
             if performance_data:
-                fig = create_trend_chart(
-                    data=performance_data,
-                    x_key="semester",
-                    y_key="cgpa",
-                    title="CGPA Trend",
-                    color="#1f77b4"
-                )
+                fig = _trend_fig(_points(performance_data, "semester", "cgpa"), "semester", "cgpa",
+                                 "CGPA Trend", "#1f77b4")
                 st.plotly_chart(fig, use_container_width=True)
                 
                 # Add trend analysis
@@ -2750,33 +2995,17 @@ def show_dashboard():
                 st.info("No academic performance data available yet.")
                 
                 # Show a sample chart to demonstrate the feature
-                sample_data = [
-                    {"semester": "Sem 1", "cgpa": 7.8, "semester_index": 1},
-                    {"semester": "Sem 2", "cgpa": 8.1, "semester_index": 2},
-                    {"semester": "Sem 3", "cgpa": 8.4, "semester_index": 3}
-                ]
-                
-                fig = create_trend_chart(
-                    data=sample_data,
-                    x_key="semester",
-                    y_key="cgpa",
-                    title="Sample CGPA Trend (What you'll see)",
-                    color="#1f77b4"
-                )
+                fig = _trend_fig(_points(_SAMPLE_CGPA, "semester", "cgpa"), "semester", "cgpa",
+                                 "Sample CGPA Trend (What you'll see)", "#1f77b4")
                 st.plotly_chart(fig, use_container_width=True)
                 
                 st.markdown("**Add your semester results in the Academic Tracker to see your performance trend!**")
         
         elif trend_option == "Mood & Well-being":
-            mood_data = wellness.get_mood_history()
+            mood_data = _mood_history(wellness)
             if mood_data:
-                fig = create_trend_chart(
-                    data=mood_data,
-                    x_key="date",
-                    y_key="score",
-                    title="Mood Trend",
-                    color="#ff7f0e"
-                )
+                fig = _trend_fig(_points(mood_data, "date", "score"), "date", "score",
+                                 "Mood Trend", "#ff7f0e")
                 st.plotly_chart(fig, use_container_width=True)
                 
                 # Add mood analysis
@@ -2794,70 +3023,34 @@ def show_dashboard():
                 st.info("No mood data available yet. Start tracking in the Mental Wellness section.")
                 
                 # Sample data
-                dates = [(datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(7, 0, -1)]
-                sample_data = [
-                    {"date": dates[0], "score": 6},
-                    {"date": dates[1], "score": 7},
-                    {"date": dates[2], "score": 5},
-                    {"date": dates[3], "score": 6},
-                    {"date": dates[4], "score": 8},
-                    {"date": dates[5], "score": 7},
-                    {"date": dates[6], "score": 9}
-                ]
-                
-                fig = create_trend_chart(
-                    data=sample_data,
-                    x_key="date",
-                    y_key="score",
-                    title="Sample Mood Trend (What you'll see)",
-                    color="#ff7f0e"
-                )
+                fig = _trend_fig(_points(_sample_mood_data(_now.date()), "date", "score"), "date", "score",
+                                 "Sample Mood Trend (What you'll see)", "#ff7f0e")
                 st.plotly_chart(fig, use_container_width=True)
         
         elif trend_option == "Financial Overview":
             expense_data = financial.get_monthly_expenses()
             if expense_data:
-                fig = create_pie_chart(
-                    data=expense_data,
-                    labels_key="category",
-                    values_key="amount",
-                    title="Monthly Expenses"
-                )
+                fig = _pie_fig(_points(expense_data, "category", "amount"), "category", "amount",
+                               "Monthly Expenses")
                 st.plotly_chart(fig, use_container_width=True)
                 
                 # Add financial insights
-                largest_category = max(expense_data, key=lambda x: x['amount'])
+                amounts = np.fromiter((e['amount'] for e in expense_data), float, count=len(expense_data))
+                largest_category = expense_data[int(np.argmax(amounts))]
                 st.info(f"💡 Your largest expense category is {largest_category['category']} (₹{largest_category['amount']:,.2f}).")
             else:
                 st.info("No expense data available yet. Add your expenses in the Financial Planner section.")
                 
                 # Sample data for visualization
-                sample_expenses = [
-                    {"category": "Food", "amount": 4000},
-                    {"category": "Transportation", "amount": 1200},
-                    {"category": "Books & Supplies", "amount": 2500},
-                    {"category": "Entertainment", "amount": 800},
-                    {"category": "Other", "amount": 1500}
-                ]
-                
-                fig = create_pie_chart(
-                    data=sample_expenses,
-                    labels_key="category",
-                    values_key="amount",
-                    title="Sample Expense Breakdown (What you'll see)"
-                )
+                fig = _pie_fig(_points(_SAMPLE_EXPENSES, "category", "amount"), "category", "amount",
+                               "Sample Expense Breakdown (What you'll see)")
                 st.plotly_chart(fig, use_container_width=True)
         
         elif trend_option == "Study Hours":
-            study_data = academic.get_study_hours_history()
+            study_data = _study_data(academic)
             if study_data:
-                fig = create_trend_chart(
-                    data=study_data,
-                    x_key="date",
-                    y_key="hours",
-                    title="Study Hours",
-                    color="#2ca02c"
-                )
+                fig = _trend_fig(_points(study_data, "date", "hours"), "date", "hours",
+                                 "Study Hours", "#2ca02c")
                 st.plotly_chart(fig, use_container_width=True)
                 
                 # Add study pattern insights
@@ -2875,26 +3068,8 @@ def show_dashboard():
                 st.info("No study tracking data available yet. Track your study hours in the Academic Tracker section.")
                 
                 # Sample data
-                dates = [(datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(7, 0, -1)]
-                sample_data = [
-                    {"date": dates[0], "hours": 2.5, "subject": "Math"},
-                    {"date": dates[1], "hours": 3.0, "subject": "Physics"},
-                    {"date": dates[2], "hours": 1.5, "subject": "English"},
-                    {"date": dates[3], "hours": 4.0, "subject": "CS"},
-                    {"date": dates[4], "hours": 2.0, "subject": "History"},
-                    {"date": dates[5], "hours": 3.5, "subject": "CS"},
-                    {"date": dates[6], "hours": 2.0, "subject": "Math"}
-                ]
-                
-                df = pd.DataFrame(sample_data)
-                fig = px.bar(
-                    df,
-                    x="date",
-                    y="hours",
-                    color="subject",
-                    title="Sample Study Hours (What you'll see)",
-                    labels={"hours": "Hours", "date": "Date"}
-                )
+                fig = _study_bar_fig(_points(_sample_study_data(_now.date()), "date", "hours", "subject"),
+                                     "Sample Study Hours (What you'll see)")
                 st.plotly_chart(fig, use_container_width=True)
     
     with col2:
@@ -2903,1375 +3078,1696 @@ def show_dashboard():
         # Get trending education news from cache or AI
         education_news = fetch_trending_news("education")
         
-        for news in education_news:
-            st.markdown(f"""
-            <div class="news-card">
-                <h4>{news['title']}</h4>
-                <p>{news['date']} • {news['source']}</p>
-            </div>
-            """, unsafe_allow_html=True)
+        news_html = "\n".join(_NEWS_CARD_TEMPLATE.format_map(news) for news in education_news)
+        st.markdown(news_html, unsafe_allow_html=True)
         
 
     st.markdown("## Personalized Recommendations")
 
     # Get personalized recommendations with error handling
     try:
-        recommendations = st.session_state.prediction_engine.get_personalized_recommendations()
+        recommendations = _cached_recommendations()
     except Exception as e:
         print(f"Error getting recommendations: {e}")
         recommendations = []
 
     # Show recommendations with better styling
-        if recommendations:
-            for rec in recommendations:
-                if rec.get("priority") == "high":
-                    st.markdown(f"""
-                    <div style="background-color: #ffebee; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #d32f2f;">
-                        <strong style="color: #c62828;">❗ {rec.get('title')}</strong><br>
-                        <span style="color: #333333;">{rec.get('description')}</span>
-                    </div>
-                    """, unsafe_allow_html=True)
-                elif rec.get("priority") == "medium":
-                    st.markdown(f"""
-                    <div style="background-color: #fff3e0; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #ff9800;">
-                        <strong style="color: #e65100;">⚠️ {rec.get('title')}</strong><br>
-                        <span style="color: #333333;">{rec.get('description')}</span>
-                    </div>
-                    """, unsafe_allow_html=True)
-                else:
-                    st.markdown(f"""
-                    <div style="background-color: #e8f5e9; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #4caf50;">
-                        <strong style="color: #2e7d32;">💡 {rec.get('title')}</strong><br>
-                        <span style="color: #333333;">{rec.get('description')}</span>
-                    </div>
-                    """, unsafe_allow_html=True)
-        else:
-            st.info("No personalized recommendations available at this time.")
+    if recommendations:
+        low_template = _RECOMMENDATION_TEMPLATES["low"]
+        recommendations_html = "\n".join(
+            _RECOMMENDATION_TEMPLATES.get(rec.get("priority"), low_template).format(
+                title=rec.get('title'), description=rec.get('description')
+            )
+            for rec in recommendations
+        )
+        st.markdown(recommendations_html, unsafe_allow_html=True)
+    else:
+        st.info("No personalized recommendations available at this time.")
 
+    
+    # Show a top opportunity
+    opportunities = _opportunities(student)
+    if opportunities:
+        st.markdown("### Top Opportunity for You")
+        top_opportunity = opportunities[0]
         
-        # Show a top opportunity
-        if opportunities:
-            st.markdown("### Top Opportunity for You")
-            top_opportunity = opportunities[0]
-            
-            st.markdown(f"""
-            <div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; margin-top: 15px; border: 1px solid #bbdefb;">
-                <h4 style="margin-top: 0;">{top_opportunity['title']}</h4>
-                <p><strong>Organization:</strong> {top_opportunity['organization']}</p>
-                <p><strong>Deadline:</strong> {top_opportunity['deadline']}</p>
-                <p>{top_opportunity['description']}</p>
-                <p><em>Why this matters to you:</em> {top_opportunity['relevance']}</p>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(f"""
+        <div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; margin-top: 15px; border: 1px solid #bbdefb;">
+            <h4 style="margin-top: 0;">{top_opportunity['title']}</h4>
+            <p><strong>Organization:</strong> {top_opportunity['organization']}</p>
+            <p><strong>Deadline:</strong> {top_opportunity['deadline']}</p>
+            <p>{top_opportunity['description']}</p>
+            <p><em>Why this matters to you:</em> {top_opportunity['relevance']}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Get more AI-driven career insights if available
+        if st.session_state.cached_content.get("career_insights"):
+            st.markdown("### AI Career Insights")
+            insights = st.session_state.cached_content["career_insights"]
             
-            # Get more AI-driven career insights if available
-            if st.session_state.cached_content.get("career_insights"):
-                st.markdown("### AI Career Insights")
-                insights = st.session_state.cached_content["career_insights"]
-                
-                for insight in insights[:1]:  # Show just the top insight
-                    st.markdown(f"""
-                    <div style="background-color: #f0f4c3; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #cddc39;">
-                        <h4 style="margin-top: 0;">{insight.get('insight', 'Career Insight')}</h4>
-                        <p><strong>Trend:</strong> {insight.get('trend', '')}</p>
-                        <p><strong>Recommended Action:</strong> {insight.get('action', '')}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+            for insight in insights[:1]:  # Show just the top insight
+                st.markdown(f"""
+                <div style="background-color: #f0f4c3; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #cddc39;">
+                    <h4 style="margin-top: 0;">{insight.get('insight', 'Career Insight')}</h4>
+                    <p><strong>Trend:</strong> {insight.get('trend', '')}</p>
+                    <p><strong>Recommended Action:</strong> {insight.get('action', '')}</p>
+                </div>
+                """, unsafe_allow_html=True)
 
-# Academic Tracker section with improved UI
-def show_academics_page():
-    st.title("Academic Tracker")
+# Upcoming course task cards, indexed by urgency level (overdue, due today, due soon, later)
+_COURSE_TASK_TEMPLATES = (
+    '<div style="background-color: #ffebee; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #d32f2f;">'
+    '<strong>⚠️ OVERDUE:</strong> {title} - {course_code} ({days} days ago)</div>',
+    '<div style="background-color: #fff3e0; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #ff9800;">'
+    '<strong>⏰ DUE TODAY:</strong> {title} - {course_code}</div>',
+    '<div style="background-color: #e3f2fd; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #2196f3;">'
+    '<strong>🔜 DUE SOON:</strong> {title} - {course_code} ({days} days left)</div>',
+    '<div style="background-color: #f5f5f5; padding: 10px; border-radius: 5px; margin-bottom: 10px;">'
+    '<strong>📝 {title}</strong> - {course_code} ({days} days left)</div>',
+)
+
+def _study_totals(study_df):
+    """Total study hours and (subject, hours) pairs sorted by hours, from factorized subject codes"""
+    hours = study_df['hours'].to_numpy(dtype=float)
+    if 'subject' not in study_df.columns:
+        return hours.sum(), []
     
-    # Show guidance for first-time visitors
-    show_section_guidance("Academics")
+    codes, names = pd.factorize(study_df['subject'])
+    known = codes >= 0  # factorize marks missing subjects with -1
+    per_subject = np.bincount(codes[known], weights=hours[known], minlength=len(names))
+    order = np.argsort(-per_subject, kind='stable')
+    return hours.sum(), [(names[i], per_subject[i]) for i in order]
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _gpa_trend_fig(rows, title, legend_on_top=False):
+    """SGPA/CGPA line chart memoized on its (semester, sgpa, cgpa) rows"""
+    import plotly.express as px
+    from utils.visualization import WEBGL_MIN_POINTS
     
-    academic = st.session_state.academic_tracker
+    df = pd.DataFrame(rows, columns=['semester', 'sgpa', 'cgpa'])
+    fig = px.line(
+        df, 
+        x='semester', 
+        y=['sgpa', 'cgpa'],
+        title=title,
+        labels={'value': 'GPA', 'semester': 'Semester', 'variable': 'Metric'},
+        markers=True,
+        template="plotly_white",
+        render_mode="svg" if len(rows) < WEBGL_MIN_POINTS else "webgl"
+    )
+    if legend_on_top:
+        fig.update_layout(legend=dict(
+            title=None,
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="center",
+            x=0.5
+        ))
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _study_bar_fig(rows, title, tilt_dates=False):
+    """Study hours bar chart memoized on its (date, hours[, subject]) rows"""
+    import plotly.express as px
     
-    # Create tabs for different academic features
-    tab1, tab2, tab3, tab4 = st.tabs(["Courses", "Performance", "Study Tracker", "Academic Chatbot"])
+    if rows and len(rows[0]) == 3:
+        df = pd.DataFrame(rows, columns=["date", "hours", "subject"])
+        fig = px.bar(
+            df,
+            x="date",
+            y="hours",
+            color="subject",
+            title=title,
+            labels={"hours": "Hours", "date": "Date", "subject": "Subject"}
+        )
+    else:
+        df = pd.DataFrame(rows, columns=["date", "hours"])
+        fig = px.bar(
+            df,
+            x="date",
+            y="hours",
+            title=title,
+            labels={"hours": "Hours", "date": "Date"}
+        )
     
-    # Courses tab
-    with tab1:
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            st.subheader("Current Courses")
-            courses = academic.get_courses(current_only=True)
-            
-            if courses:
-                for course in courses:
-                    with st.expander(f"{course['code']}: {course['title']}"):
-                        st.write(f"**Credits:** {course['credits']}")
-                        st.write(f"**Faculty:** {course['faculty']}")
-                        st.write(f"**Schedule:** {course['schedule']}")
-                        
-                        # Show course performance
-                        course_performance = academic.get_course_performance(course['code'])
-                        if course_performance:
-                            st.write("**Performance:**")
-                            for assessment in course_performance:
-                                st.write(f"- {assessment['title']}: {assessment['score']}/{assessment['max_score']} ({assessment['percentage']}%)")
-                
-                # Show upcoming tasks for courses
-                st.subheader("Upcoming Course Tasks")
-                upcoming_tasks = academic.get_upcoming_tasks(limit=5)
-                
-                if upcoming_tasks:
-                    task_df = pd.DataFrame(upcoming_tasks)
-                    task_df['days_left'] = task_df['due_date'].apply(lambda x: (datetime.fromisoformat(x) - datetime.now()).days if x else None)
+    if tilt_dates:
+        fig.update_layout(xaxis_tickangle=-45)
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _subject_pie_fig(slices):
+    """Study time by subject donut chart memoized on its (subject, hours) slices"""
+    import plotly.express as px
+    
+    subject_df = pd.DataFrame(slices, columns=['Subject', 'Hours'])
+    return px.pie(
+        subject_df,
+        values='Hours',
+        names='Subject',
+        title='Study Time by Subject',
+        hole=0.4
+    )
+
+def _session_fig(name, rows, build, refresh):
+    """Figure kept in session state; later reruns patch its traces via refresh(fig, rows)"""
+    cached = st.session_state.get(name)
+    if cached is not None and cached[0] == rows:
+        return cached[1]
+    if cached is not None and refresh(cached[1], rows):
+        fig = cached[1]
+    else:
+        fig = build(rows)
+    st.session_state[name] = (rows, fig)
+    return fig
+
+def _refresh_gpa_fig(fig, rows):
+    """Swap new (semester, sgpa, cgpa) rows into the SGPA and CGPA traces"""
+    if len(fig.data) != 2 or not rows:
+        return False
+    semesters, sgpa, cgpa = zip(*rows)
+    with fig.batch_update():
+        fig.data[0].x, fig.data[0].y = semesters, sgpa
+        fig.data[1].x, fig.data[1].y = semesters, cgpa
+    return True
+
+def _refresh_study_fig(fig, rows):
+    """Swap new study rows into the existing bars; rebuild when the subject set changes"""
+    if not rows:
+        return False
+    if len(rows[0]) == 2:
+        if len(fig.data) != 1:
+            return False
+        dates, hours = zip(*rows)
+        fig.data[0].x, fig.data[0].y = dates, hours
+        return True
+    
+    by_subject = {}
+    for date, hours, subject in rows:
+        points = by_subject.setdefault(subject, ([], []))
+        points[0].append(date)
+        points[1].append(hours)
+    if {trace.name for trace in fig.data} != set(by_subject):
+        return False
+    with fig.batch_update():
+        for trace in fig.data:
+            trace.x, trace.y = by_subject[trace.name]
+    return True
+
+@_fragment
+def _academics_courses_tab(academic):
+    """Courses tab: current courses, upcoming course tasks and the add-course form"""
+    # Taken inside the fragment so a tab-only rerun still sees the current time
+    _now = datetime.now()
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.subheader("Current Courses")
+        courses = _current_courses(academic)
+        
+        if courses:
+            for course in courses:
+                with st.expander(f"{course['code']}: {course['title']}"):
+                    st.write(f"**Credits:** {course['credits']}")
+                    st.write(f"**Faculty:** {course['faculty']}")
+                    st.write(f"**Schedule:** {course['schedule']}")
                     
-                    for _, task in task_df.sort_values('days_left').iterrows():
-                        days_left = task['days_left']
-                        if days_left is not None:
-                            if days_left < 0:
-                                st.markdown(f"""
-                                <div style="background-color: #ffebee; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #d32f2f;">
-                                    <strong>⚠️ OVERDUE:</strong> {task['title']} - {task['course_code']} ({abs(days_left)} days ago)
-                                </div>
-                                """, unsafe_allow_html=True)
-                            elif days_left == 0:
-                                st.markdown(f"""
-                                <div style="background-color: #fff3e0; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #ff9800;">
-                                    <strong>⏰ DUE TODAY:</strong> {task['title']} - {task['course_code']}
-                                </div>
-                                """, unsafe_allow_html=True)
-                            elif days_left <= 3:
-                                st.markdown(f"""
-                                <div style="background-color: #e3f2fd; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #2196f3;">
-                                    <strong>🔜 DUE SOON:</strong> {task['title']} - {task['course_code']} ({days_left} days left)
-                                </div>
-                                """, unsafe_allow_html=True)
-                            else:
-                                st.markdown(f"""
-                                <div style="background-color: #f5f5f5; padding: 10px; border-radius: 5px; margin-bottom: 10px;">
-                                    <strong>📝 {task['title']}</strong> - {task['course_code']} ({days_left} days left)
-                                </div>
-                                """, unsafe_allow_html=True)
-                else:
-                    st.info("No upcoming tasks for your courses. Add tasks using the Task form in the Dashboard.")
+                    # Show course performance
+                    course_performance = academic.get_course_performance(course['code'])
+                    if course_performance:
+                        st.write("**Performance:**")
+                        for assessment in course_performance:
+                            st.write(f"- {assessment['title']}: {assessment['score']}/{assessment['max_score']} ({assessment['percentage']}%)")
+            
+            # Show upcoming tasks for courses
+            st.subheader("Upcoming Course Tasks")
+            upcoming_tasks = academic.get_upcoming_tasks(limit=5)
+            
+            if upcoming_tasks:
+                task_df = pd.DataFrame(upcoming_tasks)
+                due = pd.to_datetime(task_df['due_date'], errors='coerce')
+                task_df['days_left'] = (due - pd.Timestamp(_now)).dt.days
+                task_df = task_df.sort_values('days_left')
+                
+                # Classify urgency in one vectorized pass: overdue, due today, due soon, later
+                task_df = task_df[task_df['days_left'].notna()]
+                days = task_df['days_left'].to_numpy()
+                urgency = np.select([days < 0, days == 0, days <= 3], [0, 1, 2], default=3)
+                
+                cards = [
+                    _COURSE_TASK_TEMPLATES[level].format(
+                        title=task.title, course_code=task.course_code, days=abs(int(task.days_left))
+                    )
+                    for task, level in zip(task_df.itertuples(index=False), urgency)
+                ]
+                st.markdown("\n".join(cards), unsafe_allow_html=True)
             else:
-                # Empty state with better UI
-                st.markdown("""
-                <div style="background-color: #f9f9f9; border: 1px dashed #ddd; border-radius: 8px; padding: 30px; text-align: center; margin-bottom: 20px;">
-                    <h3 style="color: #666; margin-bottom: 15px;">No courses added yet</h3>
-                    <p style="color: #888;">Add your first course using the form on the right to track your academic progress.</p>
-                </div>
-                """, unsafe_allow_html=True)
+                st.info("No upcoming tasks for your courses. Add tasks using the Task form in the Dashboard.")
+        else:
+            # Empty state with better UI
+            st.markdown("""
+            <div style="background-color: #f9f9f9; border: 1px dashed #ddd; border-radius: 8px; padding: 30px; text-align: center; margin-bottom: 20px;">
+                <h3 style="color: #666; margin-bottom: 15px;">No courses added yet</h3>
+                <p style="color: #888;">Add your first course using the form on the right to track your academic progress.</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    with col2:
+        st.subheader("Add New Course")
         
-        with col2:
-            st.subheader("Add New Course")
-            
-            with st.form("add_course_form"):
-                course_code = st.text_input("Course Code*", placeholder="e.g., CS101")
-                course_title = st.text_input("Course Title*", placeholder="e.g., Introduction to Computer Science")
-                credits = st.number_input("Credits", min_value=1, max_value=10, value=4)
-                faculty = st.text_input("Faculty Name", placeholder="e.g., Dr. Sharma")
-                schedule = st.text_input("Schedule", placeholder="e.g., Mon, Wed 10:00-11:30")
-                is_current = st.checkbox("Current Course", value=True)
-                semester = st.selectbox("Semester", ["Monsoon 2025", "Winter 2025", "Summer 2025", "Custom"])
-                
-                if semester == "Custom":
-                    semester = st.text_input("Enter Semester Name")
-                
-                st.markdown('<div style="text-align: center;">', unsafe_allow_html=True)
-                submitted = st.form_submit_button("Add Course")
-                st.markdown('</div>', unsafe_allow_html=True)
-                
-                if submitted:
-                    if course_code and course_title:
-                        new_course = {
-                            "code": course_code,
-                            "title": course_title,
-                            "credits": credits,
-                            "faculty": faculty,
-                            "schedule": schedule,
-                            "is_current": is_current,
-                            "semester": semester
-                        }
-                        if academic.add_course(new_course):
-                            st.success("Course added successfully!")
-                            time.sleep(1)
-                            st.rerun()
-                        else:
-                            st.error("Failed to add course.")
-                    else:
-                        st.error("Please fill in all required fields marked with *")
+        with st.form("add_course_form"):
+            course_code = st.text_input("Course Code*", placeholder="e.g., CS101")
+            course_title = st.text_input("Course Title*", placeholder="e.g., Introduction to Computer Science")
+            credits = st.number_input("Credits", min_value=1, max_value=10, value=4)
+            faculty = st.text_input("Faculty Name", placeholder="e.g., Dr. Sharma")
+            schedule = st.text_input("Schedule", placeholder="e.g., Mon, Wed 10:00-11:30")
+            is_current = st.checkbox("Current Course", value=True)
+            semester = st.selectbox("Semester", ["Monsoon 2025", "Winter 2025", "Summer 2025", "Custom"])
             
-            # Course resources - use AI-generated trends if available 
-            st.markdown("### Latest Academic Trends")
+            if semester == "Custom":
+                semester = st.text_input("Enter Semester Name")
             
-            academic_trends = None
-            if st.session_state.cached_content.get("academic_trends"):
-                academic_trends = st.session_state.cached_content["academic_trends"]
+            st.markdown('<div style="text-align: center;">', unsafe_allow_html=True)
+            submitted = st.form_submit_button("Add Course")
+            st.markdown('</div>', unsafe_allow_html=True)
             
-            if academic_trends:
-                for trend in academic_trends:
-                    st.markdown(f"""
-                    <div class="trend-card">
-                        <h4>{trend.get('trend', 'Academic Trend')}</h4>
-                        <p><strong>Description:</strong> {trend.get('description', '')}</p>
-                        <p><strong>Benefit:</strong> {trend.get('benefit', '')}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-            else:
-                # Fallback if no AI-generated content
-                st.markdown("""
-                <div style="background-color: #e8f5e9; padding: 15px; border-radius: 8px; margin-top: 15px;">
-                    <h4 style="margin-top: 0;">Latest Education Trends</h4>
-                    <ul style="margin-bottom: 0;">
-                        <li><strong>Project-Based Learning</strong> becoming standard in engineering courses</li>
-                        <li><strong>Digital Lab Journals</strong> being adopted by science departments</li>
-                        <li><strong>Peer-to-Peer Teaching</strong> shown to improve comprehension by 32%</li>
-                    </ul>
-                </div>
-                """, unsafe_allow_html=True)
-    
-    # Performance tab
-    with tab2:
-        st.subheader("Academic Performance")
+            if submitted:
+                if course_code and course_title:
+                    new_course = {
+                        "code": course_code,
+                        "title": course_title,
+                        "credits": credits,
+                        "faculty": faculty,
+                        "schedule": schedule,
+                        "is_current": is_current,
+                        "semester": semester
+                    }
+                    if academic.add_course(new_course):
+                        st.toast("Course added successfully!", icon="✅")
+                        st.rerun()
+                    else:
+                        st.error("Failed to add course.")
+                else:
+                    st.error("Please fill in all required fields marked with *")
         
-        col1, col2 = st.columns([3, 1])
+        # Course resources - use AI-generated trends if available 
+        st.markdown("### Latest Academic Trends")
         
-        with col1:
-            # Display performance history
-            performance_history = academic.get_performance_history()
-            
-            if performance_history:
-                current_cgpa = academic.get_current_cgpa()
-                st.metric("Current CGPA", f"{current_cgpa:.2f}/10.0")
-                
-                # Create DataFrame for display
-                df = pd.DataFrame(performance_history)
-                df = df.sort_values('semester_index', ascending=False)
-                
-                # Display summary table
-                summary_df = df[['semester', 'cgpa', 'sgpa']].copy()
-                summary_df.columns = ['Semester', 'CGPA', 'SGPA']
-                st.table(summary_df)
-                
-                # Plot performance trend
-                fig = px.line(
-                    df.sort_values('semester_index'), 
-                    x='semester', 
-                    y=['sgpa', 'cgpa'],
-                    title='Academic Performance Trend',
-                    labels={'value': 'GPA', 'semester': 'Semester', 'variable': 'Metric'},
-                    markers=True,
-                    template="plotly_white"
-                )
-                fig.update_layout(legend=dict(
-                    title=None,
-                    orientation="h",
-                    yanchor="bottom",
-                    y=1.02,
-                    xanchor="center",
-                    x=0.5
-                ))
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # Personalized insights based on performance
-                if len(performance_history) >= 2:
-                    latest_sgpa = performance_history[-1].get('sgpa', 0)
-                    previous_sgpa = performance_history[-2].get('sgpa', 0)
-                    
-                    if latest_sgpa > previous_sgpa:
-                        st.success(f"🌟 **Great improvement!** Your SGPA increased from {previous_sgpa:.2f} to {latest_sgpa:.2f}. Keep up the good work!")
-                    elif latest_sgpa < previous_sgpa:
-                        st.warning(f"📉 Your SGPA decreased from {previous_sgpa:.2f} to {latest_sgpa:.2f}. Consider scheduling a meeting with your academic advisor.")
-                
-                # Academic standing and advice
-                degree = st.session_state.student_profile.get_degree()
-                year = st.session_state.student_profile.get_year_of_study()
-                
-                if "B.Tech" in degree or "B.E." in degree:
-                    if current_cgpa < 7.0:
-                        st.warning("⚠️ Engineering programs typically require a minimum CGPA of 7.0 for many campus placements.")
-                    elif current_cgpa >= 8.5:
-                        st.success("✅ Your CGPA qualifies you for most premium campus placements and higher studies applications!")
-                
-                if "1st Year" in year:
-                    st.info("💡 **First Year Tip:** Building a strong foundation now will make advanced courses easier later.")
-                elif "Final Year" in year:
-                    st.info("💡 **Final Year Tip:** Focus on maintaining your CGPA while balancing placement preparation.")
-            else:
-                # Better empty state with guidance
-                st.markdown("""
-                <div style="background-color: #f9f9f9; border: 1px dashed #ddd; border-radius: 8px; padding: 30px; text-align: center; margin-bottom: 20px;">
-                    <h3 style="color: #666; margin-bottom: 15px;">No academic performance data yet</h3>
-                    <p style="color: #888;">Add your semester results to visualize your academic progress.</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Sample data visualization to show what they'll get
-                st.subheader("What You'll See After Adding Data:")
-                
-                # Create sample data
-                sample_data = [
-                    {"semester": "Semester 1", "sgpa": 8.1, "cgpa": 8.1, "semester_index": 1},
-                    {"semester": "Semester 2", "sgpa": 8.3, "cgpa": 8.2, "semester_index": 2},
-                    {"semester": "Semester 3", "sgpa": 7.9, "cgpa": 8.1, "semester_index": 3},
-                    {"semester": "Semester 4", "sgpa": 8.5, "cgpa": 8.2, "semester_index": 4}
-                ]
-                
-                # Plot sample performance trend
-                df = pd.DataFrame(sample_data)
-                fig = px.line(
-                    df, 
-                    x='semester', 
-                    y=['sgpa', 'cgpa'],
-                    title='Sample Academic Performance Trend',
-                    labels={'value': 'GPA', 'semester': 'Semester', 'variable': 'Metric'},
-                    markers=True,
-                    template="plotly_white"
+        academic_trends = None
+        if st.session_state.cached_content.get("academic_trends"):
+            academic_trends = st.session_state.cached_content["academic_trends"]
+        
+        if academic_trends:
+            trends_html = "\n".join(
+                _TREND_CARD_TEMPLATE.format(
+                    trend=trend.get('trend', 'Academic Trend'),
+                    description=trend.get('description', ''),
+                    benefit=trend.get('benefit', '')
                 )
-                st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            st.subheader("Add Semester Result")
-            
-            with st.form("add_semester_form"):
-                semester_name = st.selectbox(
-                    "Semester*", 
-                    ["Monsoon 2025", "Winter 2025", "Summer 2025", "Custom"],
-                    key="semester_select"
-                )
-                
-                if semester_name == "Custom":
-                    semester_name = st.text_input("Enter Semester Name")
-                
-                semester_index = st.number_input("Semester Number", min_value=1, max_value=12, value=1, 
-                                               help="1 for first semester, 2 for second, etc.")
-                
-                sgpa = st.number_input("SGPA", min_value=0.0, max_value=10.0, value=8.0, step=0.1, 
-                                     help="Semester Grade Point Average (out of 10)")
-                
-                total_credits = st.number_input("Credits Earned", min_value=1, max_value=30, value=20, 
-                                              help="Total credits earned this semester")
-                
-                st.markdown('<div style="text-align: center;">', unsafe_allow_html=True)
-                submitted = st.form_submit_button("Add Semester")
-                st.markdown('</div>', unsafe_allow_html=True)
-                
-                if submitted:
-                    if semester_name:
-                        new_semester = {
-                            "semester": semester_name,
-                            "semester_index": semester_index,
-                            "sgpa": sgpa,
-                            "credits": total_credits,
-                            "date_added": datetime.now().isoformat()
-                        }
-                        if academic.add_semester_performance(new_semester):
-                            st.success("Semester result added successfully!")
-                            time.sleep(1)
-                            st.rerun()
-                        else:
-                            st.error("Failed to add semester result.")
-                    else:
-                        st.error("Please fill in all required fields.")
-            
-            # Academic tips based on standard
-            st.markdown("### Academic Standards")
+                for trend in academic_trends
+            )
+            st.markdown(trends_html, unsafe_allow_html=True)
+        else:
+            # Fallback if no AI-generated content
             st.markdown("""
-            <div style="background-color: #f5f5f5; padding: 15px; border-radius: 8px; margin-top: 15px;">
-                <h4 style="margin-top: 0;">CGPA Interpretation</h4>
+            <div style="background-color: #e8f5e9; padding: 15px; border-radius: 8px; margin-top: 15px;">
+                <h4 style="margin-top: 0;">Latest Education Trends</h4>
                 <ul style="margin-bottom: 0;">
-                    <li><strong>9.0-10.0:</strong> Outstanding (First Class with Distinction)</li>
-                    <li><strong>8.0-8.9:</strong> Excellent (First Class)</li>
-                    <li><strong>7.0-7.9:</strong> Very Good (First Class)</li>
-                    <li><strong>6.0-6.9:</strong> Good (Second Class)</li>
-                    <li><strong>5.0-5.9:</strong> Average (Pass Class)</li>
-                    <li><strong>Below 5.0:</strong> Needs Improvement</li>
+                    <li><strong>Project-Based Learning</strong> becoming standard in engineering courses</li>
+                    <li><strong>Digital Lab Journals</strong> being adopted by science departments</li>
+                    <li><strong>Peer-to-Peer Teaching</strong> shown to improve comprehension by 32%</li>
                 </ul>
             </div>
             """, unsafe_allow_html=True)
+
+@_fragment
+def _academics_performance_tab(academic):
+    """Performance tab: CGPA history and semester results"""
+    _now = datetime.now()
     
-    # Study Tracker tab
-    with tab3:
-        st.subheader("Study Hours Tracker")
-        
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            study_data = academic.get_study_hours_history()
+    st.subheader("Academic Performance")
+    
+    col1, col2 = st.columns([3, 1])
+    
+    with col1:
+        # Display performance history
+        performance_history = _performance_data(academic)
+        
+        if performance_history:
+            current_cgpa = academic.get_current_cgpa()
+            st.metric("Current CGPA", f"{current_cgpa:.2f}/10.0")
+            
+            # Create DataFrame for display
+            df = pd.DataFrame(performance_history)
+            df = df.sort_values('semester_index', ascending=False)
+            
+            # Display summary table
+            summary_df = df[['semester', 'cgpa', 'sgpa']].copy()
+            summary_df.columns = ['Semester', 'CGPA', 'SGPA']
+            summary_df = summary_df.astype({'CGPA': 'float32', 'SGPA': 'float32'})
+            st.dataframe(summary_df, hide_index=True, use_container_width=True)
+            
+            # Plot performance trend
+            rows = tuple(df.sort_values('semester_index')[['semester', 'sgpa', 'cgpa']].itertuples(index=False, name=None))
+            fig = _session_fig('performance_trend_fig', rows,
+                               lambda rows: _gpa_trend_fig(rows, 'Academic Performance Trend', legend_on_top=True),
+                               _refresh_gpa_fig)
+            st.plotly_chart(fig, use_container_width=True)
+            
+            # Personalized insights based on performance
+            if len(performance_history) >= 2:
+                latest_sgpa = performance_history[-1].get('sgpa', 0)
+                previous_sgpa = performance_history[-2].get('sgpa', 0)
+                
+                if latest_sgpa > previous_sgpa:
+                    st.success(f"🌟 **Great improvement!** Your SGPA increased from {previous_sgpa:.2f} to {latest_sgpa:.2f}. Keep up the good work!")
+                elif latest_sgpa < previous_sgpa:
+                    st.warning(f"📉 Your SGPA decreased from {previous_sgpa:.2f} to {latest_sgpa:.2f}. Consider scheduling a meeting with your academic advisor.")
+            
+            # Academic standing and advice
+            degree = st.session_state.student_profile.get_degree()
+            year = st.session_state.student_profile.get_year_of_study()
             
-            if study_data:
-                # Calculate statistics
-                total_hours = sum(entry['hours'] for entry in study_data)
-                avg_daily = total_hours / len(study_data)
-                
-                # Create metrics with more visual appeal
-                col1, col2, col3 = st.columns(3)
-                
-                col1.markdown(f"""
-                <div style="background-color: #e8f5e9; padding: 15px; border-radius: 8px; text-align: center;">
-                    <h2 style="margin: 0; color: #2e7d32;">{total_hours:.1f}</h2>
-                    <p style="margin: 0; color: #2e7d32;">Total Study Hours</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                col2.markdown(f"""
-                <div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; text-align: center;">
-                    <h2 style="margin: 0; color: #1565c0;">{avg_daily:.1f}</h2>
-                    <p style="margin: 0; color: #1565c0;">Avg. Daily Hours</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                col3.markdown(f"""
-                <div style="background-color: #fff3e0; padding: 15px; border-radius: 8px; text-align: center;">
-                    <h2 style="margin: 0; color: #e65100;">{len(study_data)}</h2>
-                    <p style="margin: 0; color: #e65100;">Study Sessions</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Bar chart of recent study sessions
-                df = pd.DataFrame(sorted(study_data, key=lambda x: x.get('date', ''))[-10:])
-                
-                if not df.empty:
-                    if 'subject' in df.columns:
-                        fig = px.bar(
-                            df,
-                            x="date",
-                            y="hours",
-                            color="subject",
-                            title="Recent Study Sessions",
-                            labels={"hours": "Hours", "date": "Date", "subject": "Subject"}
-                        )
-                    else:
-                        fig = px.bar(
-                            df,
-                            x="date",
-                            y="hours",
-                            title="Recent Study Sessions",
-                            labels={"hours": "Hours", "date": "Date"}
-                        )
-                    
-                    fig.update_layout(xaxis_tickangle=-45)
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                # Subject breakdown if available
-                subjects = {}
-                for entry in study_data:
-                    if 'subject' in entry:
-                        subject = entry['subject']
-                        if subject not in subjects:
-                            subjects[subject] = 0
-                        subjects[subject] += entry['hours']
-                
-                if subjects:
-                    st.subheader("Subject Breakdown")
-                    
-                    # Sort subjects by hours
-                    sorted_subjects = sorted(subjects.items(), key=lambda x: x[1], reverse=True)
-                    
-                    subject_df = pd.DataFrame(sorted_subjects, columns=['Subject', 'Hours'])
-                    fig = px.pie(
-                        subject_df,
-                        values='Hours',
-                        names='Subject',
-                        title='Study Time by Subject',
-                        hole=0.4
-                    )
-                    st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Study recommendations based on subject distribution
-                    least_studied = sorted_subjects[-1][0]
-                    most_studied = sorted_subjects[0][0]
-                    
-                    st.info(f"💡 You're spending most time on **{most_studied}**. Consider balancing with more focus on **{least_studied}** which has received less attention.")
-            else:
-                st.info("No study tracking data available yet. Track your study hours using the form on the right.")
-                
-                # Sample data
-                dates = [(datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(7, 0, -1)]
-                sample_data = [
-                    {"date": dates[0], "hours": 2.5, "subject": "Math"},
-                    {"date": dates[1], "hours": 3.0, "subject": "Physics"},
-                    {"date": dates[2], "hours": 1.5, "subject": "English"},
-                    {"date": dates[3], "hours": 4.0, "subject": "CS"},
-                    {"date": dates[4], "hours": 2.0, "subject": "History"},
-                    {"date": dates[5], "hours": 3.5, "subject": "CS"},
-                    {"date": dates[6], "hours": 2.0, "subject": "Math"}
-                ]
-                
-                df = pd.DataFrame(sample_data)
-                fig = px.bar(
-                    df,
-                    x="date",
-                    y="hours",
-                    color="subject",
-                    title="Sample Study Hours (What you'll see)",
-                    labels={"hours": "Hours", "date": "Date"}
-                )
-                st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            st.subheader("Log Study Session")
+            if "B.Tech" in degree or "B.E." in degree:
+                if current_cgpa < 7.0:
+                    st.warning("⚠️ Engineering programs typically require a minimum CGPA of 7.0 for many campus placements.")
+                elif current_cgpa >= 8.5:
+                    st.success("✅ Your CGPA qualifies you for most premium campus placements and higher studies applications!")
+            
+            if "1st Year" in year:
+                st.info("💡 **First Year Tip:** Building a strong foundation now will make advanced courses easier later.")
+            elif "Final Year" in year:
+                st.info("💡 **Final Year Tip:** Focus on maintaining your CGPA while balancing placement preparation.")
+        else:
+            # Better empty state with guidance
+            st.markdown("""
+            <div style="background-color: #f9f9f9; border: 1px dashed #ddd; border-radius: 8px; padding: 30px; text-align: center; margin-bottom: 20px;">
+                <h3 style="color: #666; margin-bottom: 15px;">No academic performance data yet</h3>
+                <p style="color: #888;">Add your semester results to visualize your academic progress.</p>
+            </div>
+            """, unsafe_allow_html=True)
             
-            with st.form("log_study_form"):
-                date = st.date_input("Date", value=datetime.now())
-                hours = st.number_input("Hours", min_value=0.5, max_value=12.0, value=2.0, step=0.5)
-                
-                # Get subjects from courses
-                courses = academic.get_courses(current_only=True)
-                subject_options = ["Other"]
-                
-                if courses:
-                    for course in courses:
-                        subject_options.append(course["title"])
-                
-                subject = st.selectbox("Subject", options=subject_options)
-                
-                if subject == "Other":
-                    subject = st.text_input("Enter Subject Name")
-                
-                notes = st.text_area("Study Notes (Optional)", placeholder="What did you study? Any challenges?", max_chars=200)
-                
-                submitted = st.form_submit_button("Log Study Session")
-                
-                if submitted:
-                    if hours > 0 and subject:
-                        new_session = {
-                            "date": date.isoformat(),
-                            "hours": hours,
-                            "subject": subject,
-                            "notes": notes
-                        }
-                        
-                        if academic.log_study_hours(new_session):
-                            st.success("Study session logged successfully!")
-                            time.sleep(1)
-                            st.rerun()
-                        else:
-                            st.error("Failed to log study session.")
-                    else:
-                        st.error("Please enter valid study hours and subject.")
+            # Sample data visualization to show what they'll get
+            st.subheader("What You'll See After Adding Data:")
             
-            # Study tips from AI 
-            if st.session_state.cached_content.get("academic_trends"):
-                st.markdown("### AI Study Tips")
-                
-                trends = st.session_state.cached_content["academic_trends"]
-                for trend in trends[:1]:  # Just show the first tip
-                    st.markdown(f"""
-                    <div style="background-color: #e1f5fe; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #03a9f4;">
-                        <h4 style="margin-top: 0; color: #01579b;">Try This: {trend.get('trend', 'Study Technique')}</h4>
-                        <p><em>{trend.get('description', '')}</em></p>
-                        <p style="margin-bottom: 0;"><strong>Benefit:</strong> {trend.get('benefit', '')}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-            else:
-                st.markdown("""
-                <div style="background-color: #f5f5f5; padding: 15px; border-radius: 8px; margin-top: 15px;">
-                    <h4 style="margin-top: 0;">Effective Study Tips</h4>
-                    <ul style="margin-bottom: 0;">
-                        <li><strong>Active recall</strong> is more effective than passive rereading</li>
-                        <li><strong>Spaced repetition</strong> enhances long-term retention</li>
-                        <li><strong>Pomodoro Technique</strong> (25 min work, 5 min break) maintains focus</li>
-                    </ul>
-                </div>
-                """, unsafe_allow_html=True)
+            # Plot sample performance trend
+            fig = _gpa_trend_fig(_points(_SAMPLE_PERFORMANCE, 'semester', 'sgpa', 'cgpa'), 'Sample Academic Performance Trend')
+            st.plotly_chart(fig, use_container_width=True)
     
-    # Academic Chatbot tab
-    with tab4:
-        st.subheader("Academic Assistant")
+    with col2:
+        st.subheader("Add Semester Result")
         
-        if st.session_state.groq_api_key is None:
-            st.warning("Please configure your Groq API key in Settings to use the Academic Assistant.")
-            if st.button("Go to Settings"):
-                st.session_state.current_page = "Settings"
-                st.rerun()
-        else:
-            st.write("Ask anything about your studies, courses, or academic strategies.")
+        with st.form("add_semester_form"):
+            semester_name = st.selectbox(
+                "Semester*", 
+                ["Monsoon 2025", "Winter 2025", "Summer 2025", "Custom"],
+                key="semester_select"
+            )
             
-            # Initialize academic chat history if it doesn't exist
-            if 'academic_chat_history' not in st.session_state:
-                st.session_state.academic_chat_history = []
+            if semester_name == "Custom":
+                semester_name = st.text_input("Enter Semester Name")
             
-            # Display academic chat history
-            if st.session_state.academic_chat_history:
-                st.markdown('<div style="background-color: #f8f9fa; padding: 15px; border-radius: 8px; margin-bottom: 20px; max-height: 400px; overflow-y: auto;">', unsafe_allow_html=True)
-                
-                for i, (role, message) in enumerate(st.session_state.academic_chat_history):
-                    if role == "user":
-                        st.markdown(f'<div style="background-color: #e7f5fe; padding: 10px; border-radius: 15px 15px 5px 15px; margin-bottom: 10px; margin-left: 20px;"><strong>You:</strong> {message}</div>', unsafe_allow_html=True)
-                    else:
-                        st.markdown(f'<div style="background-color: #f0f0f0; padding: 10px; border-radius: 15px 15px 15px 5px; margin-bottom: 10px;"><strong>Academic Assistant:</strong> {message}</div>', unsafe_allow_html=True)
-                
-                st.markdown('</div>', unsafe_allow_html=True)
+            semester_index = st.number_input("Semester Number", min_value=1, max_value=12, value=1, 
+                                           help="1 for first semester, 2 for second, etc.")
             
-            # Input for academic question
-            academic_query = st.text_input("Ask about your courses, study techniques, or academic concerns", key="academic_query")
+            sgpa = st.number_input("SGPA", min_value=0.0, max_value=10.0, value=8.0, step=0.1, 
+                                 help="Semester Grade Point Average (out of 10)")
             
-            if st.button("Get Academic Advice", key="get_academic_advice"):
-                if academic_query:
-                    # Add user message to academic chat history
-                    st.session_state.academic_chat_history.append(("user", academic_query))
-                    
-                    # Context from academics
-                    courses = academic.get_courses(current_only=True)
-                    course_names = [f"{c['code']}: {c['title']}" for c in courses]
-                    course_context = ", ".join(course_names) if course_names else "No courses added yet"
-                    
-                    # Prepare student context for more personalized answers
-                    student_context = None
-                    if st.session_state.student_profile:
-                        profile = st.session_state.student_profile
-                        student_context = {
-                            "degree": profile.get_degree(),
-                            "year": profile.get_year_of_study(),
-                            "college": profile.get_college_name(),
-                            "courses": course_context
-                        }
-                    
-                    # Get AI response for academics specifically
-                    with st.spinner("Researching your question..."):
-                        ai_response = st.session_state.ai_advisor.get_advice(
-                            academic_query, "academic", student_context
-                        )
-                    
-                    # Add AI response to academic chat history
-                    st.session_state.academic_chat_history.append(("ai", ai_response))
-                    
-                    # Force a rerun to show the updated chat
-                    st.rerun()
+            total_credits = st.number_input("Credits Earned", min_value=1, max_value=30, value=20, 
+                                          help="Total credits earned this semester")
+            
+            st.markdown('<div style="text-align: center;">', unsafe_allow_html=True)
+            submitted = st.form_submit_button("Add Semester")
+            st.markdown('</div>', unsafe_allow_html=True)
+            
+            if submitted:
+                if semester_name:
+                    new_semester = {
+                        "semester": semester_name,
+                        "semester_index": semester_index,
+                        "sgpa": sgpa,
+                        "credits": total_credits,
+                        "date_added": _now.isoformat()
+                    }
+                    if academic.add_semester_performance(new_semester):
+                        st.toast("Semester result added successfully!", icon="✅")
+                        st.rerun()
+                    else:
+                        st.error("Failed to add semester result.")
+                else:
+                    st.error("Please fill in all required fields.")
+        
+        # Academic tips based on standard
+        st.markdown("### Academic Standards")
+        st.markdown("""
+        <div style="background-color: #f5f5f5; padding: 15px; border-radius: 8px; margin-top: 15px;">
+            <h4 style="margin-top: 0;">CGPA Interpretation</h4>
+            <ul style="margin-bottom: 0;">
+                <li><strong>9.0-10.0:</strong> Outstanding (First Class with Distinction)</li>
+                <li><strong>8.0-8.9:</strong> Excellent (First Class)</li>
+                <li><strong>7.0-7.9:</strong> Very Good (First Class)</li>
+                <li><strong>6.0-6.9:</strong> Good (Second Class)</li>
+                <li><strong>5.0-5.9:</strong> Average (Pass Class)</li>
+                <li><strong>Below 5.0:</strong> Needs Improvement</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
 
-# Financial Planner page
-def show_finance_page():
-    st.title("Financial Planner")
-    
-    # Show guidance for first-time visitors
-    show_section_guidance("Finance")
+@_fragment
+def _academics_study_tab(academic):
+    """Study Tracker tab: study hour charts and the study log form"""
+    _now = datetime.now()
     
-    financial = st.session_state.financial_planner
+    st.subheader("Study Hours Tracker")
     
-    # Create tabs for different finance features
-    tab1, tab2, tab3, tab4 = st.tabs(["Transactions", "Budget", "Scholarships", "Financial Advisor"])
+    col1, col2 = st.columns([3, 1])
     
-    # Transactions tab
-    with tab1:
-        col1, col2 = st.columns([2, 1])
+    with col1:
+        study_data = _study_data(academic)
         
-        with col1:
-            st.subheader("Recent Transactions")
+        if study_data:
+            # One DataFrame feeds the statistics, the recent sessions chart and the subject breakdown
+            study_df = pd.DataFrame(study_data)
             
-            transactions = financial.get_all_transactions()
+            # Calculate statistics (total and per-subject hours in one vectorized pass)
+            total_hours, sorted_subjects = _study_totals(study_df)
+            avg_daily = total_hours / len(study_df)
             
-            if transactions:
-                # Financial summary metrics
-                income = sum([t['amount'] for t in transactions if t['amount'] > 0])
-                expenses = abs(sum([t['amount'] for t in transactions if t['amount'] < 0]))
-                balance = income - expenses
-                
-                col1, col2, col3 = st.columns(3)
-                
-                col1.metric(
-                    "Income",
-                    f"₹{income:,.2f}",
-                    delta=None
-                )
-                
-                col2.metric(
-                    "Expenses",
-                    f"₹{expenses:,.2f}",
-                    delta=None
-                )
-                
-                col3.metric(
-                    "Balance", 
-                    f"₹{balance:,.2f}",
-                    delta=None,
-                    delta_color="normal"
-                )
-                
-                # Transaction list with better formatting
-                st.write("### Transaction History")
+            # Create metrics with more visual appeal
+            col1, col2, col3 = st.columns(3)
+            
+            col1.markdown(f"""
+            <div style="background-color: #e8f5e9; padding: 15px; border-radius: 8px; text-align: center;">
+                <h2 style="margin: 0; color: #2e7d32;">{total_hours:.1f}</h2>
+                <p style="margin: 0; color: #2e7d32;">Total Study Hours</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            col2.markdown(f"""
+            <div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; text-align: center;">
+                <h2 style="margin: 0; color: #1565c0;">{avg_daily:.1f}</h2>
+                <p style="margin: 0; color: #1565c0;">Avg. Daily Hours</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            col3.markdown(f"""
+            <div style="background-color: #fff3e0; padding: 15px; border-radius: 8px; text-align: center;">
+                <h2 style="margin: 0; color: #e65100;">{len(study_data)}</h2>
+                <p style="margin: 0; color: #e65100;">Study Sessions</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Bar chart of recent study sessions
+            has_subject = 'subject' in study_df.columns
+            chart_columns = ["date", "hours", "subject"] if has_subject else ["date", "hours"]
+            recent_df = study_df.tail(10)  # history is already in date order
+            rows = tuple(recent_df[chart_columns].itertuples(index=False, name=None))
+            fig = _session_fig('recent_study_fig', rows,
+                               lambda rows: _study_bar_fig(rows, "Recent Study Sessions", tilt_dates=True),
+                               _refresh_study_fig)
+            st.plotly_chart(fig, use_container_width=True)
+            
+            # Subject breakdown if available, sorted by hours
+            if sorted_subjects:
+                st.subheader("Subject Breakdown")
+                
+                fig = _subject_pie_fig(tuple(sorted_subjects))
+                st.plotly_chart(fig, use_container_width=True)
                 
-                # Sort transactions by date (most recent first)
-                sorted_transactions = sorted(transactions, key=lambda x: x.get('date', ''), reverse=True)
+                # Study recommendations based on subject distribution
+                least_studied = sorted_subjects[-1][0]
+                most_studied = sorted_subjects[0][0]
                 
-                for transaction in sorted_transactions[:10]:  # Show only the 10 most recent
-                    amount = transaction['amount']
-                    is_expense = amount < 0
+                st.info(f"💡 You're spending most time on **{most_studied}**. Consider balancing with more focus on **{least_studied}** which has received less attention.")
+        else:
+            st.info("No study tracking data available yet. Track your study hours using the form on the right.")
+            
+            # Sample data
+            fig = _study_bar_fig(_points(_sample_study_data(_now.date()), "date", "hours", "subject"), "Sample Study Hours (What you'll see)")
+            st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        st.subheader("Log Study Session")
+        
+        with st.form("log_study_form"):
+            date = st.date_input("Date", value=_now.date())
+            hours = st.number_input("Hours", min_value=0.5, max_value=12.0, value=2.0, step=0.5)
+            
+            # Get subjects from courses
+            courses = _current_courses(academic)
+            subject_options = ["Other"]
+            
+            if courses:
+                for course in courses:
+                    subject_options.append(course["title"])
+            
+            subject = st.selectbox("Subject", options=subject_options)
+            
+            if subject == "Other":
+                subject = st.text_input("Enter Subject Name")
+            
+            notes = st.text_area("Study Notes (Optional)", placeholder="What did you study? Any challenges?", max_chars=200)
+            
+            submitted = st.form_submit_button("Log Study Session")
+            
+            if submitted:
+                if hours > 0 and subject:
+                    new_session = {
+                        "date": date.isoformat(),
+                        "hours": hours,
+                        "subject": subject,
+                        "notes": notes
+                    }
                     
-                    if is_expense:
-                        st.markdown(f"""
-                        <div style="background-color: #ffebee; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #ef5350; display: flex; justify-content: space-between;">
-                            <div>
-                                <strong>{transaction['description']}</strong><br>
-                                <small>{transaction.get('date', 'N/A')} | {transaction.get('category', 'Uncategorized')}</small>
-                            </div>
-                            <div style="color: #d32f2f; font-weight: bold; align-self: center;">
-                                - ₹{abs(amount):,.2f}
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
+                    if academic.add_study_session(new_session):
+                        st.toast("Study session logged successfully!", icon="✅")
+                        st.rerun()
                     else:
-                        st.markdown(f"""
-                        <div style="background-color: #e8f5e9; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 5px solid #66bb6a; display: flex; justify-content: space-between;">
-                            <div>
-                                <strong>{transaction['description']}</strong><br>
-                                <small>{transaction.get('date', 'N/A')} | {transaction.get('category', 'Uncategorized')}</small>
-                            </div>
-                            <div style="color: #2e7d32; font-weight: bold; align-self: center;">
-                                + ₹{amount:,.2f}
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                
-                if len(sorted_transactions) > 10:
-                    st.info(f"Showing 10 of {len(sorted_transactions)} transactions. View more by downloading your transaction history.")
-                    
-                    if st.button("Download Complete Transaction History"):
-                        # Create a DataFrame for download
-                        df = pd.DataFrame(sorted_transactions)
-                        
-                        # Convert to CSV for download
-                        csv = df.to_csv(index=False)
-                        
-                        # Create a download button
-                        st.download_button(
-                            label="Download CSV",
-                            data=csv,
-                            file_name="my_transactions.csv",
-                            mime="text/csv"
-                        )
-            else:
-                # Empty state with sample visualization
-                st.markdown("""
-                <div style="background-color: #f9f9f9; border: 1px dashed #ddd; border-radius: 8px; padding: 30px; text-align: center; margin-bottom: 20px;">
-                    <h3 style="color: #666; margin-bottom: 15px;">No transactions added yet</h3>
-                    <p style="color: #888;">Add your first transaction using the form on the right to start tracking your finances.</p>
+                        st.error("Failed to log study session.")
+                else:
+                    st.error("Please enter valid study hours and subject.")
+        
+        # Study tips from AI 
+        if st.session_state.cached_content.get("academic_trends"):
+            st.markdown("### AI Study Tips")
+            
+            trends = st.session_state.cached_content["academic_trends"]
+            for trend in trends[:1]:  # Just show the first tip
+                st.markdown(f"""
+                <div style="background-color: #e1f5fe; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #03a9f4;">
+                    <h4 style="margin-top: 0; color: #01579b;">Try This: {trend.get('trend', 'Study Technique')}</h4>
+                    <p><em>{trend.get('description', '')}</em></p>
+                    <p style="margin-bottom: 0;"><strong>Benefit:</strong> {trend.get('benefit', '')}</p>
                 </div>
                 """, unsafe_allow_html=True)
-                
-                # Sample expense breakdown
-                st.subheader("Sample Expense Breakdown (What you'll see)")
-                
-                sample_expenses = [
-                    {"category": "Food", "amount": 4000},
-                    {"category": "Transportation", "amount": 1200},
-                    {"category": "Books & Supplies", "amount": 2500},
-                    {"category": "Entertainment", "amount": 800},
-                    {"category": "Other", "amount": 1500}
-                ]
-                
-                fig = create_pie_chart(
-                    data=sample_expenses,
-                    labels_key="category",
-                    values_key="amount",
-                    title="Sample Monthly Expenses"
-                )
-                st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.markdown("""
+            <div style="background-color: #f5f5f5; padding: 15px; border-radius: 8px; margin-top: 15px;">
+                <h4 style="margin-top: 0;">Effective Study Tips</h4>
+                <ul style="margin-bottom: 0;">
+                    <li><strong>Active recall</strong> is more effective than passive rereading</li>
+                    <li><strong>Spaced repetition</strong> enhances long-term retention</li>
+                    <li><strong>Pomodoro Technique</strong> (25 min work, 5 min break) maintains focus</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+
+@_fragment
+def _academics_chatbot_tab(academic):
+    """Academic Chatbot tab"""
+    st.subheader("Academic Assistant")
+    
+    if st.session_state.groq_api_key is None:
+        st.warning("Please configure your Groq API key in Settings to use the Academic Assistant.")
+        if st.button("Go to Settings"):
+            st.session_state.current_page = "Settings"
+            st.rerun()
+    else:
+        st.write("Ask anything about your studies, courses, or academic strategies.")
         
-        with col2:
-            st.subheader("Add Transaction")
-            
-            with st.form("add_transaction_form"):
-                transaction_type = st.radio("Transaction Type", ["Expense", "Income"])
-                amount = st.number_input("Amount (₹)", min_value=0.0, step=100.0, value=0.0)
-                description = st.text_input("Description", placeholder="e.g., Lunch, Books, Allowance")
-                
-                # Different category options based on type
-                if transaction_type == "Expense":
-                    categories = [
-                        "Food & Dining", "Transportation", "Books & Supplies", 
-                        "Rent & Utilities", "Entertainment", "Personal Care",
-                        "Mobile & Internet", "Clothing", "Miscellaneous"
-                    ]
-                else:
-                    categories = [
-                        "Pocket Money", "Salary/Stipend", "Scholarship", 
-                        "Investment Returns", "Gifts", "Other Income"
-                    ]
+        # Chat history sits above the input but is filled in after a new question is answered,
+        # so the exchange shows up on this run without forcing another one
+        history_area = st.container()
+        
+        # Input for academic question
+        academic_query = st.text_input("Ask about your courses, study techniques, or academic concerns", key="academic_query")
+        
+        if st.button("Get Academic Advice", key="get_academic_advice"):
+            if academic_query:
+                # Add user message to academic chat history
+                st.session_state.academic_chat_history.append(("user", academic_query))
                 
-                category = st.selectbox("Category", categories)
-                date = st.date_input("Date", value=datetime.now())
+                # Context from academics
+                courses = _current_courses(academic)
+                course_names = [f"{c['code']}: {c['title']}" for c in courses]
+                course_context = ", ".join(course_names) if course_names else "No courses added yet"
                 
-                st.markdown('<div style="text-align: center;">', unsafe_allow_html=True)
-                submitted = st.form_submit_button("Add Transaction")
-                st.markdown('</div>', unsafe_allow_html=True)
+                # Prepare student context for more personalized answers
+                student_context = _student_context(courses=course_context)
                 
-                if submitted:
-                    if amount > 0 and description:
-                        # Adjust amount sign based on transaction type
-                        final_amount = amount if transaction_type == "Income" else -amount
-                        
-                        new_transaction = {
-                            "amount": final_amount,
-                            "description": description,
-                            "category": category,
-                            "date": date.isoformat(),
-                            "type": transaction_type.lower()
-                        }
-                        
-                        if financial.add_transaction(new_transaction):
-                            st.success(f"{transaction_type} added successfully!")
-                            time.sleep(1)
-                            st.rerun()
-                        else:
-                            st.error(f"Failed to add {transaction_type.lower()}.")
-                    else:
-                        st.error("Please enter a valid amount and description.")
-            
-            # Financial tips from AI
-            if st.session_state.cached_content.get("financial_tips"):
-                st.markdown("### Financial Tips")
+                # Get AI response for academics specifically
+                with st.spinner("Researching your question..."):
+                    ai_response = st.session_state.ai_advisor.get_advice(
+                        academic_query, "academic", student_context
+                    )
                 
-                tips = st.session_state.cached_content["financial_tips"]
-                for tip in tips[:1]:  # Just show the first tip
-                    st.markdown(f"""
-                    <div style="background-color: #e8f5e9; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #4caf50;">
-                        <h4 style="margin-top: 0; color: #2e7d32;">{tip.get('tip', 'Financial Tip')}</h4>
-                        <p>{tip.get('description', '')}</p>
-                        <p style="margin-bottom: 0;"><strong>Action:</strong> {tip.get('action_item', '')}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-            else:
-                # Fallback financial tips
-                st.markdown("""
-                <div style="background-color: #f5f5f5; padding: 15px; border-radius: 8px; margin-top: 15px;">
-                    <h4 style="margin-top: 0;">Student Finance Tips</h4>
-                    <ul style="margin-bottom: 0;">
-                        <li><strong>Track all expenses</strong>, even small ones - they add up quickly</li>
-                        <li><strong>Look for student discounts</strong> on software, transportation, and food</li>
-                        <li><strong>Set up automatic savings</strong>, even if it's just ₹500 per month</li>
-                    </ul>
-                </div>
-                """, unsafe_allow_html=True)
+                # Add AI response to academic chat history
+                st.session_state.academic_chat_history.append(("ai", ai_response))
+        
+        with history_area:
+            _render_chat_history(st.session_state.academic_chat_history, "Academic Assistant")
+
+# Academic Tracker section with improved UI
+def show_academics_page():
+    st.title("Academic Tracker")
+    
+    # Show guidance for first-time visitors
+    show_section_guidance("Academics")
+    
+    academic = st.session_state.academic_tracker
+    
+    # Create tabs for different academic features
+    tab1, tab2, tab3, tab4 = st.tabs(["Courses", "Performance", "Study Tracker", "Academic Chatbot"])
+    
+    # Each tab is its own fragment so a widget interaction only reruns that tab
+    with tab1:
+        _academics_courses_tab(academic)
     
-    # Budget tab
     with tab2:
-        st.subheader("Budget Management")
+        _academics_performance_tab(academic)
+    
+    with tab3:
+        _academics_study_tab(academic)
+    
+    with tab4:
+        _academics_chatbot_tab(academic)
+
+# One-click budget templates on the Budget tab; copied before saving so the planner never holds these dicts
+_HOME_BUDGET_TEMPLATE = {
+    "Food & Dining": 3000,
+    "Transportation": 2000,
+    "Books & Supplies": 2500,
+    "Rent & Utilities": 0,
+    "Entertainment": 1500,
+    "Personal Care": 1000,
+    "Mobile & Internet": 800,
+    "Clothing": 1000,
+    "Miscellaneous": 1200
+}
+_HOSTEL_BUDGET_TEMPLATE = {
+    "Food & Dining": 4500,
+    "Transportation": 1500,
+    "Books & Supplies": 2500,
+    "Rent & Utilities": 7000,
+    "Entertainment": 1200,
+    "Personal Care": 800,
+    "Mobile & Internet": 800,
+    "Clothing": 800,
+    "Miscellaneous": 1000
+}
+
+# Scholarships listed on the Scholarships tab, by the degrees they apply to
+_ENGINEERING_SCHOLARSHIPS = (
+    {
+        "name": "AICTE Pragati Scholarship for Girls",
+        "provider": "AICTE",
+        "amount": "₹50,000 per annum",
+        "eligibility": "Girl students in AICTE approved Technical Institutions",
+        "deadline": "May 15, 2025", 
+        "website": "https://www.aicte-pragati-saksham-gov.in/"
+    },
+    {
+        "name": "Inspire Scholarship for Engineering Students",
+        "provider": "Department of Science & Technology",
+        "amount": "₹80,000 per annum",
+        "eligibility": "Top 1% in class 12 board exams",
+        "deadline": "June 30, 2025",
+        "website": "https://www.inspire-dst.gov.in/scholarship.html"
+    }
+)
+_BUSINESS_SCHOLARSHIPS = (
+    {
+        "name": "Future Business Leaders Scholarship",
+        "provider": "CII (Confederation of Indian Industry)",
+        "amount": "₹60,000 per annum",
+        "eligibility": "Commerce and Business students with academic excellence",
+        "deadline": "July 31, 2025",
+        "website": "https://www.cii.in/Scholarships.aspx"
+    },
+)
+_GENERAL_SCHOLARSHIPS = (
+    {
+        "name": "National Scholarship Portal Schemes",
+        "provider": "Government of India",
+        "amount": "Varies by scheme",
+        "eligibility": "Based on merit, category, and income criteria",
+        "deadline": "Variable by scheme",
+        "website": "https://scholarships.gov.in/"
+    },
+    {
+        "name": "Tata Trusts Scholarships",
+        "provider": "Tata Trusts",
+        "amount": "Up to ₹2,00,000 per annum",
+        "eligibility": "Merit-cum-means basis for undergraduate and postgraduate students",
+        "deadline": "April 30, 2025",
+        "website": "https://www.tatatrusts.org/our-work/education/scholarships"
+    },
+    {
+        "name": "Keep India Smiling Scholarship",
+        "provider": "Colgate-Palmolive",
+        "amount": "Up to ₹30,000 per annum",
+        "eligibility": "Students from families with annual income less than ₹5 lakhs",
+        "deadline": "June 15, 2025",
+        "website": "https://www.colgate.com/en-in/smile-karo-aur-shuru-ho-jao/keep-india-smiling"
+    }
+)
+
+# Finance page styles, sent once per page so transaction and budget rows only carry class names
+_FINANCE_CSS = """<style>
+.txn {padding: 10px; border-radius: 5px; margin-bottom: 10px; display: flex; justify-content: space-between;}
+.txn.income {background-color: #e8f5e9; border-left: 5px solid #66bb6a; color: #333333;}
+.txn.expense {background-color: #ffebee; border-left: 5px solid #ef5350;}
+.txn-amount {font-weight: bold; align-self: center;}
+.txn.income .txn-amount {color: #2e7d32;}
+.txn.expense .txn-amount {color: #d32f2f;}
+.budget-row {margin-bottom: 15px;}
+.budget-head, .budget-foot {display: flex; justify-content: space-between;}
+.budget-head {margin-bottom: 5px;}
+.budget-foot {margin-top: 5px; font-size: 0.8rem;}
+.budget-track {background-color: #f0f0f0; border-radius: 5px; height: 10px; width: 100%;}
+.budget-fill {border-radius: 5px; height: 10px;}
+</style>"""
+
+# Transaction history rows, indexed by is_expense
+_TRANSACTION_ROW_TEMPLATES = (
+    '<div class="txn income"><div><strong>{description}</strong><br><small>{date} | {category}</small></div>'
+    '<div class="txn-amount">+ ₹{abs_amount:,.2f}</div></div>',
+    '<div class="txn expense"><div><strong>{description}</strong><br><small>{date} | {category}</small></div>'
+    '<div class="txn-amount">- ₹{abs_amount:,.2f}</div></div>',
+)
+
+# (minimum percentage used, bar colour, text colour): red when over budget, orange when close, else green
+_BUDGET_BAR_COLORS = (
+    (100, "#f44336", "#d32f2f"),
+    (80, "#ff9800", "#e65100"),
+    (0, "#4caf50", "#2e7d32"),
+)
+_BUDGET_BAR_TEMPLATE = (
+    '<div class="budget-row">'
+    '<div class="budget-head"><div><strong>{category}</strong></div>'
+    '<div style="color: {text_color};">₹{spent:,.2f} / ₹{budgeted:,.2f}</div></div>'
+    '<div class="budget-track"><div class="budget-fill" style="background-color: {bar_color}; width: {width}%;"></div></div>'
+    '<div class="budget-foot"><div style="color: {text_color};">{percentage:.1f}% used</div>'
+    '<div>₹{remaining:,.2f} remaining</div></div></div>'
+)
+
+def _budget_bar_colors(percentage):
+    """(bar colour, text colour) for a budget category at the given percentage used"""
+    for floor, bar_color, text_color in _BUDGET_BAR_COLORS:
+        if percentage >= floor:
+            return bar_color, text_color
+    return _BUDGET_BAR_COLORS[-1][1:]
+
+def _scholarship_search_text(scholarship):
+    """Lower-cased name, provider and eligibility, one per line so a query cannot match across fields"""
+    return "\n".join((scholarship["name"], scholarship["provider"], scholarship["eligibility"])).lower()
+
+_SCHOLARSHIP_CARD_TEMPLATE = (
+    '<div style="background-color: white; padding: 15px; border-radius: 8px; margin-bottom: 15px; box-shadow: 0 2px 5px rgba(0,0,0,0.1);">'
+    '<h4 style="margin-top: 0; color: #0a3d62;">{name}</h4>'
+    '<div style="display: flex; justify-content: space-between; margin-bottom: 10px;">'
+    '<div><strong>Provider:</strong> {provider}</div><div><strong>Amount:</strong> {amount}</div></div>'
+    '<p><strong>Eligibility:</strong> {eligibility}</p>'
+    '<div style="display: flex; justify-content: space-between; align-items: center;">'
+    '<div><strong>Deadline:</strong> {deadline}</div>'
+    '<a href="{website}" target="_blank" style="background-color: #0a3d62; color: white; padding: 5px 15px; border-radius: 20px; text-decoration: none; font-size: 0.9rem;">Visit Website</a>'
+    '</div></div>'
+)
+_SCHOLARSHIP_TIPS_MARKDOWN = """
+### Scholarship Application Tips
+
+<div style="background-color: #e8f5e9; padding: 15px; border-radius: 8px;">
+    <h4 style="margin-top: 0; color: #2e7d32;">Maximize Your Chances</h4>
+    <ul>
+        <li><strong>Apply early</strong> - Many scholarships have limited funds</li>
+        <li><strong>Prepare documents</strong> - Keep income certificates, mark sheets, and ID proofs ready</li>
+        <li><strong>Quality essays</strong> - Spend time on personal statements and essays</li>
+        <li><strong>Multiple applications</strong> - Apply to several scholarships to increase your chances</li>
+    </ul>
+</div>
+
+### Need Help with Applications?
+
+<div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px;">
+    <h4 style="margin-top: 0; color: #0d47a1;">Resources Available</h4>
+    <ul>
+        <li>Contact your <strong>college financial aid office</strong> for guidance</li>
+        <li>Join the <strong>Scholarship Discussion Forum</strong> on your college portal</li>
+        <li>Use the <strong>Financial Advisor</strong> tab to get personalized scholarship advice</li>
+    </ul>
+</div>
+"""
+
+def _find_scholarship_news():
+    """First finance headline that mentions scholarships, or None"""
+    return next((news for news in fetch_trending_news("finance")
+                 if "scholarship" in news.get("title", "").lower()), None)
+
+def _scholarship_news():
+    """Scholarship headline, rescanned only when the cached finance news is replaced"""
+    finance_news = st.session_state.cached_content.get("finance_news")
+    # The news list itself is the version: the entry holds it, so a replacement can't reuse its id()
+    return _versioned('scholarship_news_cache', finance_news, _find_scholarship_news)
+
+# One encoded CSV per distinct history across all sessions, so keep only the recent ones
+@st.cache_data(show_spinner=False, max_entries=32)
+def _transactions_csv(transactions):
+    """Transaction history as CSV, most recent first, memoized on the transactions"""
+    ordered = sorted(transactions, key=lambda x: x.get('date', ''), reverse=True)
+    return pd.DataFrame(ordered).to_csv(index=False).encode()
+
+@_fragment
+def _finance_transactions_tab(financial):
+    """Transactions tab: summary metrics, recent history and the add-transaction form"""
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.subheader("Recent Transactions")
         
-        col1, col2 = st.columns([2, 1])
+        transactions = financial.get_all_transactions()
         
-        with col1:
-            budget = financial.get_budget()
-            expenses_by_category = financial.get_expenses_by_category()
-            
-            if budget:
-                # Display budget vs actual expenses
-                budget_data = []
-                
-                for category, budgeted in budget.items():
-                    spent = expenses_by_category.get(category, 0)
-                    percentage = (spent / budgeted * 100) if budgeted > 0 else 0
-                    remaining = budgeted - spent
-                    status = "Over" if percentage > 100 else "On Track"
+        if transactions:
+            # Financial summary metrics
+            income = expenses = 0.0
+            for t in transactions:
+                amount = t['amount']
+                if amount > 0:
+                    income += amount
+                else:
+                    expenses -= amount
+            balance = income - expenses
+            
+            col1, col2, col3 = st.columns(3)
+            
+            col1.metric(
+                "Income",
+                f"₹{income:,.2f}",
+                delta=None
+            )
+            
+            col2.metric(
+                "Expenses",
+                f"₹{expenses:,.2f}",
+                delta=None
+            )
+            
+            col3.metric(
+                "Balance", 
+                f"₹{balance:,.2f}",
+                delta=None,
+                delta_color="normal"
+            )
+            
+            # Transaction list with better formatting
+            st.write("### Transaction History")
+            
+            # Pick the 10 most recent without sorting the whole history
+            recent_transactions = heapq.nlargest(10, transactions, key=lambda x: x.get('date', ''))
+            
+            # Render them as one markdown block
+            rows = []
+            for transaction in recent_transactions:
+                amount = transaction['amount']
+                rows.append(_TRANSACTION_ROW_TEMPLATES[amount < 0].format_map({
+                    'description': transaction['description'],
+                    'date': transaction.get('date', 'N/A'),
+                    'category': transaction.get('category', 'Uncategorized'),
+                    'abs_amount': abs(amount)
+                }))
+            st.markdown("".join(rows), unsafe_allow_html=True)
+            
+            if len(transactions) > 10:
+                st.info(f"Showing 10 of {len(transactions)} transactions. View more by downloading your transaction history.")
+                
+                # Streamlit 1.27 needs the bytes up front; the session copy is only rebuilt after a save
+                csv = _versioned('transactions_csv_cache', (financial, financial.data_manager.version),
+                                 lambda: _transactions_csv(transactions))
+                st.download_button(
+                    label="Download Complete Transaction History",
+                    data=csv,
+                    file_name="my_transactions.csv",
+                    mime="text/csv"
+                )
+        else:
+            # Empty state with sample visualization
+            st.markdown("""
+            <div style="background-color: #f9f9f9; border: 1px dashed #ddd; border-radius: 8px; padding: 30px; text-align: center; margin-bottom: 20px;">
+                <h3 style="color: #666; margin-bottom: 15px;">No transactions added yet</h3>
+                <p style="color: #888;">Add your first transaction using the form on the right to start tracking your finances.</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Sample expense breakdown
+            st.subheader("Sample Expense Breakdown (What you'll see)")
+            
+            fig = _pie_fig(_points(_SAMPLE_EXPENSES, "category", "amount"), "category", "amount",
+                           "Sample Monthly Expenses")
+            st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        st.subheader("Add Transaction")
+        
+        with st.form("add_transaction_form"):
+            transaction_type = st.radio("Transaction Type", ["Expense", "Income"])
+            amount = st.number_input("Amount (₹)", min_value=0.0, step=100.0, value=0.0)
+            description = st.text_input("Description", placeholder="e.g., Lunch, Books, Allowance")
+            
+            # Different category options based on type
+            categories = _EXPENSE_CATEGORIES if transaction_type == "Expense" else _INCOME_CATEGORIES
+            category = st.selectbox("Category", categories)
+            date = st.date_input("Date", value=datetime.now().date())
+            
+            st.markdown('<div style="text-align: center;">', unsafe_allow_html=True)
+            submitted = st.form_submit_button("Add Transaction")
+            st.markdown('</div>', unsafe_allow_html=True)
+            
+            if submitted:
+                if amount > 0 and description:
+                    # Adjust amount sign based on transaction type
+                    final_amount = amount if transaction_type == "Income" else -amount
                     
-                    budget_data.append({
+                    new_transaction = {
+                        "amount": final_amount,
+                        "description": description,
                         "category": category,
-                        "budgeted": budgeted,
-                        "spent": spent,
-                        "percentage": percentage,
-                        "remaining": remaining,
-                        "status": status
-                    })
-                
-                # Sort categories by percentage spent (highest first)
-                budget_data = sorted(budget_data, key=lambda x: x['percentage'], reverse=True)
-                
-                # Display budget progress bars
-                for item in budget_data:
-                    percentage = min(item['percentage'], 100)  # Cap at 100% for the progress bar
+                        "date": date.isoformat(),
+                        "type": transaction_type.lower()
+                    }
                     
-                    # Determine color based on percentage
-                    if percentage >= 100:
-                        bar_color = "#f44336"  # Red for over budget
-                        text_color = "#d32f2f"
-                    elif percentage >= 80:
-                        bar_color = "#ff9800"  # Orange for close to budget
-                        text_color = "#e65100"
+                    if financial.add_transaction(new_transaction):
+                        st.toast(f"{transaction_type} added successfully!", icon="✅")
+                        st.rerun()
                     else:
-                        bar_color = "#4caf50"  # Green for under budget
-                        text_color = "#2e7d32"
-                    
-                    st.markdown(f"""
-                    <div style="margin-bottom: 15px;">
-                        <div style="display: flex; justify-content: space-between; margin-bottom: 5px;">
-                            <div><strong>{item['category']}</strong></div>
-                            <div style="color: {text_color};">₹{item['spent']:,.2f} / ₹{item['budgeted']:,.2f}</div>
-                        </div>
-                        <div style="background-color: #f0f0f0; border-radius: 5px; height: 10px; width: 100%;">
-                            <div style="background-color: {bar_color}; border-radius: 5px; height: 10px; width: {percentage}%;"></div>
-                        </div>
-                        <div style="display: flex; justify-content: space-between; margin-top: 5px; font-size: 0.8rem;">
-                            <div style="color: {text_color};">{item['percentage']:.1f}% used</div>
-                            <div>₹{item['remaining']:,.2f} remaining</div>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                # Budget overview
-                total_budget = sum(budget.values())
-                total_spent = sum(expenses_by_category.values())
-                overall_percentage = (total_spent / total_budget * 100) if total_budget > 0 else 0
-                
+                        st.error(f"Failed to add {transaction_type.lower()}.")
+                else:
+                    st.error("Please enter a valid amount and description.")
+        
+        # Financial tips from AI
+        if st.session_state.cached_content.get("financial_tips"):
+            st.markdown("### Financial Tips")
+            
+            tips = st.session_state.cached_content["financial_tips"]
+            for tip in tips[:1]:  # Just show the first tip
                 st.markdown(f"""
-                <div style="background-color: #f5f5f5; padding: 15px; border-radius: 8px; margin-top: 20px; margin-bottom: 20px;">
-                    <h4 style="margin-top: 0;">Budget Overview</h4>
-                    <div style="display: flex; justify-content: space-between; margin-bottom: 10px;">
-                        <div>Total Budget</div>
-                        <div>₹{total_budget:,.2f}</div>
-                    </div>
-                    <div style="display: flex; justify-content: space-between; margin-bottom: 10px;">
-                        <div>Total Spent</div>
-                        <div>₹{total_spent:,.2f}</div>
-                    </div>
-                    <div style="display: flex; justify-content: space-between; margin-bottom: 10px;">
-                        <div>Remaining</div>
-                        <div>₹{total_budget - total_spent:,.2f}</div>
-                    </div>
-                    <div style="display: flex; justify-content: space-between; font-weight: bold;">
-                        <div>Budget Utilized</div>
-                        <div>{overall_percentage:.1f}%</div>
-                    </div>
+                <div style="background-color: #e8f5e9; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #4caf50;">
+                    <h4 style="margin-top: 0; color: #2e7d32;">{tip.get('tip', 'Financial Tip')}</h4>
+                    <p>{tip.get('description', '')}</p>
+                    <p style="margin-bottom: 0;"><strong>Action:</strong> {tip.get('action_item', '')}</p>
                 </div>
                 """, unsafe_allow_html=True)
-                
-                # Tips based on budget
-                over_budget_categories = [item for item in budget_data if item['percentage'] > 100]
-                if over_budget_categories:
-                    st.warning(f"⚠️ You're over budget in {len(over_budget_categories)} categories. Consider adjusting your spending or your budget.")
-                    
-                    # Specific tips for the most exceeded category
-                    worst_category = over_budget_categories[0]['category']
-                    if worst_category == "Food & Dining":
-                        st.markdown("""
-                        <div style="background-color: #fff3e0; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #ff9800;">
-                            <h4 style="margin-top: 0;">Food Budget Tips</h4>
-                            <ul style="margin-bottom: 0;">
-                                <li>Meal prep on weekends to reduce eating out</li>
-                                <li>Look for student meal deals and discounts</li>
-                                <li>Share cooking with roommates/friends to split costs</li>
-                            </ul>
-                        </div>
-                        """, unsafe_allow_html=True)
-                    elif worst_category == "Entertainment":
-                        st.markdown("""
-                        <div style="background-color: #fff3e0; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #ff9800;">
-                            <h4 style="margin-top: 0;">Entertainment Budget Tips</h4>
-                            <ul style="margin-bottom: 0;">
-                                <li>Use student discounts at theaters and events</li>
-                                <li>Share subscription services with friends</li>
-                                <li>Look for free campus events and activities</li>
-                            </ul>
-                        </div>
-                        """, unsafe_allow_html=True)
-            else:
-                # Empty state with guidance
-                st.markdown("""
-                <div style="background-color: #f9f9f9; border: 1px dashed #ddd; border-radius: 8px; padding: 30px; text-align: center; margin-bottom: 20px;">
-                    <h3 style="color: #666; margin-bottom: 15px;">No budget set up yet</h3>
-                    <p style="color: #888;">Set up your monthly budget using the form on the right to track your spending against your targets.</p>
+        else:
+            # Fallback financial tips
+            st.markdown("""
+            <div style="background-color: #f5f5f5; padding: 15px; border-radius: 8px; margin-top: 15px;">
+                <h4 style="margin-top: 0;">Student Finance Tips</h4>
+                <ul style="margin-bottom: 0;">
+                    <li><strong>Track all expenses</strong>, even small ones - they add up quickly</li>
+                    <li><strong>Look for student discounts</strong> on software, transportation, and food</li>
+                    <li><strong>Set up automatic savings</strong>, even if it's just ₹500 per month</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+
+@_fragment
+def _finance_budget_tab(financial):
+    """Budget tab: spending against budget per category and the budget form"""
+    st.subheader("Budget Management")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        budget = financial.get_budget()
+        expenses_by_category = {e['category']: e['amount'] for e in financial.get_expenses_by_category()}
+        
+        if budget:
+            # Display budget vs actual expenses, sorted by percentage spent (highest first)
+            budget_df = pd.DataFrame({'category': list(budget), 'budgeted': list(budget.values())})
+            budget_df['spent'] = budget_df['category'].map(expenses_by_category).fillna(0)
+            budget_df['percentage'] = np.where(
+                budget_df['budgeted'] > 0, budget_df['spent'] / budget_df['budgeted'] * 100, 0
+            )
+            budget_df['remaining'] = budget_df['budgeted'] - budget_df['spent']
+            budget_df['width'] = budget_df['percentage'].clip(upper=100)  # Cap at 100% for the progress bar
+            budget_df['status'] = np.where(budget_df['percentage'] > 100, "Over", "On Track")
+            bands = [budget_df['percentage'] >= floor for floor, _, _ in _BUDGET_BAR_COLORS[:-1]]
+            _, default_bar, default_text = _BUDGET_BAR_COLORS[-1]
+            budget_df['bar_color'] = np.select(bands, [bar for _, bar, _ in _BUDGET_BAR_COLORS[:-1]], default=default_bar)
+            budget_df['text_color'] = np.select(bands, [text for _, _, text in _BUDGET_BAR_COLORS[:-1]], default=default_text)
+            budget_df = budget_df.sort_values('percentage', ascending=False, kind='stable')
+            
+            # Display budget progress bars in one markdown block
+            rows = [_BUDGET_BAR_TEMPLATE.format_map(item) for item in budget_df.to_dict('records')]
+            st.markdown("".join(rows), unsafe_allow_html=True)
+            
+            # Budget overview
+            total_budget = sum(budget.values())
+            total_spent = sum(expenses_by_category.values())
+            overall_percentage = (total_spent / total_budget * 100) if total_budget > 0 else 0
+            
+            st.markdown(f"""
+            <div style="background-color: #f5f5f5; padding: 15px; border-radius: 8px; margin-top: 20px; margin-bottom: 20px;">
+                <h4 style="margin-top: 0;">Budget Overview</h4>
+                <div style="display: flex; justify-content: space-between; margin-bottom: 10px;">
+                    <div>Total Budget</div>
+                    <div>₹{total_budget:,.2f}</div>
                 </div>
-                """, unsafe_allow_html=True)
-                
-                # Sample budget visualization
-                st.subheader("Sample Budget (What you'll see)")
-                
-                sample_budget_data = [
-                    {"category": "Food & Dining", "budgeted": 4000, "spent": 3500, "percentage": 87.5},
-                    {"category": "Transportation", "budgeted": 1500, "spent": 1200, "percentage": 80},
-                    {"category": "Books & Supplies", "budgeted": 2000, "spent": 2200, "percentage": 110},
-                    {"category": "Entertainment", "budgeted": 1000, "spent": 800, "percentage": 80},
-                ]
+                <div style="display: flex; justify-content: space-between; margin-bottom: 10px;">
+                    <div>Total Spent</div>
+                    <div>₹{total_spent:,.2f}</div>
+                </div>
+                <div style="display: flex; justify-content: space-between; margin-bottom: 10px;">
+                    <div>Remaining</div>
+                    <div>₹{total_budget - total_spent:,.2f}</div>
+                </div>
+                <div style="display: flex; justify-content: space-between; font-weight: bold;">
+                    <div>Budget Utilized</div>
+                    <div>{overall_percentage:.1f}%</div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Tips based on budget
+            over_budget_categories = budget_df.loc[budget_df['percentage'] > 100, 'category']
+            if not over_budget_categories.empty:
+                st.warning(f"⚠️ You're over budget in {len(over_budget_categories)} categories. Consider adjusting your spending or your budget.")
                 
-                for item in sample_budget_data:
-                    percentage = item['percentage']
-                    
-                    # Determine color based on percentage
-                    if percentage >= 100:
-                        bar_color = "#f44336"  # Red for over budget
-                        text_color = "#d32f2f"
-                    elif percentage >= 80:
-                        bar_color = "#ff9800"  # Orange for close to budget
-                        text_color = "#e65100"
-                    else:
-                        bar_color = "#4caf50"  # Green for under budget
-                        text_color = "#2e7d32"
-                    
-                    st.markdown(f"""
-                    <div style="margin-bottom: 15px;">
-                        <div style="display: flex; justify-content: space-between; margin-bottom: 5px;">
-                            <div><strong>{item['category']}</strong></div>
-                            <div style="color: {text_color};">₹{item['spent']:,.2f} / ₹{item['budgeted']:,.2f}</div>
-                        </div>
-                        <div style="background-color: #f0f0f0; border-radius: 5px; height: 10px; width: 100%;">
-                            <div style="background-color: {bar_color}; border-radius: 5px; height: 10px; width: {percentage}%;"></div>
-                        </div>
-                        <div style="display: flex; justify-content: space-between; margin-top: 5px; font-size: 0.8rem;">
-                            <div style="color: {text_color};">{item['percentage']:.1f}% used</div>
-                            <div>₹{item['budgeted'] - item['spent']:,.2f} remaining</div>
-                        </div>
+                # Specific tips for the most exceeded category
+                worst_category = over_budget_categories.iloc[0]
+                if worst_category == "Food & Dining":
+                    st.markdown("""
+                    <div style="background-color: #fff3e0; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #ff9800;">
+                        <h4 style="margin-top: 0;">Food Budget Tips</h4>
+                        <ul style="margin-bottom: 0;">
+                            <li>Meal prep on weekends to reduce eating out</li>
+                            <li>Look for student meal deals and discounts</li>
+                            <li>Share cooking with roommates/friends to split costs</li>
+                        </ul>
                     </div>
                     """, unsafe_allow_html=True)
-        
-        with col2:
-            st.subheader("Set Budget")
+                elif worst_category == "Entertainment":
+                    st.markdown("""
+                    <div style="background-color: #fff3e0; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #ff9800;">
+                        <h4 style="margin-top: 0;">Entertainment Budget Tips</h4>
+                        <ul style="margin-bottom: 0;">
+                            <li>Use student discounts at theaters and events</li>
+                            <li>Share subscription services with friends</li>
+                            <li>Look for free campus events and activities</li>
+                        </ul>
+                    </div>
+                    """, unsafe_allow_html=True)
+        else:
+            # Empty state with guidance
+            st.markdown("""
+            <div style="background-color: #f9f9f9; border: 1px dashed #ddd; border-radius: 8px; padding: 30px; text-align: center; margin-bottom: 20px;">
+                <h3 style="color: #666; margin-bottom: 15px;">No budget set up yet</h3>
+                <p style="color: #888;">Set up your monthly budget using the form on the right to track your spending against your targets.</p>
+            </div>
+            """, unsafe_allow_html=True)
             
-            current_budget = financial.get_budget() or {}
+            # Sample budget visualization
+            st.subheader("Sample Budget (What you'll see)")
             
-            with st.form("budget_form"):
-                st.write("Set your monthly budget for each category:")
-                
-                categories = [
-                    "Food & Dining", "Transportation", "Books & Supplies", 
-                    "Rent & Utilities", "Entertainment", "Personal Care",
-                    "Mobile & Internet", "Clothing", "Miscellaneous"
-                ]
-                
-                budget_values = {}
-                
-                for category in categories:
-                    current_value = current_budget.get(category, 0)
-                    budget_values[category] = st.number_input(
-                        f"{category} (₹)",
-                        min_value=0,
-                        value=int(current_value),
-                        step=500
-                    )
-                
-                st.markdown('<div style="text-align: center;">', unsafe_allow_html=True)
-                submitted = st.form_submit_button("Update Budget")
-                st.markdown('</div>', unsafe_allow_html=True)
-                
-                if submitted:
-                    if financial.set_budget(budget_values):
-                        st.success("Budget updated successfully!")
-                        time.sleep(1)
-                        st.rerun()
-                    else:
-                        st.error("Failed to update budget.")
+            sample_budget_data = [
+                {"category": "Food & Dining", "budgeted": 4000, "spent": 3500, "percentage": 87.5},
+                {"category": "Transportation", "budgeted": 1500, "spent": 1200, "percentage": 80},
+                {"category": "Books & Supplies", "budgeted": 2000, "spent": 2200, "percentage": 110},
+                {"category": "Entertainment", "budgeted": 1000, "spent": 800, "percentage": 80},
+            ]
             
-            # Budget template recommendations
-            st.markdown("### Budget Templates")
+            rows = []
+            for item in sample_budget_data:
+                bar_color, text_color = _budget_bar_colors(item['percentage'])
+                rows.append(_BUDGET_BAR_TEMPLATE.format_map(dict(
+                    item,
+                    remaining=item['budgeted'] - item['spent'],
+                    width=item['percentage'],
+                    bar_color=bar_color,
+                    text_color=text_color
+                )))
+            st.markdown("".join(rows), unsafe_allow_html=True)
+    
+    with col2:
+        st.subheader("Set Budget")
+        
+        current_budget = financial.get_budget() or {}
+        
+        with st.form("budget_form"):
+            st.write("Set your monthly budget for each category:")
             
-            st.write("Quick templates based on your profile:")
+            budget_values = {}
             
-            col1, col2 = st.columns(2)
+            for category in _BUDGET_CATEGORIES:
+                current_value = current_budget.get(category, 0)
+                budget_values[category] = st.number_input(
+                    f"{category} (₹)",
+                    min_value=0,
+                    value=int(current_value),
+                    step=500
+                )
             
-            with col1:
-                if st.button("Student Living at Home"):
-                    template = {
-                        "Food & Dining": 3000,
-                        "Transportation": 2000,
-                        "Books & Supplies": 2500,
-                        "Rent & Utilities": 0,
-                        "Entertainment": 1500,
-                        "Personal Care": 1000,
-                        "Mobile & Internet": 800,
-                        "Clothing": 1000,
-                        "Miscellaneous": 1200
-                    }
-                    if financial.set_budget(template):
-                        st.success("Template applied!")
-                        time.sleep(1)
-                        st.rerun()
+            st.markdown('<div style="text-align: center;">', unsafe_allow_html=True)
+            submitted = st.form_submit_button("Update Budget")
+            st.markdown('</div>', unsafe_allow_html=True)
             
-            with col2:
-                if st.button("Hostel/PG Student"):
-                    template = {
-                        "Food & Dining": 4500,
-                        "Transportation": 1500,
-                        "Books & Supplies": 2500,
-                        "Rent & Utilities": 7000,
-                        "Entertainment": 1200,
-                        "Personal Care": 800,
-                        "Mobile & Internet": 800,
-                        "Clothing": 800,
-                        "Miscellaneous": 1000
-                    }
-                    if financial.set_budget(template):
-                        st.success("Template applied!")
-                        time.sleep(1)
-                        st.rerun()
-    
-    # Scholarships tab
-    with tab3:
-        st.subheader("Scholarship Finder")
+            if submitted:
+                if financial.set_budget(budget_values):
+                    st.toast("Budget updated successfully!", icon="✅")
+                    st.rerun()
+                else:
+                    st.error("Failed to update budget.")
         
-        # Get student profile info
-        student = st.session_state.student_profile
-        student_degree = student.get_degree() if student else "Unknown"
-        student_year = student.get_year_of_study() if student else "Unknown"
+        # Budget template recommendations
+        st.markdown("### Budget Templates")
         
-        # AI-generated scholarship data if available
-        if st.session_state.cached_content.get("financial_tips"):
-            # Try to extract scholarship info from financial tips
-            for tip in st.session_state.cached_content["financial_tips"]:
-                if "scholarship" in tip.get("tip", "").lower() or "scholarship" in tip.get("description", "").lower():
-                    st.markdown(f"""
-                    <div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; margin-bottom: 20px; border-left: 4px solid #2196f3;">
-                        <h4 style="margin-top: 0; color: #0d47a1;">{tip.get('tip', 'Scholarship Opportunity')}</h4>
-                        <p>{tip.get('description', '')}</p>
-                        <p style="margin-bottom: 0;"><strong>Action Required:</strong> {tip.get('action_item', '')}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    break
+        st.write("Quick templates based on your profile:")
         
-        # Search and filters
-        col1, col2 = st.columns([2, 1])
+        col1, col2 = st.columns(2)
         
         with col1:
-            search_query = st.text_input("Search Scholarships", placeholder="e.g., Engineering, Merit, Women, SC/ST")
-            
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                eligibility_filter = st.multiselect(
-                    "Eligibility",
-                    ["Merit-based", "Need-based", "Women-specific", "SC/ST/OBC", "Minority", "Disability"]
-                )
-            
-            with col2:
-                amount_filter = st.selectbox(
-                    "Amount Range",
-                    ["Any", "Up to ₹10,000", "₹10,000-₹50,000", "₹50,000-₹1,00,000", "Above ₹1,00,000"]
-                )
-            
-            with col3:
-                deadline_filter = st.selectbox(
-                    "Deadline",
-                    ["Any", "Within 1 month", "Within 3 months", "Future"]
-                )
+            if st.button("Student Living at Home"):
+                if financial.set_budget(dict(_HOME_BUDGET_TEMPLATE)):
+                    st.toast("Template applied!", icon="✅")
+                    st.rerun()
         
         with col2:
-            st.markdown('<div style="text-align: center; margin-top: 24px;">', unsafe_allow_html=True)
-            search_button = st.button("🔍 Search Scholarships")
-            st.markdown('</div>', unsafe_allow_html=True)
+            if st.button("Hostel/PG Student"):
+                if financial.set_budget(dict(_HOSTEL_BUDGET_TEMPLATE)):
+                    st.toast("Template applied!", icon="✅")
+                    st.rerun()
+
+def _scholarship_results(student_degree, search_query):
+    """Scholarship matches for the degree, narrowed by the search query, plus application tips"""
+    st.markdown("### Matching Scholarships")
+    
+    # Get finance news about scholarships
+    scholarship_news = _scholarship_news()
+    
+    # Generate relevant scholarships based on degree
+    candidates = []
+    
+    if "B.Tech" in student_degree or "B.E." in student_degree:
+        candidates.extend(_ENGINEERING_SCHOLARSHIPS)
+    
+    if "BBA" in student_degree or "B.Com" in student_degree or "MBA" in student_degree:
+        candidates.extend(_BUSINESS_SCHOLARSHIPS)
+    
+    # Add general scholarships
+    candidates.extend(_GENERAL_SCHOLARSHIPS)
+    
+    # Add scholarship from news if available
+    if scholarship_news:
+        news_scholarship = {
+            "name": scholarship_news["title"],
+            "provider": scholarship_news["source"],
+            "amount": "Check website for details",
+            "eligibility": "Check website for details",
+            "deadline": "Recently announced",
+            "website": "#"
+        }
+        candidates.append(news_scholarship)
+    
+    # Filter scholarships based on search query if provided; search text is only built while searching
+    query_lower = search_query.lower()
+    scholarships = [scholarship for scholarship in candidates
+                    if not query_lower or query_lower in _scholarship_search_text(scholarship)]
+    
+    # Display scholarships as one HTML block
+    if scholarships:
+        _html("".join(_SCHOLARSHIP_CARD_TEMPLATE.format_map(scholarship) for scholarship in scholarships))
+    else:
+        st.info("No scholarships matching your criteria found. Try adjusting your filters or search terms.")
+    
+    # Scholarship tips and getting help
+    st.markdown(_SCHOLARSHIP_TIPS_MARKDOWN, unsafe_allow_html=True)
+
+@_fragment
+def _finance_scholarships_tab(financial):
+    """Scholarships tab: scholarships matched to the student's degree and year"""
+    st.subheader("Scholarship Finder")
+    
+    # Get student profile info
+    student = st.session_state.student_profile
+    student_degree = student.get_degree() if student else "Unknown"
+    student_year = student.get_year_of_study() if student else "Unknown"
+    
+    # AI-generated scholarship data if available
+    if st.session_state.cached_content.get("financial_tips"):
+        # Try to extract scholarship info from financial tips
+        for tip in st.session_state.cached_content["financial_tips"]:
+            if "scholarship" in tip.get("tip", "").lower() or "scholarship" in tip.get("description", "").lower():
+                st.markdown(f"""
+                <div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; margin-bottom: 20px; border-left: 4px solid #2196f3;">
+                    <h4 style="margin-top: 0; color: #0d47a1;">{tip.get('tip', 'Scholarship Opportunity')}</h4>
+                    <p>{tip.get('description', '')}</p>
+                    <p style="margin-bottom: 0;"><strong>Action Required:</strong> {tip.get('action_item', '')}</p>
+                </div>
+                """, unsafe_allow_html=True)
+                break
+    
+    # Search and filters
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        search_query = st.text_input("Search Scholarships", placeholder="e.g., Engineering, Merit, Women, SC/ST")
         
-        # Scholarship results - would be dynamic based on search in a real implementation
-        # For this prototype, we're showing relevant scholarships based on the student profile
-        
-        if search_button or True:  # Always show some results for now
-            st.markdown("### Matching Scholarships")
-            
-            # Get finance news for scholarships
-            finance_news = fetch_trending_news("finance")
-            scholarship_news = None
-            
-            # Check if any news is about scholarships
-            for news in finance_news:
-                if "scholarship" in news.get("title", "").lower():
-                    scholarship_news = news
-                    break
-            
-            # Generate relevant scholarships based on degree
-            scholarships = []
-            
-            if "B.Tech" in student_degree or "B.E." in student_degree:
-                scholarships.extend([
-                    {
-                        "name": "AICTE Pragati Scholarship for Girls",
-                        "provider": "AICTE",
-                        "amount": "₹50,000 per annum",
-                        "eligibility": "Girl students in AICTE approved Technical Institutions",
-                        "deadline": "May 15, 2025", 
-                        "website": "https://www.aicte-pragati-saksham-gov.in/"
-                    },
-                    {
-                        "name": "Inspire Scholarship for Engineering Students",
-                        "provider": "Department of Science & Technology",
-                        "amount": "₹80,000 per annum",
-                        "eligibility": "Top 1% in class 12 board exams",
-                        "deadline": "June 30, 2025",
-                        "website": "https://www.inspire-dst.gov.in/scholarship.html"
-                    }
-                ])
-            
-            if "BBA" in student_degree or "B.Com" in student_degree or "MBA" in student_degree:
-                scholarships.extend([
-                    {
-                        "name": "Future Business Leaders Scholarship",
-                        "provider": "CII (Confederation of Indian Industry)",
-                        "amount": "₹60,000 per annum",
-                        "eligibility": "Commerce and Business students with academic excellence",
-                        "deadline": "July 31, 2025",
-                        "website": "https://www.cii.in/Scholarships.aspx"
-                    }
-                ])
-            
-            # Add general scholarships
-            scholarships.extend([
-                {
-                    "name": "National Scholarship Portal Schemes",
-                    "provider": "Government of India",
-                    "amount": "Varies by scheme",
-                    "eligibility": "Based on merit, category, and income criteria",
-                    "deadline": "Variable by scheme",
-                    "website": "https://scholarships.gov.in/"
-                },
-                                {
-                    "name": "Tata Trusts Scholarships",
-                    "provider": "Tata Trusts",
-                    "amount": "Up to ₹2,00,000 per annum",
-                    "eligibility": "Merit-cum-means basis for undergraduate and postgraduate students",
-                    "deadline": "April 30, 2025",
-                    "website": "https://www.tatatrusts.org/our-work/education/scholarships"
-                },
-                {
-                    "name": "Keep India Smiling Scholarship",
-                    "provider": "Colgate-Palmolive",
-                    "amount": "Up to ₹30,000 per annum",
-                    "eligibility": "Students from families with annual income less than ₹5 lakhs",
-                    "deadline": "June 15, 2025",
-                    "website": "https://www.colgate.com/en-in/smile-karo-aur-shuru-ho-jao/keep-india-smiling"
-                }
-            ])
-            
-            # Add scholarship from news if available
-            if scholarship_news:
-                scholarships.append({
-                    "name": scholarship_news["title"],
-                    "provider": scholarship_news["source"],
-                    "amount": "Check website for details",
-                    "eligibility": "Check website for details",
-                    "deadline": "Recently announced",
-                    "website": "#"
-                })
-            
-            # Filter scholarships based on search query if provided
-            if search_query:
-                filtered_scholarships = []
-                query_lower = search_query.lower()
-                for scholarship in scholarships:
-                    if (query_lower in scholarship["name"].lower() or
-                        query_lower in scholarship["provider"].lower() or
-                        query_lower in scholarship["eligibility"].lower()):
-                        filtered_scholarships.append(scholarship)
-                scholarships = filtered_scholarships
-            
-            # Display scholarships
-            if scholarships:
-                for scholarship in scholarships:
-                    st.markdown(f"""
-                    <div style="background-color: white; padding: 15px; border-radius: 8px; margin-bottom: 15px; box-shadow: 0 2px 5px rgba(0,0,0,0.1);">
-                        <h4 style="margin-top: 0; color: #0a3d62;">{scholarship["name"]}</h4>
-                        <div style="display: flex; justify-content: space-between; margin-bottom: 10px;">
-                            <div><strong>Provider:</strong> {scholarship["provider"]}</div>
-                            <div><strong>Amount:</strong> {scholarship["amount"]}</div>
-                        </div>
-                        <p><strong>Eligibility:</strong> {scholarship["eligibility"]}</p>
-                        <div style="display: flex; justify-content: space-between; align-items: center;">
-                            <div><strong>Deadline:</strong> {scholarship["deadline"]}</div>
-                            <a href="{scholarship["website"]}" target="_blank" style="background-color: #0a3d62; color: white; padding: 5px 15px; border-radius: 20px; text-decoration: none; font-size: 0.9rem;">Visit Website</a>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-            else:
-                st.info("No scholarships matching your criteria found. Try adjusting your filters or search terms.")
-            
-            # Scholarship tips
-            st.markdown("### Scholarship Application Tips")
-            st.markdown("""
-            <div style="background-color: #e8f5e9; padding: 15px; border-radius: 8px;">
-                <h4 style="margin-top: 0; color: #2e7d32;">Maximize Your Chances</h4>
-                <ul>
-                    <li><strong>Apply early</strong> - Many scholarships have limited funds</li>
-                    <li><strong>Prepare documents</strong> - Keep income certificates, mark sheets, and ID proofs ready</li>
-                    <li><strong>Quality essays</strong> - Spend time on personal statements and essays</li>
-                    <li><strong>Multiple applications</strong> - Apply to several scholarships to increase your chances</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Getting help
-            st.markdown("### Need Help with Applications?")
-            st.markdown("""
-            <div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px;">
-                <h4 style="margin-top: 0; color: #0d47a1;">Resources Available</h4>
-                <ul>
-                    <li>Contact your <strong>college financial aid office</strong> for guidance</li>
-                    <li>Join the <strong>Scholarship Discussion Forum</strong> on your college portal</li>
-                    <li>Use the <strong>Financial Advisor</strong> tab to get personalized scholarship advice</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            eligibility_filter = st.multiselect(
+                "Eligibility",
+                ["Merit-based", "Need-based", "Women-specific", "SC/ST/OBC", "Minority", "Disability"]
+            )
+        
+        with col2:
+            amount_filter = st.selectbox(
+                "Amount Range",
+                ["Any", "Up to ₹10,000", "₹10,000-₹50,000", "₹50,000-₹1,00,000", "Above ₹1,00,000"]
+            )
+        
+        with col3:
+            deadline_filter = st.selectbox(
+                "Deadline",
+                ["Any", "Within 1 month", "Within 3 months", "Future"]
+            )
     
-    # Financial Advisor tab
-    with tab4:
-        st.subheader("Financial Advisor")
+    with col2:
+        st.markdown('<div style="text-align: center; margin-top: 24px;">', unsafe_allow_html=True)
+        search_button = st.button("🔍 Search Scholarships")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Scholarship results - would be dynamic based on search in a real implementation
+    # For this prototype, we're showing relevant scholarships based on the student profile.
+    # Results appear after the first search and then stay up as the query or filters change.
+    if search_button:
+        st.session_state._scholarships_shown = True
+    
+    if search_button or st.session_state.get("_scholarships_shown", False):
+        _scholarship_results(student_degree, search_query)
+    else:
+        st.info("Press Search Scholarships to see scholarships matched to your degree.")
+
+@_fragment
+def _finance_advisor_tab(financial):
+    """Financial Advisor tab: finance chat with the AI advisor"""
+    st.subheader("Financial Advisor")
+    
+    if st.session_state.groq_api_key is None:
+        st.warning("Please configure your Groq API key in Settings to use the Financial Advisor.")
+        if st.button("Go to Settings"):
+            st.session_state.current_page = "Settings"
+            st.rerun()
+    else:
+        st.write("Ask anything about financial planning, scholarships, budgeting, or student finances.")
         
-        if st.session_state.groq_api_key is None:
-            st.warning("Please configure your Groq API key in Settings to use the Financial Advisor.")
-            if st.button("Go to Settings"):
-                st.session_state.current_page = "Settings"
-                st.rerun()
-        else:
-            st.write("Ask anything about financial planning, scholarships, budgeting, or student finances.")
-            
-            # Initialize financial chat history if it doesn't exist
-            if 'finance_chat_history' not in st.session_state:
-                st.session_state.finance_chat_history = []
+        # Display financial chat history
+        _render_chat_history(st.session_state.finance_chat_history, "Financial Advisor")
+        
+        # Show AI-generated financial advice if available
+        if st.session_state.cached_content.get("financial_tips") and not st.session_state.finance_chat_history:
+            st.markdown("### AI-Generated Financial Insights")
+            tips = st.session_state.cached_content["financial_tips"]
             
-            # Display financial chat history
-            if st.session_state.finance_chat_history:
-                st.markdown('<div style="background-color: #f8f9fa; padding: 15px; border-radius: 8px; margin-bottom: 20px; max-height: 400px; overflow-y: auto;">', unsafe_allow_html=True)
+            for tip in tips:
+                st.markdown(f"""
+                <div style="background-color: #e8f5e9; padding: 15px; border-radius: 8px; margin-bottom: 15px; border-left: 4px solid #4caf50;">
+                    <h4 style="margin-top: 0; color: #2e7d32;">{tip.get('tip', 'Financial Tip')}</h4>
+                    <p>{tip.get('description', '')}</p>
+                    <p style="margin-bottom: 0;"><strong>Action:</strong> {tip.get('action_item', '')}</p>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Input for financial question
+        finance_query = st.text_input("Ask about budgeting, scholarships, financial planning, etc.", key="finance_query")
+        
+        if st.button("Get Financial Advice", key="get_finance_advice"):
+            if finance_query:
+                # Add user message to finance chat history
+                st.session_state.finance_chat_history.append(("user", finance_query))
                 
-                for i, (role, message) in enumerate(st.session_state.finance_chat_history):
-                    if role == "user":
-                        st.markdown(f'<div style="background-color: #e7f5fe; padding: 10px; border-radius: 15px 15px 5px 15px; margin-bottom: 10px; margin-left: 20px;"><strong>You:</strong> {message}</div>', unsafe_allow_html=True)
-                    else:
-                        st.markdown(f'<div style="background-color: #f0f0f0; padding: 10px; border-radius: 15px 15px 15px 5px; margin-bottom: 10px;"><strong>Financial Advisor:</strong> {message}</div>', unsafe_allow_html=True)
+                # Context from finances
+                budget = financial.get_budget()
+                budget_context = "Budget set up" if budget else "No budget set up"
                 
-                st.markdown('</div>', unsafe_allow_html=True)
-            
-            # Show AI-generated financial advice if available
-            if st.session_state.cached_content.get("financial_tips") and not st.session_state.finance_chat_history:
-                st.markdown("### AI-Generated Financial Insights")
-                tips = st.session_state.cached_content["financial_tips"]
+                transactions = financial.get_all_transactions()
+                transaction_context = f"{len(transactions)} transactions recorded" if transactions else "No transactions recorded"
                 
-                for tip in tips:
-                    st.markdown(f"""
-                    <div style="background-color: #e8f5e9; padding: 15px; border-radius: 8px; margin-bottom: 15px; border-left: 4px solid #4caf50;">
-                        <h4 style="margin-top: 0; color: #2e7d32;">{tip.get('tip', 'Financial Tip')}</h4>
-                        <p>{tip.get('description', '')}</p>
-                        <p style="margin-bottom: 0;"><strong>Action:</strong> {tip.get('action_item', '')}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-            
-            # Input for financial question
-            finance_query = st.text_input("Ask about budgeting, scholarships, financial planning, etc.", key="finance_query")
-            
-            if st.button("Get Financial Advice", key="get_finance_advice"):
-                if finance_query:
-                    # Add user message to finance chat history
-                    st.session_state.finance_chat_history.append(("user", finance_query))
-                    
-                    # Context from finances
-                    budget = financial.get_budget()
-                    budget_context = "Budget set up" if budget else "No budget set up"
-                    
-                    transactions = financial.get_all_transactions()
-                    transaction_context = f"{len(transactions)} transactions recorded" if transactions else "No transactions recorded"
-                    
-                    # Prepare student context for more personalized answers
-                    student_context = None
-                    if st.session_state.student_profile:
-                        profile = st.session_state.student_profile
-                        student_context = {
-                            "degree": profile.get_degree(),
-                            "year": profile.get_year_of_study(),
-                            "college": profile.get_college_name(),
-                            "finance_status": f"{budget_context}, {transaction_context}"
-                        }
-                    
-                    # Get AI response for finances specifically
-                    with st.spinner("Researching your financial question..."):
-                        ai_response = st.session_state.ai_advisor.get_advice(
-                            finance_query, "financial", student_context
-                        )
-                    
-                    # Add AI response to finance chat history
-                    st.session_state.finance_chat_history.append(("ai", ai_response))
-                    
-                    # Force a rerun to show the updated chat
-                    st.rerun()
+                # Prepare student context for more personalized answers
+                student_context = _student_context(finance_status=f"{budget_context}, {transaction_context}")
+                
+                # Get AI response for finances specifically
+                with st.spinner("Researching your financial question..."):
+                    ai_response = st.session_state.ai_advisor.get_advice(
+                        finance_query, "financial", student_context
+                    )
+                
+                # Add AI response to finance chat history
+                st.session_state.finance_chat_history.append(("ai", ai_response))
+                
+                # Force a rerun to show the updated chat
+                st.rerun()
+
+# Financial Planner page
+def show_finance_page():
+    st.title("Financial Planner")
+    st.markdown(_FINANCE_CSS, unsafe_allow_html=True)
+    
+    # Show guidance for first-time visitors
+    show_section_guidance("Finance")
+    
+    financial = st.session_state.financial_planner
+    
+    # Create tabs for different finance features
+    tab1, tab2, tab3, tab4 = st.tabs(["Transactions", "Budget", "Scholarships", "Financial Advisor"])
+    
+    # Each tab is its own fragment so a widget interaction only reruns that tab
+    with tab1:
+        _finance_transactions_tab(financial)
+    
+    with tab2:
+        _finance_budget_tab(financial)
+    
+    with tab3:
+        _finance_scholarships_tab(financial)
+    
+    with tab4:
+        _finance_advisor_tab(financial)
+
+# Choices for the mood log form
+_STRESS_FACTOR_OPTIONS = (
+    "Academic pressure", "Exam stress", "Assignment deadlines",
+    "Poor sleep", "Health issues", "Financial concerns",
+    "Social challenges", "Homesickness", "Relationship issues",
+    "Time management", "Future career concerns", "Other"
+)
+
+# Stress Management tab: quick techniques and longer daily practices
+_QUICK_RELIEF_TECHNIQUES = (
+    {
+        "name": "Box Breathing",
+        "description": "Inhale for 4 counts, hold for 4, exhale for 4, hold for 4. Repeat.",
+        "benefits": "Reduces acute stress, lowers heart rate, improves focus",
+        "when_to_use": "Before exams, during stressful situations, when feeling overwhelmed"
+    },
+    {
+        "name": "5-4-3-2-1 Grounding",
+        "description": "Name 5 things you see, 4 things you feel, 3 things you hear, 2 things you smell, and 1 thing you taste.",
+        "benefits": "Interrupts anxiety spirals, brings awareness to the present moment",
+        "when_to_use": "During anxiety attacks, when overthinking, when feeling disconnected"
+    },
+    {
+        "name": "Progressive Muscle Relaxation",
+        "description": "Tense and then release each muscle group in your body, from toes to head.",
+        "benefits": "Releases physical tension, improves body awareness, reduces physical symptoms of stress",
+        "when_to_use": "Before bed, after long study sessions, when feeling physically tense"
+    }
+)
+
+_DAILY_PRACTICES = (
+    {
+        "name": "Guided Meditation",
+        "description": "Follow along with a guided meditation focusing on breathing and awareness.",
+        "benefits": "Reduces stress hormones, improves focus, builds emotional resilience",
+        "when_to_use": "Morning routine, before studying, after a stressful day"
+    },
+    {
+        "name": "Journaling",
+        "description": "Write about your thoughts, feelings, and experiences without judgment.",
+        "benefits": "Clarifies thinking, processes emotions, tracks patterns over time",
+        "when_to_use": "End of day reflection, when processing complex emotions, for problem-solving"
+    },
+    {
+        "name": "Physical Movement",
+        "description": "Short yoga sequence, brisk walk, or simple stretching routine.",
+        "benefits": "Releases endorphins, improves circulation, shifts mental state",
+        "when_to_use": "Study breaks, when feeling stuck, to boost energy or focus"
+    }
+)
+
+# 4-7-8 breathing guide for the Stress Management tab; the phases and the one-minute countdown run client-side
+_BREATHING_EXERCISE_HTML = """
+<div style="font-family: sans-serif; background-color: #f5f5f5; padding: 20px; border-radius: 10px; text-align: center;">
+    <div id="breath-animation" style="font-size: 2rem; margin-bottom: 10px;">Inhale...</div>
+    <div id="instructions" style="font-size: 1.2rem;">Breathe in through your nose for 4 counts</div>
+    <div id="timer" style="font-size: 1.5rem; margin-top: 20px;">1:00</div>
+</div>
+<script>
+    const phases = [
+        ["Inhale...", "Breathe in through your nose for 4 counts", 4],
+        ["Hold...", "Hold your breath for 7 counts", 7],
+        ["Exhale...", "Exhale slowly through your mouth for 8 counts", 8]
+    ];
+    const label = document.getElementById("breath-animation");
+    const instructions = document.getElementById("instructions");
+    const timer = document.getElementById("timer");
+    let remaining = 60, phase = 0, phaseLeft = phases[0][2];
+    const tick = setInterval(() => {
+        remaining -= 1;
+        phaseLeft -= 1;
+        timer.textContent = "0:" + String(remaining).padStart(2, "0");
+        if (remaining <= 0) {
+            clearInterval(tick);
+            label.textContent = "Well done!";
+            instructions.textContent = "Breathing exercise completed! How do you feel?";
+            return;
+        }
+        if (phaseLeft <= 0) {
+            phase = (phase + 1) % phases.length;
+            [label.textContent, instructions.textContent, phaseLeft] = phases[phase];
+        }
+    }, 1000);
+</script>
+"""
+
+# Stress self-assessment: (question index, card) pairs, shown when that answer is above 3
+_STRESS_RECOMMENDATIONS = (
+    (0, '<div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #2196f3;">'
+        '<h4 style="margin-top: 0; color: #0d47a1;">For Academic Overwhelm</h4>'
+        '<p>Try the <strong>Pomodoro Technique</strong>: Work for 25 minutes, then take a 5-minute break. After 4 cycles, take a longer 15-30 minute break.</p>'
+        '</div>'),
+    (1, '<div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #2196f3;">'
+        '<h4 style="margin-top: 0; color: #0d47a1;">For Sleep Difficulties</h4>'
+        '<p>Practice <strong>Progressive Muscle Relaxation</strong> before bed and create a consistent sleep routine. Avoid screens 1 hour before sleep.</p>'
+        '</div>'),
+)
+
+# Resources tab: campus support services and recommended apps
+_CAMPUS_RESOURCES = (
+    {
+        "name": "College Counseling Center",
+        "description": "Free confidential counseling services for students",
+        "contact": "Visit Student Center, 2nd Floor or call 123-456-7890",
+        "hours": "Mon-Fri: 9am-5pm"
+    },
+    {
+        "name": "Peer Support Network",
+        "description": "Trained student volunteers providing peer counseling and support",
+        "contact": "Email peer.support@college.edu",
+        "hours": "Available 24/7 via chat"
+    },
+    {
+        "name": "Wellness Workshops",
+        "description": "Regular workshops on stress management, mindfulness, and wellness",
+        "contact": "Check college events calendar for schedule",
+        "hours": "Typically held on Wednesdays at 4pm"
+    }
+)
+
+_WELLNESS_APPS = (
+    {
+        "name": "Headspace",
+        "category": "Meditation",
+        "description": "Guided meditations for stress, focus, and sleep. Free with student plan.",
+        "link": "https://www.headspace.com/studentplan"
+    },
+    {
+        "name": "Calm",
+        "category": "Meditation & Sleep",
+        "description": "Sleep stories, meditations, and breathing exercises.",
+        "link": "https://www.calm.com/"
+    },
+    {
+        "name": "Wakeout",
+        "category": "Movement",
+        "description": "Quick exercises designed for studying breaks.",
+        "link": "https://wakeout.app/"
+    },
+    {
+        "name": "Reflectly",
+        "category": "Journaling",
+        "description": "AI-guided journaling app to track mood and build self-awareness.",
+        "link": "https://reflectly.app/"
+    },
+    {
+        "name": "Forest",
+        "category": "Focus",
+        "description": "Stay focused and present by growing virtual trees.",
+        "link": "https://www.forestapp.cc/"
+    },
+    {
+        "name": "Finch",
+        "category": "Self-Care",
+        "description": "Self-care pet game that helps build healthy habits.",
+        "link": "https://finchcare.com/"
+    }
+)
+
+# Card templates for the wellness tabs, filled with format_map from the dicts above
+_TECHNIQUE_DETAILS_TEMPLATE = "**Description:** {description}\n\n**Benefits:** {benefits}\n\n**When to use:** {when_to_use}"
+_CAMPUS_RESOURCE_CARD_TEMPLATE = (
+    '<div style="background-color: white; padding: 15px; border-radius: 8px; height: 100%; box-shadow: 0 2px 5px rgba(0,0,0,0.1);">'
+    '<h4 style="margin-top: 0; color: #0a3d62;">{name}</h4>'
+    '<p>{description}</p>'
+    '<p><strong>Contact:</strong> {contact}</p>'
+    '<p><strong>Hours:</strong> {hours}</p>'
+    '</div>'
+)
+_WELLNESS_APP_CARD_TEMPLATE = (
+    '<div style="background-color: #f5f5f5; padding: 15px; border-radius: 8px; margin-bottom: 15px;">'
+    '<h4 style="margin-top: 0; color: #0a3d62;">{name}</h4>'
+    '<p><strong>Category:</strong> {category}</p>'
+    '<p>{description}</p>'
+    '<a href="{link}" target="_blank">Learn More</a>'
+    '</div>'
+)
+
+# AI wellness tips appear as a single tip, as articles and as chatbot insights; missing fields use these defaults
+_WELLNESS_TIP_DEFAULTS = {"tip": "Wellness Tip", "description": "", "practice": ""}
+_WELLNESS_TIP_CARD_TEMPLATE = (
+    '<div style="background-color: #e8f5e9; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #4caf50;">'
+    '<h4 style="margin-top: 0; color: #2e7d32;">{tip}</h4>'
+    '<p>{description}</p>'
+    '<p style="margin-bottom: 0;"><strong>Try this:</strong> {practice}</p>'
+    '</div>'
+)
+_WELLNESS_ARTICLE_CARD_TEMPLATE = (
+    '<div style="background-color: #e8f5e9; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #4caf50;">'
+    '<h4 style="margin-top: 0; color: #2e7d32;">Article: {tip}</h4>'
+    '<p>{description}</p>'
+    '<p style="margin-bottom: 0;"><strong>Practice:</strong> {practice}</p>'
+    '</div>'
+)
+_WELLNESS_INSIGHT_CARD_TEMPLATE = (
+    '<div style="background-color: #e8f5e9; padding: 15px; border-radius: 8px; margin-bottom: 15px; border-left: 4px solid #4caf50;">'
+    '<h4 style="margin-top: 0; color: #2e7d32;">{tip}</h4>'
+    '<p>{description}</p>'
+    '<p style="margin-bottom: 0;"><strong>Practice:</strong> {practice}</p>'
+    '</div>'
+)
+
+def _wellness_tips_html(tips):
+    """(first tip card, article cards, insight cards) HTML for the AI wellness tips, rebuilt only when the tips are refreshed"""
+    def render():
+        filled = [{**_WELLNESS_TIP_DEFAULTS, **tip} for tip in tips]
+        return (
+            "".join(map(_WELLNESS_TIP_CARD_TEMPLATE.format_map, filled[:1])),
+            "".join(map(_WELLNESS_ARTICLE_CARD_TEMPLATE.format_map, filled)),
+            "".join(map(_WELLNESS_INSIGHT_CARD_TEMPLATE.format_map, filled)),
+        )
+    # Keyed on the tips list itself, which update_content_cache replaces on refresh
+    return _versioned('wellness_tips_html_cache', tips, render)
+
+# Average mood, average sleep and today's mood, laid out as a flex row in a single markdown element
+_MOOD_METRICS_TEMPLATE = (
+    '<div style="display: flex; gap: 1rem;">'
+    '<div style="flex: 1; background-color: #e3f2fd; padding: 15px; border-radius: 8px; text-align: center;">'
+    '<h2 style="margin: 0; color: #1565c0;">{avg_mood:.1f}/10</h2>'
+    '<p style="margin: 0; color: #1565c0;">Avg. Mood (Last 7 Days)</p></div>'
+    '<div style="flex: 1; background-color: #e8f5e9; padding: 15px; border-radius: 8px; text-align: center;">'
+    '<h2 style="margin: 0; color: #2e7d32;">{avg_sleep:.1f}h</h2>'
+    '<p style="margin: 0; color: #2e7d32;">Avg. Sleep (Last 7 Days)</p></div>'
+    '<div style="flex: 1; background-color: {today_bg}; padding: 15px; border-radius: 8px; text-align: center;">'
+    '<h2 style="margin: 0; color: {today_fg};">{today_value}</h2>'
+    '<p style="margin: 0; color: {today_fg};">{today_label}</p></div>'
+    '</div>'
+)
+
+# Advice card for the most frequent stressor, matched by substring in this order
+_STRESSOR_ADVICE = {
+    "Academic pressure": """
+<div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #2196f3;">
+    <h4 style="margin-top: 0; color: #0d47a1;">Managing Academic Stress</h4>
+    <ul style="margin-bottom: 0;">
+        <li>Break large tasks into smaller, manageable chunks</li>
+        <li>Create a study schedule with regular breaks</li>
+        <li>Form or join study groups for difficult subjects</li>
+        <li>Talk to professors or TAs when struggling with concepts</li>
+    </ul>
+</div>
+""",
+    "Poor sleep": """
+<div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #2196f3;">
+    <h4 style="margin-top: 0; color: #0d47a1;">Improving Sleep Quality</h4>
+    <ul style="margin-bottom: 0;">
+        <li>Maintain a consistent sleep schedule, even on weekends</li>
+        <li>Create a relaxing pre-sleep routine (reading, light stretching)</li>
+        <li>Keep electronics out of the bedroom</li>
+        <li>Avoid caffeine at least 6 hours before bedtime</li>
+    </ul>
+</div>
+""",
+    "Social": """
+<div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #2196f3;">
+    <h4 style="margin-top: 0; color: #0d47a1;">Building Social Connections</h4>
+    <ul style="margin-bottom: 0;">
+        <li>Join clubs or groups aligned with your interests</li>
+        <li>Schedule regular check-ins with friends and family</li>
+        <li>Consider volunteering for campus activities</li>
+        <li>Practice social skills in low-pressure settings</li>
+    </ul>
+</div>
+""",
+}
+
+def _sample_wellness_mood(today):
+    """Two weeks of sample (date, score, sleep_hours) rows ending yesterday; seeded by the date so each day draws the same rows"""
+    rng = np.random.default_rng(today.toordinal())
+    rows = []
+    for i in range(14):
+        # Create slightly realistic patterns
+        base_mood = 7
+        weekend_boost = 1 if i % 7 >= 5 else 0  # Higher mood on weekends
+        random_factor = rng.normal(0, 1)  # Random fluctuation
+        
+        mood = max(1, min(10, base_mood + weekend_boost + random_factor))
+        sleep_hours = max(5, min(9, 7 + rng.normal(0, 0.5)))
+        rows.append(((today - timedelta(days=14 - i)).isoformat(), round(mood, 1), round(sleep_hours, 1)))
+    return tuple(rows)
+
+# Keyed on each student's mood rows, so bound the process-wide cache
+@st.cache_data(show_spinner=False, max_entries=64)
+def _mood_trend_fig(rows, title):
+    """Mood line with sleep hours on a second axis, memoized on its (date, score, sleep_hours) rows"""
+    import plotly.express as px
+    
+    df = pd.DataFrame(rows, columns=["date", "score", "sleep_hours"])
+    fig = px.line(
+        df,
+        x="date",
+        y="score",
+        title=title,
+        labels={"score": "Mood (1-10)", "date": "Date"},
+        markers=True
+    )
+    
+    # Add sleep hours as a secondary y-axis if available
+    if df['sleep_hours'].notna().any():
+        fig2 = px.line(
+            df,
+            x="date",
+            y="sleep_hours",
+            labels={"sleep_hours": "Sleep (hours)"}
+        )
+        fig2.update_traces(yaxis="y2", line=dict(color="green"))
+        
+        # Add second y-axis
+        fig.add_traces(fig2.data)
+        fig.update_layout(
+            yaxis2=dict(
+                title="Sleep (hours)",
+                side="right",
+                overlaying="y"
+            )
+        )
+    
+    fig.update_layout(hovermode="x unified")
+    return fig
 
 # Mental Wellness page
 def show_wellness_page():
+    import plotly.express as px
+    
     st.title("Mental Wellness")
     
     # Show guidance for first-time visitors
@@ -4279,6 +4775,10 @@ def show_wellness_page():
     
     wellness = st.session_state.mental_wellness
     
+    # Read the clock once per rerun for every "today" check on the page
+    today = datetime.now().date()
+    today_str = today.isoformat()
+    
     # Create tabs for different wellness features
     tab1, tab2, tab3, tab4 = st.tabs(["Mood Tracker", "Stress Management", "Resources", "Wellness Chatbot"])
     
@@ -4286,216 +4786,81 @@ def show_wellness_page():
     with tab1:
         st.subheader("Track Your Mood")
         
+        # Fetch the history once and index it by date for the today/existing-entry lookups
+        mood_history = _mood_history(wellness)
+        mood_by_date = {entry.get('date'): entry for entry in mood_history}
+        
         col1, col2 = st.columns([2, 1])
         
         with col1:
             # Display mood history
-            mood_history = wellness.get_mood_history()
-            
             if mood_history:
-                # Calculate statistics
-                recent_moods = mood_history[-7:] if len(mood_history) >= 7 else mood_history
-                avg_mood = sum(entry['score'] for entry in recent_moods) / len(recent_moods)
-                avg_sleep = sum(entry.get('sleep_hours', 0) for entry in recent_moods) / len(recent_moods)
-                
-                # Show mood metrics
-                col1, col2, col3 = st.columns(3)
-                
-                col1.markdown(f"""
-                <div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; text-align: center;">
-                    <h2 style="margin: 0; color: #1565c0;">{avg_mood:.1f}/10</h2>
-                    <p style="margin: 0; color: #1565c0;">Avg. Mood (Last 7 Days)</p>
-                </div>
-                """, unsafe_allow_html=True)
+                # Latest 30 entries by date, oldest first; entries can be logged for past days,
+                # so the history itself is not guaranteed to be in date order
+                recent = heapq.nlargest(30, mood_history, key=lambda x: x.get('date', ''))
+                recent.reverse()
                 
-                col2.markdown(f"""
-                <div style="background-color: #e8f5e9; padding: 15px; border-radius: 8px; text-align: center;">
-                    <h2 style="margin: 0; color: #2e7d32;">{avg_sleep:.1f}h</h2>
-                    <p style="margin: 0; color: #2e7d32;">Avg. Sleep (Last 7 Days)</p>
-                </div>
-                """, unsafe_allow_html=True)
+                # Calculate statistics
+                recent_moods = recent[-7:]
+                avg_mood = fmean(entry['score'] for entry in recent_moods)
+                avg_sleep = fmean(entry.get('sleep_hours', 0) for entry in recent_moods)
                 
-                mood_today = next((entry for entry in mood_history if entry.get('date') == datetime.now().strftime("%Y-%m-%d")), None)
+                # Show mood metrics as one three-card row
+                mood_today = mood_by_date.get(today_str)
                 if mood_today:
-                    col3.markdown(f"""
-                    <div style="background-color: #e1f5fe; padding: 15px; border-radius: 8px; text-align: center;">
-                        <h2 style="margin: 0; color: #0288d1;">{mood_today['score']}/10</h2>
-                        <p style="margin: 0; color: #0288d1;">Today's Mood</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    today_card = dict(today_bg="#e1f5fe", today_fg="#0288d1", today_value=f"{mood_today['score']}/10",
+                                      today_label="Today's Mood")
                 else:
-                    col3.markdown(f"""
-                    <div style="background-color: #f5f5f5; padding: 15px; border-radius: 8px; text-align: center;">
-                        <h2 style="margin: 0; color: #757575;">-</h2>
-                        <p style="margin: 0; color: #757575;">Today's Mood (Not Logged)</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    today_card = dict(today_bg="#f5f5f5", today_fg="#757575", today_value="-",
+                                      today_label="Today's Mood (Not Logged)")
+                _html(_MOOD_METRICS_TEMPLATE.format(avg_mood=avg_mood, avg_sleep=avg_sleep, **today_card))
                 
                 # Mood trend visualization
                 st.subheader("Mood Trend")
                 
-                df = pd.DataFrame(sorted(mood_history, key=lambda x: x.get('date', ''))[-30:])  # Last 30 days
-                
-                if not df.empty:
-                    fig = px.line(
-                        df,
-                        x="date",
-                        y="score",
-                        title="Your Mood Over Time",
-                        labels={"score": "Mood (1-10)", "date": "Date"},
-                        markers=True
-                    )
-                    
-                    # Add sleep hours as a secondary y-axis if available
-                    if 'sleep_hours' in df.columns:
-                        fig2 = px.line(
-                            df,
-                            x="date",
-                            y="sleep_hours",
-                            labels={"sleep_hours": "Sleep (hours)"}
-                        )
-                        fig2.update_traces(yaxis="y2", line=dict(color="green"))
-                        
-                        # Add second y-axis
-                        fig.add_traces(fig2.data)
-                        fig.update_layout(
-                            yaxis2=dict(
-                                title="Sleep (hours)",
-                                side="right",
-                                overlaying="y"
-                            )
-                        )
-                    
-                    fig.update_layout(hovermode="x unified")
+                if recent:
+                    rows = tuple((e.get('date'), e.get('score'), e.get('sleep_hours')) for e in recent)
+                    fig = _mood_trend_fig(rows, "Your Mood Over Time")
                     st.plotly_chart(fig, use_container_width=True)
                 
-                # Common stressors analysis
-                stress_factors = {}
-                for entry in mood_history:
-                    factors = entry.get('stress_factors', [])
-                    for factor in factors:
-                        if factor not in stress_factors:
-                            stress_factors[factor] = 0
-                        stress_factors[factor] += 1
+                # Common stressors analysis, most frequent first; ties keep the order they were first logged
+                stressor_counts = pd.Series(
+                    [factor for entry in mood_history for factor in entry.get('stress_factors', ())], dtype=object
+                ).value_counts(sort=False).sort_values(ascending=False, kind='stable')
                 
-                if stress_factors:
+                if not stressor_counts.empty:
                     st.subheader("Your Common Stressors")
                     
-                    # Sort stressors by frequency
-                    sorted_stressors = sorted(stress_factors.items(), key=lambda x: x[1], reverse=True)
-                    
-                    stressor_df = pd.DataFrame(sorted_stressors, columns=['Stressor', 'Frequency'])
                     fig = px.bar(
-                        stressor_df,
-                        x='Stressor',
-                        y='Frequency',
+                        x=stressor_counts.index,
+                        y=stressor_counts.values,
+                        labels={'x': 'Stressor', 'y': 'Frequency', 'color': 'Frequency'},
                         title='Frequency of Stress Factors',
-                        color='Frequency',
+                        color=stressor_counts.values,
                         color_continuous_scale=px.colors.sequential.Blues
                     )
                     st.plotly_chart(fig, use_container_width=True)
                     
                     # Recommendations based on top stressors
-                    top_stressor = sorted_stressors[0][0]
+                    top_stressor = stressor_counts.index[0]
                     
                     st.markdown("### Personalized Recommendations")
                     
-                    if "Academic pressure" in top_stressor:
-                        st.markdown("""
-                        <div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #2196f3;">
-                            <h4 style="margin-top: 0; color: #0d47a1;">Managing Academic Stress</h4>
-                            <ul style="margin-bottom: 0;">
-                                <li>Break large tasks into smaller, manageable chunks</li>
-                                <li>Create a study schedule with regular breaks</li>
-                                <li>Form or join study groups for difficult subjects</li>
-                                <li>Talk to professors or TAs when struggling with concepts</li>
-                            </ul>
-                        </div>
-                        """, unsafe_allow_html=True)
-                    elif "Poor sleep" in top_stressor:
-                        st.markdown("""
-                        <div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #2196f3;">
-                            <h4 style="margin-top: 0; color: #0d47a1;">Improving Sleep Quality</h4>
-                            <ul style="margin-bottom: 0;">
-                                <li>Maintain a consistent sleep schedule, even on weekends</li>
-                                <li>Create a relaxing pre-sleep routine (reading, light stretching)</li>
-                                <li>Keep electronics out of the bedroom</li>
-                                <li>Avoid caffeine at least 6 hours before bedtime</li>
-                            </ul>
-                        </div>
-                        """, unsafe_allow_html=True)
-                    elif "Social" in top_stressor:
-                        st.markdown("""
-                        <div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #2196f3;">
-                            <h4 style="margin-top: 0; color: #0d47a1;">Building Social Connections</h4>
-                            <ul style="margin-bottom: 0;">
-                                <li>Join clubs or groups aligned with your interests</li>
-                                <li>Schedule regular check-ins with friends and family</li>
-                                <li>Consider volunteering for campus activities</li>
-                                <li>Practice social skills in low-pressure settings</li>
-                            </ul>
-                        </div>
-                        """, unsafe_allow_html=True)
+                    advice = next((html for key, html in _STRESSOR_ADVICE.items() if key in top_stressor), None)
+                    if advice:
+                        _html(advice)
             else:
                 # Empty state with sample visualization
                 st.info("No mood tracking data available yet. Start logging your daily mood using the form on the right.")
                 
                 # Sample data
-                dates = [(datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(14, 0, -1)]
-                sample_data = []
-                
-                for i, date in enumerate(dates):
-                    # Create slightly realistic patterns
-                    base_mood = 7
-                    weekend_boost = 1 if i % 7 >= 5 else 0  # Higher mood on weekends
-                    random_factor = np.random.normal(0, 1)  # Random fluctuation
-                    
-                    mood = max(1, min(10, base_mood + weekend_boost + random_factor))
-                    
-                    sample_data.append({
-                        "date": date,
-                        "score": round(mood, 1),
-                        "sleep_hours": round(max(5, min(9, 7 + np.random.normal(0, 0.5))), 1)
-                    })
-                
-                df = pd.DataFrame(sample_data)
-                
-                fig = px.line(
-                    df,
-                    x="date",
-                    y="score",
-                    title="Sample Mood Trend (What you'll see)",
-                    labels={"score": "Mood (1-10)", "date": "Date"},
-                    markers=True
-                )
-                
-                # Add sleep hours as a secondary y-axis
-                fig2 = px.line(
-                    df,
-                    x="date",
-                    y="sleep_hours",
-                    labels={"sleep_hours": "Sleep (hours)"}
-                )
-                fig2.update_traces(yaxis="y2", line=dict(color="green"))
-                
-                # Add second y-axis
-                fig.add_traces(fig2.data)
-                fig.update_layout(
-                    yaxis2=dict(
-                        title="Sleep (hours)",
-                        side="right",
-                        overlaying="y"
-                    ),
-                    hovermode="x unified"
-                )
-                
+                fig = _mood_trend_fig(_sample_wellness_mood(today), "Sample Mood Trend (What you'll see)")
                 st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             st.subheader("Log Today's Mood")
             
             with st.form("log_mood_form"):
-                today = datetime.now().date()
                 date = st.date_input("Date", value=today, max_value=today)
                 
                 mood_score = st.slider("Mood (1-10)", min_value=1, max_value=10, value=7, 
@@ -4506,10 +4871,7 @@ def show_wellness_page():
                 # Common stress factors
                 stress_factors = st.multiselect(
                     "Stress Factors (if any)",
-                    ["Academic pressure", "Exam stress", "Assignment deadlines", 
-                     "Poor sleep", "Health issues", "Financial concerns", 
-                     "Social challenges", "Homesickness", "Relationship issues", 
-                     "Time management", "Future career concerns", "Other"]
+                    _STRESS_FACTOR_OPTIONS
                 )
                 
                 if "Other" in stress_factors:
@@ -4524,7 +4886,7 @@ def show_wellness_page():
                 
                 if submitted:
                     # Check if already logged for today
-                    existing_entry = next((entry for entry in wellness.get_mood_history() if entry.get('date') == date.isoformat()), None)
+                    existing_entry = mood_by_date.get(date.isoformat())
                     
                     if existing_entry and date == today:
                         overwrite = st.warning("You've already logged your mood for today. Do you want to update it?")
@@ -4538,8 +4900,7 @@ def show_wellness_page():
                             }
                             
                             if wellness.log_mood(new_mood, update=True):
-                                st.success("Mood updated successfully!")
-                                time.sleep(1)
+                                st.toast("Mood updated successfully!", icon="✅")
                                 st.rerun()
                             else:
                                 st.error("Failed to update mood entry.")
@@ -4553,8 +4914,7 @@ def show_wellness_page():
                         }
                         
                         if wellness.log_mood(new_mood):
-                            st.success("Mood logged successfully!")
-                            time.sleep(1)
+                            st.toast("Mood logged successfully!", icon="✅")
                             st.rerun()
                         else:
                             st.error("Failed to log mood.")
@@ -4563,15 +4923,8 @@ def show_wellness_page():
             if st.session_state.cached_content.get("wellness_tips"):
                 st.markdown("### Personalized Wellness Tips")
                 
-                tips = st.session_state.cached_content["wellness_tips"]
-                for tip in tips[:1]:  # Show just one tip to save space
-                    st.markdown(f"""
-                    <div style="background-color: #e8f5e9; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #4caf50;">
-                        <h4 style="margin-top: 0; color: #2e7d32;">{tip.get('tip', 'Wellness Tip')}</h4>
-                        <p>{tip.get('description', '')}</p>
-                        <p style="margin-bottom: 0;"><strong>Try this:</strong> {tip.get('practice', '')}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                # Show just one tip to save space
+                _html(_wellness_tips_html(st.session_state.cached_content["wellness_tips"])[0])
             else:
                 # Fallback wellness tip
                 st.markdown("""
@@ -4597,62 +4950,16 @@ def show_wellness_page():
         with col1:
             st.markdown("### Quick Relief (1-5 minutes)")
             
-            techniques = [
-                {
-                    "name": "Box Breathing",
-                    "description": "Inhale for 4 counts, hold for 4, exhale for 4, hold for 4. Repeat.",
-                    "benefits": "Reduces acute stress, lowers heart rate, improves focus",
-                    "when_to_use": "Before exams, during stressful situations, when feeling overwhelmed"
-                },
-                {
-                    "name": "5-4-3-2-1 Grounding",
-                    "description": "Name 5 things you see, 4 things you feel, 3 things you hear, 2 things you smell, and 1 thing you taste.",
-                    "benefits": "Interrupts anxiety spirals, brings awareness to the present moment",
-                    "when_to_use": "During anxiety attacks, when overthinking, when feeling disconnected"
-                },
-                {
-                    "name": "Progressive Muscle Relaxation",
-                    "description": "Tense and then release each muscle group in your body, from toes to head.",
-                    "benefits": "Releases physical tension, improves body awareness, reduces physical symptoms of stress",
-                    "when_to_use": "Before bed, after long study sessions, when feeling physically tense"
-                }
-            ]
-            
-            for technique in techniques:
+            for technique in _QUICK_RELIEF_TECHNIQUES:
                 with st.expander(f"📝 {technique['name']}"):
-                    st.write(f"**Description:** {technique['description']}")
-                    st.write(f"**Benefits:** {technique['benefits']}")
-                    st.write(f"**When to use:** {technique['when_to_use']}")
+                    st.markdown(_TECHNIQUE_DETAILS_TEMPLATE.format_map(technique))
         
         with col2:
             st.markdown("### Daily Practices (10-15 minutes)")
             
-            practices = [
-                {
-                    "name": "Guided Meditation",
-                    "description": "Follow along with a guided meditation focusing on breathing and awareness.",
-                    "benefits": "Reduces stress hormones, improves focus, builds emotional resilience",
-                    "when_to_use": "Morning routine, before studying, after a stressful day"
-                },
-                {
-                    "name": "Journaling",
-                    "description": "Write about your thoughts, feelings, and experiences without judgment.",
-                    "benefits": "Clarifies thinking, processes emotions, tracks patterns over time",
-                    "when_to_use": "End of day reflection, when processing complex emotions, for problem-solving"
-                },
-                {
-                    "name": "Physical Movement",
-                    "description": "Short yoga sequence, brisk walk, or simple stretching routine.",
-                    "benefits": "Releases endorphins, improves circulation, shifts mental state",
-                    "when_to_use": "Study breaks, when feeling stuck, to boost energy or focus"
-                }
-            ]
-            
-            for practice in practices:
+            for practice in _DAILY_PRACTICES:
                 with st.expander(f"🧘 {practice['name']}"):
-                    st.write(f"**Description:** {practice['description']}")
-                    st.write(f"**Benefits:** {practice['benefits']}")
-                    st.write(f"**When to use:** {practice['when_to_use']}")
+                    st.markdown(_TECHNIQUE_DETAILS_TEMPLATE.format_map(practice))
         
         # Interactive relaxation exercise
         st.subheader("Try Now: Guided Breathing Exercise")
@@ -4665,29 +4972,8 @@ def show_wellness_page():
         """, unsafe_allow_html=True)
         
         if st.button("Start 1-Minute Breathing Exercise"):
-            st.markdown("""
-            <div style="background-color: #f5f5f5; padding: 20px; border-radius: 10px; text-align: center; margin-top: 20px;">
-                <div id="breath-animation" style="font-size: 2rem; margin-bottom: 10px;">Inhale...</div>
-                <div id="instructions" style="font-size: 1.2rem;">Breathe in through your nose for 4 counts</div>
-                <div id="timer" style="font-size: 1.5rem; margin-top: 20px;">1:00</div>
-            </div>
-            
-            <script>
-                // This would be the breathing animation in a real implementation
-                // For the prototype, we just show the text
-            </script>
-            """, unsafe_allow_html=True)
-            
-            # Simulate the breathing exercise with text
-            for i in range(3):  # 3 breath cycles
-                st.markdown("### Inhale")
-                time.sleep(1)
-                st.markdown("### Hold")
-                time.sleep(1)
-                st.markdown("### Exhale")
-                time.sleep(1)
-            
-            st.success("Breathing exercise completed! How do you feel?")
+            # The inhale/hold/exhale cycle runs in the browser, so the script returns immediately
+            components.html(_BREATHING_EXERCISE_HTML, height=220)
         
         # Stress test assessment
         st.subheader("Stress Self-Assessment")
@@ -4719,21 +5005,10 @@ def show_wellness_page():
                     # Recommend specific techniques
                     st.markdown("### Recommended Techniques Based on Your Results")
                     
-                    if q1 > 3:
-                        st.markdown("""
-                        <div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #2196f3;">
-                            <h4 style="margin-top: 0; color: #0d47a1;">For Academic Overwhelm</h4>
-                            <p>Try the <strong>Pomodoro Technique</strong>: Work for 25 minutes, then take a 5-minute break. After 4 cycles, take a longer 15-30 minute break.</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                    
-                    if q2 > 3:
-                        st.markdown("""
-                        <div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #2196f3;">
-                            <h4 style="margin-top: 0; color: #0d47a1;">For Sleep Difficulties</h4>
-                            <p>Practice <strong>Progressive Muscle Relaxation</strong> before bed and create a consistent sleep routine. Avoid screens 1 hour before sleep.</p>
-                        </div>
-                        """, unsafe_allow_html=True)
+                    answers = (q1, q2, q3, q4, q5)
+                    cards = "".join(html for index, html in _STRESS_RECOMMENDATIONS if answers[index] > 3)
+                    if cards:
+                        _html(cards)
     
     # Resources tab
     with tab3:
@@ -4742,40 +5017,12 @@ def show_wellness_page():
         # Campus resources
         st.markdown("### Campus Support Services")
         
-        campus_resources = [
-            {
-                "name": "College Counseling Center",
-                "description": "Free confidential counseling services for students",
-                "contact": "Visit Student Center, 2nd Floor or call 123-456-7890",
-                "hours": "Mon-Fri: 9am-5pm"
-            },
-            {
-                "name": "Peer Support Network",
-                "description": "Trained student volunteers providing peer counseling and support",
-                "contact": "Email peer.support@college.edu",
-                "hours": "Available 24/7 via chat"
-            },
-            {
-                "name": "Wellness Workshops",
-                "description": "Regular workshops on stress management, mindfulness, and wellness",
-                "contact": "Check college events calendar for schedule",
-                "hours": "Typically held on Wednesdays at 4pm"
-            }
-        ]
-        
         col1, col2, col3 = st.columns(3)
         
-        for i, resource in enumerate(campus_resources):
+        for i, resource in enumerate(_CAMPUS_RESOURCES):
             col = [col1, col2, col3][i % 3]
             with col:
-                st.markdown(f"""
-                <div style="background-color: white; padding: 15px; border-radius: 8px; height: 100%; box-shadow: 0 2px 5px rgba(0,0,0,0.1);">
-                    <h4 style="margin-top: 0; color: #0a3d62;">{resource['name']}</h4>
-                    <p>{resource['description']}</p>
-                    <p><strong>Contact:</strong> {resource['contact']}</p>
-                    <p><strong>Hours:</strong> {resource['hours']}</p>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(_CAMPUS_RESOURCE_CARD_TEMPLATE.format_map(resource), unsafe_allow_html=True)
         
         # Crisis resources
         st.markdown("### Crisis Support Resources")
@@ -4796,72 +5043,18 @@ def show_wellness_page():
         # Apps and tools
         st.markdown("### Recommended Apps & Tools")
         
-        apps = [
-            {
-                "name": "Headspace",
-                "category": "Meditation",
-                "description": "Guided meditations for stress, focus, and sleep. Free with student plan.",
-                "link": "https://www.headspace.com/studentplan"
-            },
-            {
-                "name": "Calm",
-                "category": "Meditation & Sleep",
-                "description": "Sleep stories, meditations, and breathing exercises.",
-                "link": "https://www.calm.com/"
-            },
-            {
-                "name": "Wakeout",
-                "category": "Movement",
-                "description": "Quick exercises designed for studying breaks.",
-                "link": "https://wakeout.app/"
-            },
-            {
-                "name": "Reflectly",
-                "category": "Journaling",
-                "description": "AI-guided journaling app to track mood and build self-awareness.",
-                "link": "https://reflectly.app/"
-            },
-            {
-                "name": "Forest",
-                "category": "Focus",
-                "description": "Stay focused and present by growing virtual trees.",
-                "link": "https://www.forestapp.cc/"
-            },
-            {
-                "name": "Finch",
-                "category": "Self-Care",
-                "description": "Self-care pet game that helps build healthy habits.",
-                "link": "https://finchcare.com/"
-            }
-        ]
-        
         col1, col2 = st.columns(2)
         
-        for i, app in enumerate(apps):
+        for i, app in enumerate(_WELLNESS_APPS):
             col = col1 if i % 2 == 0 else col2
             with col:
-                st.markdown(f"""
-                <div style="background-color: #f5f5f5; padding: 15px; border-radius: 8px; margin-bottom: 15px;">
-                    <h4 style="margin-top: 0; color: #0a3d62;">{app['name']}</h4>
-                    <p><strong>Category:</strong> {app['category']}</p>
-                    <p>{app['description']}</p>
-                    <a href="{app['link']}" target="_blank">Learn More</a>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(_WELLNESS_APP_CARD_TEMPLATE.format_map(app), unsafe_allow_html=True)
         
         # AI-powered wellness articles if available
         if st.session_state.cached_content.get("wellness_tips"):
             st.markdown("### Latest Wellness Articles")
             
-            tips = st.session_state.cached_content["wellness_tips"]
-            for i, tip in enumerate(tips):
-                st.markdown(f"""
-                <div style="background-color: #e8f5e9; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #4caf50;">
-                    <h4 style="margin-top: 0; color: #2e7d32;">Article: {tip.get('tip', 'Wellness Tip')}</h4>
-                    <p>{tip.get('description', '')}</p>
-                    <p style="margin-bottom: 0;"><strong>Practice:</strong> {tip.get('practice', '')}</p>
-                </div>
-                """, unsafe_allow_html=True)
+            _html(_wellness_tips_html(st.session_state.cached_content["wellness_tips"])[1])
     
     # Wellness Chatbot tab
     with tab4:
@@ -4875,35 +5068,13 @@ def show_wellness_page():
         else:
             st.write("Ask anything about mental health, stress management, emotional well-being, or self-care.")
             
-            # Initialize wellness chat history if it doesn't exist
-            if 'wellness_chat_history' not in st.session_state:
-                st.session_state.wellness_chat_history = []
-            
             # Display wellness chat history
-            if st.session_state.wellness_chat_history:
-                st.markdown('<div style="background-color: #f8f9fa; padding: 15px; border-radius: 8px; margin-bottom: 20px; max-height: 400px; overflow-y: auto;">', unsafe_allow_html=True)
-                
-                for i, (role, message) in enumerate(st.session_state.wellness_chat_history):
-                    if role == "user":
-                        st.markdown(f'<div style="background-color: #e7f5fe; padding: 10px; border-radius: 15px 15px 5px 15px; margin-bottom: 10px; margin-left: 20px;"><strong>You:</strong> {message}</div>', unsafe_allow_html=True)
-                    else:
-                        st.markdown(f'<div style="background-color: #f0f0f0; padding: 10px; border-radius: 15px 15px 15px 5px; margin-bottom: 10px;"><strong>Wellness Assistant:</strong> {message}</div>', unsafe_allow_html=True)
-                
-                st.markdown('</div>', unsafe_allow_html=True)
+            _render_chat_history(st.session_state.wellness_chat_history, "Wellness Assistant")
             
             # Show AI-generated wellness tips if available
             if st.session_state.cached_content.get("wellness_tips") and not st.session_state.wellness_chat_history:
                 st.markdown("### AI-Generated Wellness Insights")
-                tips = st.session_state.cached_content["wellness_tips"]
-                
-                for tip in tips:
-                    st.markdown(f"""
-                    <div style="background-color: #e8f5e9; padding: 15px; border-radius: 8px; margin-bottom: 15px; border-left: 4px solid #4caf50;">
-                        <h4 style="margin-top: 0; color: #2e7d32;">{tip.get('tip', 'Wellness Tip')}</h4>
-                        <p>{tip.get('description', '')}</p>
-                        <p style="margin-bottom: 0;"><strong>Practice:</strong> {tip.get('practice', '')}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                _html(_wellness_tips_html(st.session_state.cached_content["wellness_tips"])[2])
             
             # Input for wellness question
             wellness_query = st.text_input("Ask about stress, emotions, self-care, relationships, etc.", key="wellness_query")
@@ -4914,14 +5085,7 @@ def show_wellness_page():
                     st.session_state.wellness_chat_history.append(("user", wellness_query))
                     
                     # Prepare student context for more personalized answers
-                    student_context = None
-                    if st.session_state.student_profile:
-                        profile = st.session_state.student_profile
-                        student_context = {
-                            "degree": profile.get_degree(),
-                            "year": profile.get_year_of_study(),
-                            "college": profile.get_college_name()
-                        }
+                    student_context = _student_context()
                     
                     # Get AI response for mental health specifically
                     with st.spinner("Researching your wellness question..."):
@@ -4935,28 +5099,185 @@ def show_wellness_page():
                     # Force a rerun to show the updated chat
                     st.rerun()
 
+# Choices for the career profile form
+_CAREER_INTEREST_OPTIONS = (
+    "Software Development", "Data Science", "Artificial Intelligence",
+    "Product Management", "UX/UI Design", "Marketing",
+    "Finance", "Consulting", "Research", "Teaching",
+    "Entrepreneurship", "Healthcare", "Government/Public Service"
+)
+
+# Career page styles, emitted once per run so the card templates below carry class names instead of inline styles
+_CAREER_CSS = """<style>
+.tag-row {display: flex; flex-wrap: wrap; gap: 10px;}
+.career-tag {padding: 5px 15px; border-radius: 20px; font-size: 0.9rem;}
+.career-tag.interest {background-color: #e1f5fe; color: #0277bd;}
+.career-tag.role {background-color: #fff8e1; color: #ff8f00;}
+.assessment-card {padding: 10px; border-radius: 5px; margin-bottom: 10px;}
+.assessment-card.strength {background-color: #e8f5e9; border-left: 4px solid #4caf50;}
+.assessment-card.improvement {background-color: #fff3e0; border-left: 4px solid #ff9800;}
+.skill-row {margin-bottom: 20px;}
+.skill-head {display: flex; justify-content: space-between; margin-bottom: 5px;}
+.skill-track {background-color: #f0f0f0; border-radius: 5px; height: 10px; width: 100%;}
+.skill-fill {background-color: #4caf50; border-radius: 5px; height: 10px;}
+.opp-card {background-color: white; padding: 15px; border-radius: 8px; margin-bottom: 15px; box-shadow: 0 2px 5px rgba(0,0,0,0.1);}
+.opp-card h4 {margin-top: 0; color: #0a3d62;}
+.opp-meta, .opp-foot {display: flex; justify-content: space-between;}
+.opp-meta {margin-bottom: 10px;}
+.opp-foot {align-items: center;}
+.opp-relevance {background-color: #e3f2fd; color: #0d47a1; padding: 5px 10px; border-radius: 5px; font-size: 0.9rem;}
+.opp-link {background-color: #0a3d62; color: white; padding: 5px 15px; border-radius: 20px; text-decoration: none; font-size: 0.9rem;}
+.career-news-grid {display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;}
+.career-news-card {background-color: #f5f5f5; padding: 15px; border-radius: 8px; height: 100%; box-shadow: 0 2px 5px rgba(0,0,0,0.05);}
+.career-news-card h4 {margin-top: 0; color: #0a3d62;}
+.career-news-card p {color: #666; font-size: 0.9rem;}
+</style>"""
+
+# Career profile tags and self-assessment cards; each list renders as one HTML element
+_TAG_ROW_TEMPLATE = '<div class="tag-row">{}</div>'
+_INTEREST_TAG_TEMPLATE = '<div class="career-tag interest">{}</div>'
+_ROLE_TAG_TEMPLATE = '<div class="career-tag role">{}</div>'
+_STRENGTH_CARD_TEMPLATE = '<div class="assessment-card strength">{}</div>'
+_IMPROVEMENT_CARD_TEMPLATE = '<div class="assessment-card improvement">{}</div>'
+
+# Skills tab progress bars; width is the level as a percentage of 5
+_SKILL_ROW_TEMPLATE = (
+    '<div class="skill-row">'
+    '<div class="skill-head"><div><strong>{name}</strong></div><div>{label}</div></div>'
+    '<div class="skill-track"><div class="skill-fill" style="width: {width}%;"></div></div>'
+    '</div>'
+)
+_SKILL_CERTIFICATIONS_TEMPLATE = '<p><strong>Certifications:</strong> {}</p>'
+
+# Opportunities tab cards and the career news grid
+_OPPORTUNITY_CARD_TEMPLATE = (
+    '<div class="opp-card"><h4>{title}</h4>'
+    '<div class="opp-meta"><div><strong>Organization:</strong> {organization}</div>'
+    '<div><strong>Deadline:</strong> {deadline}</div></div>'
+    '<p>{description}</p>'
+    '<div class="opp-foot"><div class="opp-relevance"><strong>Why it\'s relevant:</strong> {relevance}</div>'
+    '<a href="{link}" target="_blank" class="opp-link">View Details</a></div>'
+    '</div>'
+)
+_CAREER_NEWS_GRID_TEMPLATE = '<div class="career-news-grid">{}</div>'
+_CAREER_NEWS_CARD_TEMPLATE = '<div class="career-news-card"><h4>{title}</h4><p>{date} • {source}</p></div>'
+
+# Skill suggestions for the first matching career interest, checked in this order
+_INTEREST_SKILL_RECOMMENDATIONS = {
+    "Software Development": (
+        '<div style="background-color: #e8f5e9; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #4caf50;">'
+        '<p><strong>For Software Development:</strong> Cloud computing (AWS/Azure), Containerization (Docker), CI/CD pipelines</p>'
+        '</div>'
+    ),
+    "Data Science": (
+        '<div style="background-color: #e8f5e9; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #4caf50;">'
+        '<p><strong>For Data Science:</strong> MLOps, PyTorch, Data Visualization (Tableau/PowerBI)</p>'
+        '</div>'
+    ),
+}
+
+# Static career page blocks: empty states, the skill level reference and fallback preparation tips
+_NO_CAREER_PROFILE_HTML = """
+<div style="background-color: #f9f9f9; border: 1px dashed #ddd; border-radius: 8px; padding: 30px; text-align: center; margin-bottom: 20px;">
+    <h3 style="color: #666; margin-bottom: 15px;">No career profile set up yet</h3>
+    <p style="color: #888;">Complete your career profile using the form on the right to get personalized career recommendations.</p>
+</div>
+"""
+
+_NO_SKILLS_HTML = """
+<div style="background-color: #f9f9f9; border: 1px dashed #ddd; border-radius: 8px; padding: 30px; text-align: center; margin-bottom: 20px;">
+    <h3 style="color: #666; margin-bottom: 15px;">No skills tracked yet</h3>
+    <p style="color: #888;">Add your skills using the form on the right to track your development.</p>
+</div>
+"""
+
+_SKILL_LEVEL_REFERENCE_HTML = """
+<div style="background-color: #f5f5f5; padding: 15px; border-radius: 8px; margin-top: 15px;">
+    <p><strong>Level 1 (Beginner):</strong> Basic understanding, need supervision</p>
+    <p><strong>Level 2 (Basic):</strong> Can perform with guidance, understand fundamentals</p>
+    <p><strong>Level 3 (Intermediate):</strong> Work independently on routine tasks</p>
+    <p><strong>Level 4 (Advanced):</strong> Deep knowledge, can teach others, handle complex tasks</p>
+    <p><strong>Level 5 (Expert):</strong> Exceptional capability, thought leadership, innovate in this area</p>
+</div>
+"""
+
+_CAREER_PREP_TIPS_HTML = """
+<div style="background-color: #f5f5f5; padding: 15px; border-radius: 8px; margin-top: 15px;">
+    <h4 style="margin-top: 0;">Resume Building Tips</h4>
+    <ul style="margin-bottom: 0;">
+        <li>Quantify achievements with specific metrics when possible</li>
+        <li>Tailor your resume for each application</li>
+        <li>Include relevant projects and their impact</li>
+        <li>Keep it concise - 1 page for students/recent graduates</li>
+    </ul>
+</div>
+
+<div style="background-color: #f5f5f5; padding: 15px; border-radius: 8px; margin-top: 15px;">
+    <h4 style="margin-top: 0;">Interview Preparation</h4>
+    <ul style="margin-bottom: 0;">
+        <li>Research the company and role thoroughly</li>
+        <li>Prepare STAR (Situation, Task, Action, Result) stories</li>
+        <li>Practice with mock interviews</li>
+        <li>Prepare thoughtful questions to ask interviewers</li>
+    </ul>
+</div>
+"""
+
+# Process-wide and keyed on each student's skill averages, so bounded like the other figure caches
+@st.cache_data(show_spinner=False, max_entries=64)
+def _skills_radar_fig(categories, levels):
+    """Radar chart of average skill level per category, memoized on the (categories, levels) tuples"""
+    import plotly.graph_objects as go
+    
+    # Repeat the first category to close the polygon
+    fig = go.Figure(go.Scatterpolar(
+        r=levels + levels[:1],
+        theta=categories + categories[:1],
+        fill='toself',
+        name='Skills'
+    ))
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 5]
+            )
+        ),
+        showlegend=False
+    )
+    return fig
+
+def _clean_lines(text):
+    """Non-empty, stripped lines of a one-item-per-line text area"""
+    return [line for line in map(str.strip, text.splitlines()) if line]
+
 # Career Pathway page
 def show_career_page():
     st.title("Career Pathway")
+    st.markdown(_CAREER_CSS, unsafe_allow_html=True)
     
     # Show guidance for first-time visitors
     show_section_guidance("Career")
     
     career = st.session_state.career_guide
     
+    # AI career insights, read once for every tab, and the first one whose action is about skills
+    insights = st.session_state.cached_content.get("career_insights") or []
+    skill_insight = next((insight for insight in insights if "skill" in (insight.get("action") or "").lower()), None)
+    
     # Create tabs for different career features
     tab1, tab2, tab3, tab4 = st.tabs(["Career Profile", "Skills Tracker", "Opportunities", "Career Advisor"])
     
     # Career Profile tab
     with tab1:
+        # Get profile data once for both the profile view and the update form
+        career_profile = career.get_career_profile() or {}
+        
         col1, col2 = st.columns([2, 1])
         
         with col1:
             st.subheader("Your Career Profile")
             
-            # Get profile data
-            career_profile = career.get_career_profile()
-            
             if career_profile:
                 # Display career readiness score
                 career_readiness = career.get_career_readiness_score()
@@ -4980,14 +5301,7 @@ def show_career_page():
                     st.write(f"**Your Interests:** {interest_text}")
                     
                     # Display as tags
-                    st.markdown('<div style="display: flex; flex-wrap: wrap; gap: 10px;">', unsafe_allow_html=True)
-                    for interest in interests:
-                        st.markdown(f"""
-                        <div style="background-color: #e1f5fe; color: #0277bd; padding: 5px 15px; border-radius: 20px; font-size: 0.9rem;">
-                            {interest}
-                        </div>
-                        """, unsafe_allow_html=True)
-                    st.markdown('</div>', unsafe_allow_html=True)
+                    _html(_TAG_ROW_TEMPLATE.format("".join(map(_INTEREST_TAG_TEMPLATE.format, interests))))
                 else:
                     st.info("No career interests specified yet. Update your profile to add your interests.")
                 
@@ -4996,14 +5310,7 @@ def show_career_page():
                 
                 target_roles = career_profile.get('target_roles', [])
                 if target_roles:
-                    st.markdown('<div style="display: flex; flex-wrap: wrap; gap: 10px;">', unsafe_allow_html=True)
-                    for role in target_roles:
-                        st.markdown(f"""
-                        <div style="background-color: #fff8e1; color: #ff8f00; padding: 5px 15px; border-radius: 20px; font-size: 0.9rem;">
-                            {role}
-                        </div>
-                        """, unsafe_allow_html=True)
-                    st.markdown('</div>', unsafe_allow_html=True)
+                    _html(_TAG_ROW_TEMPLATE.format("".join(map(_ROLE_TAG_TEMPLATE.format, target_roles))))
                 else:
                     st.info("No target roles specified yet. Update your profile to add your target roles.")
                 
@@ -5018,54 +5325,32 @@ def show_career_page():
                 with col1:
                     st.markdown("#### Strengths")
                     if strengths:
-                        for strength in strengths:
-                            st.markdown(f"""
-                            <div style="background-color: #e8f5e9; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 4px solid #4caf50;">
-                                {strength}
-                            </div>
-                            """, unsafe_allow_html=True)
+                        _html("".join(map(_STRENGTH_CARD_TEMPLATE.format, strengths)))
                     else:
                         st.info("No strengths added yet.")
                 
                 with col2:
                     st.markdown("#### Areas for Improvement")
                     if weaknesses:
-                        for weakness in weaknesses:
-                            st.markdown(f"""
-                            <div style="background-color: #fff3e0; padding: 10px; border-radius: 5px; margin-bottom: 10px; border-left: 4px solid #ff9800;">
-                                {weakness}
-                            </div>
-                            """, unsafe_allow_html=True)
+                        _html("".join(map(_IMPROVEMENT_CARD_TEMPLATE.format, weaknesses)))
                     else:
                         st.info("No areas for improvement added yet.")
             else:
                 # Empty state
-                st.markdown("""
-                <div style="background-color: #f9f9f9; border: 1px dashed #ddd; border-radius: 8px; padding: 30px; text-align: center; margin-bottom: 20px;">
-                    <h3 style="color: #666; margin-bottom: 15px;">No career profile set up yet</h3>
-                    <p style="color: #888;">Complete your career profile using the form on the right to get personalized career recommendations.</p>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(_NO_CAREER_PROFILE_HTML, unsafe_allow_html=True)
         
         with col2:
             st.subheader("Update Career Profile")
             
             with st.form("career_profile_form"):
-                # Get current profile data
-                current_profile = career.get_career_profile() or {}
+                # Current profile data pre-fills the form
+                current_profile = career_profile
                 
                 # Career interests multi-select
-                interest_options = [
-                    "Software Development", "Data Science", "Artificial Intelligence", 
-                    "Product Management", "UX/UI Design", "Marketing", 
-                    "Finance", "Consulting", "Research", "Teaching",
-                    "Entrepreneurship", "Healthcare", "Government/Public Service"
-                ]
-                
                 current_interests = current_profile.get('interests', [])
                 selected_interests = st.multiselect(
                     "Career Interests", 
-                    options=interest_options, 
+                    options=_CAREER_INTEREST_OPTIONS, 
                     default=current_interests
                 )
                 
@@ -5096,9 +5381,9 @@ def show_career_page():
                 
                 if submitted:
                     # Process target roles, strengths, and weaknesses from text areas
-                    target_roles_list = [role.strip() for role in target_roles.split('\n') if role.strip()]
-                    strengths_list = [s.strip() for s in strengths.split('\n') if s.strip()]
-                    weaknesses_list = [w.strip() for w in weaknesses.split('\n') if w.strip()]
+                    target_roles_list = _clean_lines(target_roles)
+                    strengths_list = _clean_lines(strengths)
+                    weaknesses_list = _clean_lines(weaknesses)
                     
                     # Create profile data
                     profile_data = {
@@ -5111,17 +5396,15 @@ def show_career_page():
                     
                     # Save profile
                     if career.update_career_profile(profile_data):
-                        st.success("Career profile updated successfully!")
-                        time.sleep(1)
+                        st.toast("Career profile updated successfully!", icon="✅")
                         st.rerun()
                     else:
                         st.error("Failed to update career profile.")
             
             # AI career insights if available
-            if st.session_state.cached_content.get("career_insights"):
+            if insights:
                 st.markdown("### Industry Insights")
                 
-                insights = st.session_state.cached_content["career_insights"]
                 for insight in insights[:1]:  # Show just one insight to save space
                     st.markdown(f"""
                     <div style="background-color: #f3e5f5; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #9c27b0;">
@@ -5142,111 +5425,50 @@ def show_career_page():
             skills = career.get_skills()
             
             if skills:
-                # Group skills by category
-                skills_by_category = {}
+                # Group skills by category, totalling levels in the same pass for the radar averages
+                skills_by_category = defaultdict(list)
+                level_totals = defaultdict(float)
                 for skill in skills:
                     category = skill.get('category', 'Other')
-                    if category not in skills_by_category:
-                        skills_by_category[category] = []
                     skills_by_category[category].append(skill)
+                    level_totals[category] += skill.get('level', 1)
                 
                 # Display skills by category
                 for category, category_skills in skills_by_category.items():
                     st.markdown(f"### {category}")
                     
+                    # A progress bar per skill, plus its certifications if any, as one HTML element
+                    html_parts = []
                     for skill in category_skills:
-                        skill_name = skill.get('name', 'Unnamed Skill')
                         skill_level = skill.get('level', 1)
+                        html_parts.append(_SKILL_ROW_TEMPLATE.format(
+                            name=skill.get('name', 'Unnamed Skill'),
+                            label=get_level_label(skill_level),
+                            width=skill_level * 20
+                        ))
                         skill_certifications = skill.get('certifications', [])
-                        
-                        # Create a progress bar for skill level
-                        st.markdown(f"""
-                        <div style="margin-bottom: 20px;">
-                            <div style="display: flex; justify-content: space-between; margin-bottom: 5px;">
-                                <div><strong>{skill_name}</strong></div>
-                                <div>{get_level_label(skill_level)}</div>
-                            </div>
-                            <div style="background-color: #f0f0f0; border-radius: 5px; height: 10px; width: 100%;">
-                                <div style="background-color: #4caf50; border-radius: 5px; height: 10px; width: {skill_level * 20}%;"></div>
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        # Display certifications if any
                         if skill_certifications:
-                            cert_text = ", ".join(skill_certifications)
-                            st.markdown(f"**Certifications:** {cert_text}")
+                            html_parts.append(_SKILL_CERTIFICATIONS_TEMPLATE.format(", ".join(skill_certifications)))
+                    _html("".join(html_parts))
                 
                 # Skills visualization
                 st.subheader("Skills Overview")
                 
                 # Create radar chart data
-                categories = list(skills_by_category.keys())
-                avg_levels = []
+                categories = tuple(skills_by_category)
+                avg_levels = tuple(level_totals[category] / len(skills_by_category[category]) for category in categories)
                 
-                for category in categories:
-                    category_skills = skills_by_category[category]
-                    avg_level = sum(skill.get('level', 1) for skill in category_skills) / len(category_skills)
-                    avg_levels.append(avg_level)
-                
-                # Add the first category again to close the radar chart
                 if categories:
-                    categories.append(categories[0])
-                    avg_levels.append(avg_levels[0])
-                
-                    fig = go.Figure()
-                    fig.add_trace(go.Scatterpolar(
-                        r=avg_levels,
-                        theta=categories,
-                        fill='toself',
-                        name='Skills'
-                    ))
-                    
-                    fig.update_layout(
-                        polar=dict(
-                            radialaxis=dict(
-                                visible=True,
-                                range=[0, 5]
-                            )
-                        ),
-                        showlegend=False
-                    )
-                    
-                    st.plotly_chart(fig, use_container_width=True)
+                    st.plotly_chart(_skills_radar_fig(categories, avg_levels), use_container_width=True)
             else:
                 # Empty state
-                st.markdown("""
-                <div style="background-color: #f9f9f9; border: 1px dashed #ddd; border-radius: 8px; padding: 30px; text-align: center; margin-bottom: 20px;">
-                    <h3 style="color: #666; margin-bottom: 15px;">No skills tracked yet</h3>
-                    <p style="color: #888;">Add your skills using the form on the right to track your development.</p>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(_NO_SKILLS_HTML, unsafe_allow_html=True)
                 
                 # Sample skills visualization
                 st.subheader("Sample Skills Overview (What you'll see)")
                 
                 # Sample radar chart data
-                sample_categories = ["Technical", "Communication", "Leadership", "Problem-Solving", "Technical"]
-                sample_levels = [3.5, 4, 2.5, 4, 3.5]
-                
-                fig = go.Figure()
-                fig.add_trace(go.Scatterpolar(
-                    r=sample_levels,
-                    theta=sample_categories,
-                    fill='toself',
-                    name='Skills'
-                ))
-                
-                fig.update_layout(
-                    polar=dict(
-                        radialaxis=dict(
-                            visible=True,
-                            range=[0, 5]
-                        )
-                    ),
-                    showlegend=False
-                )
-                
+                fig = _skills_radar_fig(("Technical", "Communication", "Leadership", "Problem-Solving"), (3.5, 4, 2.5, 4))
                 st.plotly_chart(fig, use_container_width=True)
         
         with col2:
@@ -5285,7 +5507,7 @@ def show_career_page():
                 if submitted:
                     if skill_name:
                         # Process certifications from text area
-                        certification_list = [cert.strip() for cert in certifications.split('\n') if cert.strip()]
+                        certification_list = _clean_lines(certifications)
                         
                         # Create skill data
                         skill_data = {
@@ -5299,8 +5521,7 @@ def show_career_page():
                         
                         # Save skill
                         if career.update_skill(skill_data):
-                            st.success("Skill added/updated successfully!")
-                            time.sleep(1)
+                            st.toast("Skill added/updated successfully!", icon="✅")
                             st.rerun()
                         else:
                             st.error("Failed to add/update skill.")
@@ -5309,15 +5530,7 @@ def show_career_page():
             
             # Skill level reference
             st.markdown("### Skill Level Reference")
-            st.markdown("""
-            <div style="background-color: #f5f5f5; padding: 15px; border-radius: 8px; margin-top: 15px;">
-                <p><strong>Level 1 (Beginner):</strong> Basic understanding, need supervision</p>
-                <p><strong>Level 2 (Basic):</strong> Can perform with guidance, understand fundamentals</p>
-                <p><strong>Level 3 (Intermediate):</strong> Work independently on routine tasks</p>
-                <p><strong>Level 4 (Advanced):</strong> Deep knowledge, can teach others, handle complex tasks</p>
-                <p><strong>Level 5 (Expert):</strong> Exceptional capability, thought leadership, innovate in this area</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_SKILL_LEVEL_REFERENCE_HTML, unsafe_allow_html=True)
             
             # Personalized skill recommendations based on career interests
             career_profile = career.get_career_profile() or {}
@@ -5327,30 +5540,20 @@ def show_career_page():
                 st.markdown("### Recommended Skills to Develop")
                 
                 # AI-generated recommendations if available
-                if st.session_state.cached_content.get("career_insights"):
-                    insights = st.session_state.cached_content["career_insights"]
-                    for insight in insights:
-                        if "skill" in insight.get("action", "").lower():
-                            st.markdown(f"""
-                            <div style="background-color: #f3e5f5; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #9c27b0;">
-                                <p><strong>Based on Industry Trends:</strong> {insight.get('action', '')}</p>
-                            </div>
-                            """, unsafe_allow_html=True)
-                            break
-                
-                # Otherwise show static recommendations based on interests
-                if "Software Development" in interests:
-                    st.markdown("""
-                    <div style="background-color: #e8f5e9; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #4caf50;">
-                        <p><strong>For Software Development:</strong> Cloud computing (AWS/Azure), Containerization (Docker), CI/CD pipelines</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                elif "Data Science" in interests:
-                    st.markdown("""
-                    <div style="background-color: #e8f5e9; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #4caf50;">
-                        <p><strong>For Data Science:</strong> MLOps, PyTorch, Data Visualization (Tableau/PowerBI)</p>
+                if skill_insight:
+                    st.markdown(f"""
+                    <div style="background-color: #f3e5f5; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #9c27b0;">
+                        <p><strong>Based on Industry Trends:</strong> {skill_insight.get('action', '')}</p>
                     </div>
                     """, unsafe_allow_html=True)
+                
+                # Otherwise show static recommendations based on interests
+                interest_set = frozenset(interests)
+                recommendation = next(
+                    (html for interest, html in _INTEREST_SKILL_RECOMMENDATIONS.items() if interest in interest_set), None
+                )
+                if recommendation:
+                    _html(recommendation)
     
     # Opportunities tab
     with tab3:
@@ -5360,7 +5563,7 @@ def show_career_page():
         student = st.session_state.student_profile
         
         # Generate opportunities
-        opportunities = generate_personalized_opportunities(student)
+        opportunities = _opportunities(student)
         
         # Filters for opportunities
         col1, col2, col3 = st.columns(3)
@@ -5386,23 +5589,7 @@ def show_career_page():
         
         # Display opportunities with filtering logic (simplified for prototype)
         if opportunities:
-            for opportunity in opportunities:
-                st.markdown(f"""
-                <div style="background-color: white; padding: 15px; border-radius: 8px; margin-bottom: 15px; box-shadow: 0 2px 5px rgba(0,0,0,0.1);">
-                    <h4 style="margin-top: 0; color: #0a3d62;">{opportunity["title"]}</h4>
-                    <div style="display: flex; justify-content: space-between; margin-bottom: 10px;">
-                        <div><strong>Organization:</strong> {opportunity["organization"]}</div>
-                        <div><strong>Deadline:</strong> {opportunity["deadline"]}</div>
-                    </div>
-                    <p>{opportunity["description"]}</p>
-                    <div style="display: flex; justify-content: space-between; align-items: center;">
-                        <div style="background-color: #e3f2fd; color: #0d47a1; padding: 5px 10px; border-radius: 5px; font-size: 0.9rem;">
-                            <strong>Why it's relevant:</strong> {opportunity["relevance"]}
-                        </div>
-                        <a href="{opportunity["link"]}" target="_blank" style="background-color: #0a3d62; color: white; padding: 5px 15px; border-radius: 20px; text-decoration: none; font-size: 0.9rem;">View Details</a>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+            _html("".join(map(_OPPORTUNITY_CARD_TEMPLATE.format_map, opportunities)))
         else:
             st.info("No matching opportunities found. Try adjusting your filters or complete your career profile for better matches.")
         
@@ -5412,26 +5599,14 @@ def show_career_page():
         # Fetch career news from cache or AI
         career_news = fetch_trending_news("career")
         
-        # Display news cards
-        col1, col2, col3 = st.columns(3)
-        columns = [col1, col2, col3]
-        
-        for i, news in enumerate(career_news):
-            with columns[i % 3]:
-                st.markdown(f"""
-                <div style="background-color: #f5f5f5; padding: 15px; border-radius: 8px; height: 100%; box-shadow: 0 2px 5px rgba(0,0,0,0.05);">
-                    <h4 style="margin-top: 0; color: #0a3d62;">{news['title']}</h4>
-                    <p style="color: #666; font-size: 0.9rem;">{news['date']} • {news['source']}</p>
-                </div>
-                """, unsafe_allow_html=True)
+        # Display news cards three to a row
+        _html(_CAREER_NEWS_GRID_TEMPLATE.format("".join(map(_CAREER_NEWS_CARD_TEMPLATE.format_map, career_news))))
         
         # Career preparation tips
         st.subheader("Career Preparation Tips")
         
         # Use AI-generated career insights if available
-        if st.session_state.cached_content.get("career_insights"):
-            insights = st.session_state.cached_content["career_insights"]
-            
+        if insights:
             for insight in insights:
                 st.markdown(f"""
                 <div style="background-color: #f3e5f5; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #9c27b0;">
@@ -5442,27 +5617,7 @@ def show_career_page():
                 """, unsafe_allow_html=True)
         else:
             # Fallback career tips
-            st.markdown("""
-            <div style="background-color: #f5f5f5; padding: 15px; border-radius: 8px; margin-top: 15px;">
-                <h4 style="margin-top: 0;">Resume Building Tips</h4>
-                <ul style="margin-bottom: 0;">
-                    <li>Quantify achievements with specific metrics when possible</li>
-                    <li>Tailor your resume for each application</li>
-                    <li>Include relevant projects and their impact</li>
-                    <li>Keep it concise - 1 page for students/recent graduates</li>
-                </ul>
-            </div>
-            
-            <div style="background-color: #f5f5f5; padding: 15px; border-radius: 8px; margin-top: 15px;">
-                <h4 style="margin-top: 0;">Interview Preparation</h4>
-                <ul style="margin-bottom: 0;">
-                    <li>Research the company and role thoroughly</li>
-                    <li>Prepare STAR (Situation, Task, Action, Result) stories</li>
-                    <li>Practice with mock interviews</li>
-                    <li>Prepare thoughtful questions to ask interviewers</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_CAREER_PREP_TIPS_HTML, unsafe_allow_html=True)
     
     # Career Advisor tab
     with tab4:
@@ -5476,26 +5631,12 @@ def show_career_page():
         else:
             st.write("Ask anything about career planning, job search, resume building, interviews, or professional development.")
             
-            # Initialize career chat history if it doesn't exist
-            if 'career_chat_history' not in st.session_state:
-                st.session_state.career_chat_history = []
-            
             # Display career chat history
-            if st.session_state.career_chat_history:
-                st.markdown('<div style="background-color: #f8f9fa; padding: 15px; border-radius: 8px; margin-bottom: 20px; max-height: 400px; overflow-y: auto;">', unsafe_allow_html=True)
-                
-                for i, (role, message) in enumerate(st.session_state.career_chat_history):
-                    if role == "user":
-                        st.markdown(f'<div style="background-color: #e7f5fe; padding: 10px; border-radius: 15px 15px 5px 15px; margin-bottom: 10px; margin-left: 20px;"><strong>You:</strong> {message}</div>', unsafe_allow_html=True)
-                    else:
-                        st.markdown(f'<div style="background-color: #f0f0f0; padding: 10px; border-radius: 15px 15px 15px 5px; margin-bottom: 10px;"><strong>Career Advisor:</strong> {message}</div>', unsafe_allow_html=True)
-                
-                st.markdown('</div>', unsafe_allow_html=True)
+            _render_chat_history(st.session_state.career_chat_history, "Career Advisor")
             
             # Show AI-generated career insights if available
-            if st.session_state.cached_content.get("career_insights") and not st.session_state.career_chat_history:
+            if insights and not st.session_state.career_chat_history:
                 st.markdown("### AI-Generated Career Insights")
-                insights = st.session_state.cached_content["career_insights"]
                 
                 for insight in insights:
                     st.markdown(f"""
@@ -5514,25 +5655,8 @@ def show_career_page():
                     # Add user message to career chat history
                     st.session_state.career_chat_history.append(("user", career_query))
                     
-                    # Context from career profile
-                    career_profile = career.get_career_profile() or {}
-                    interests = career_profile.get('interests', [])
-                    target_roles = career_profile.get('target_roles', [])
-                    
-                    interests_text = ", ".join(interests) if interests else "Not specified"
-                    roles_text = ", ".join(target_roles) if target_roles else "Not specified"
-                    
-                    # Prepare student context for more personalized answers
-                    student_context = None
-                    if st.session_state.student_profile:
-                        profile = st.session_state.student_profile
-                        student_context = {
-                            "degree": profile.get_degree(),
-                            "year": profile.get_year_of_study(),
-                            "college": profile.get_college_name(),
-                            "career_interests": interests_text,
-                            "target_roles": roles_text
-                        }
+                    # Prepare student context, with the career profile, for more personalized answers
+                    student_context = _student_context(**_career_context(career))
                     
                     # Get AI response for career specifically
                     with st.spinner("Researching your career question..."):
@@ -5655,12 +5779,12 @@ def show_resources_page():
                         """, unsafe_allow_html=True)
                 else:
                     # Fallback with static recommendations based on query
-                    if "python" in search_query.lower():
-                        show_python_resources()
-                    elif "machine learning" in search_query.lower() or "data science" in search_query.lower():
-                        show_data_science_resources()
-                    elif "english" in search_query.lower() or "communication" in search_query.lower():
-                        show_communication_resources()
+                    query_lower = search_query.lower()
+                    show_topic = next(
+                        (handler for keyword, handler in _RESOURCE_TOPIC_HANDLERS if keyword in query_lower), None
+                    )
+                    if show_topic:
+                        show_topic()
                     else:
                         st.info(f"Showing general resources related to '{search_query}'")
                         show_general_resources(search_query)
@@ -6022,10 +6146,6 @@ def show_resources_page():
         else:
             st.write("Ask anything about finding specific learning resources, study materials, or how to access academic resources.")
             
-            # Initialize resource chat history if it doesn't exist
-            if 'resource_chat_history' not in st.session_state:
-                st.session_state.resource_chat_history = []
-            
             # Display resource chat history
             if st.session_state.resource_chat_history:
                 st.markdown('<div style="background-color: #f8f9fa; padding: 15px; border-radius: 8px; margin-bottom: 20px; max-height: 400px; overflow-y: auto;">', unsafe_allow_html=True)
@@ -6059,14 +6179,7 @@ def show_resources_page():
                     st.session_state.resource_chat_history.append(("user", resource_query))
                     
                     # Prepare student context for more personalized answers
-                    student_context = None
-                    if st.session_state.student_profile:
-                        profile = st.session_state.student_profile
-                        student_context = {
-                            "degree": profile.get_degree(),
-                            "year": profile.get_year_of_study(),
-                            "college": profile.get_college_name()
-                        }
+                    student_context = _student_context()
                     
                     # Get AI response for resources specifically
                     with st.spinner("Searching for resources..."):
@@ -6275,6 +6388,15 @@ def show_communication_resources():
         </div>
         """, unsafe_allow_html=True)
 
+# Curated resource pages for the fallback search, matched by keyword in this order
+_RESOURCE_TOPIC_HANDLERS = (
+    ("python", show_python_resources),
+    ("machine learning", show_data_science_resources),
+    ("data science", show_data_science_resources),
+    ("english", show_communication_resources),
+    ("communication", show_communication_resources),
+)
+
 # Show general resources based on query
 def show_general_resources(query):
     # A simplified version that just shows generic resources
@@ -6352,16 +6474,12 @@ def show_settings_page():
                 
                 col1, col2 = st.columns(2)
                 with col1:
-                    degree = st.selectbox("Degree Program", [
-                        "B.Tech/B.E.", "BBA", "B.Sc.", "B.Com.", "B.A.", 
-                        "M.Tech/M.E.", "MBA", "M.Sc.", "M.Com.", "M.A.",
-                        "BCA", "MCA", "Ph.D.", "Diploma", "Other"
-                    ], index=get_degree_index(profile.get_degree()))
+                    degree = st.selectbox("Degree Program", _DEGREES,
+                                          index=get_degree_index(profile.get_degree()))
                     
                 with col2:
-                    year_of_study = st.selectbox("Year of Study", [
-                        "1st Year", "2nd Year", "3rd Year", "4th Year", "5th Year", "Final Year"
-                    ], index=get_year_index(profile.get_year_of_study()))
+                    year_of_study = st.selectbox("Year of Study", _YEARS,
+                                                 index=get_year_index(profile.get_year_of_study()))
                 
                 email = st.text_input("Email Address", value=profile_data.get('email', ''))
                 
@@ -6529,25 +6647,15 @@ def show_settings_page():
 
 # Helper function to get index of degree in dropdown
 def get_degree_index(degree):
-    degrees = [
-        "B.Tech/B.E.", "BBA", "B.Sc.", "B.Com.", "B.A.", 
-        "M.Tech/M.E.", "MBA", "M.Sc.", "M.Com.", "M.A.",
-        "BCA", "MCA", "Ph.D.", "Diploma", "Other"
-    ]
-    
     try:
-        return degrees.index(degree)
+        return _DEGREES.index(degree)
     except ValueError:
         return 0  # Default to first option if not found
 
 # Helper function to get index of year in dropdown
 def get_year_index(year):
-    years = [
-        "1st Year", "2nd Year", "3rd Year", "4th Year", "5th Year", "Final Year"
-    ]
-    
     try:
-        return years.index(year)
+        return _YEARS.index(year)
     except ValueError:
         return 0  # Default to first option if not found
 
@@ -13,6 +13,9 @@ class DataManager:
         """Initialize the data manager with the data directory"""
         self.data_dir = data_dir
         
+        # Bumped on every write so callers can tell when cached results are stale
+        self.version = 0
+        
         # Create data directories if they don't exist
         os.makedirs(data_dir, exist_ok=True)
         os.makedirs(os.path.join(data_dir, "profiles"), exist_ok=True)
@@ -66,6 +69,7 @@ class DataManager:
             
             with open(profile_file, 'w') as f:
                 json.dump(profile_data, f, indent=2)
+            self.version += 1
             
             # Create directories for this student
             self._ensure_student_dirs(student_id)
@@ -128,6 +132,7 @@ class DataManager:
             
             with open(file_path, 'w') as f:
                 json.dump(data, f, indent=2)
+            self.version += 1
             
             return True
         except Exception as e:
@@ -175,6 +180,7 @@ class DataManager:
             # Save file
             file_path = os.path.join(module_dir, f"{file_name}.csv")
             df.to_csv(file_path, index=False)
+            self.version += 1
             
             return True
         except Exception as e:
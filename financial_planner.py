@@ -2,6 +2,7 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import uuid
 import random
+import pandas as pd
 
 class FinancialPlanner:
     """
@@ -19,6 +20,9 @@ class FinancialPlanner:
         self.financial_aid = data_manager.load_data(student_id, "financial", "financial_aid") or []
         self.fee_payments = data_manager.load_data(student_id, "financial", "fee_payments") or []
         self.goals = data_manager.load_data(student_id, "financial", "goals") or []
+        
+        # Per-category expense totals, cleared whenever a transaction is added
+        self._expenses_cache = None
     
     def add_transaction(self, transaction_data: Dict[str, Any]) -> bool:
         """Add a new financial transaction"""
@@ -32,6 +36,7 @@ class FinancialPlanner:
         
         # Add the transaction
         self.transactions.append(transaction_data)
+        self._expenses_cache = None
         
         # Save the updated transactions list
         success = self.data_manager.save_data(
@@ -371,31 +376,28 @@ class FinancialPlanner:
         Get expenses categorized by category
         Returns a list of dicts with category and total amount
         """
-        try:
-            # Get all transactions
-            transactions = self.get_all_transactions()
-            
-            # Filter for expenses (negative amounts)
-            expenses = [t for t in transactions if t.get('amount', 0) < 0]
-            
-            # Group by category
-            categories = {}
-            for expense in expenses:
-                category = expense.get('category', 'Other')
-                amount = abs(expense.get('amount', 0))
+        if self._expenses_cache is None:
+            try:
+                # Get all transactions
+                transactions = self.get_all_transactions()
+                df = pd.DataFrame(transactions)
+                if df.empty or 'amount' not in df.columns:
+                    return []
                 
-                if category not in categories:
-                    categories[category] = 0
+                # Only a missing category counts as 'Other'; an explicit None keeps its own group
+                df['category'] = [t.get('category', 'Other') for t in transactions]
                 
-                categories[category] += amount
-            
-            # Convert to list of dicts for visualization
-            result = [{"category": cat, "amount": amt} for cat, amt in categories.items()]
-            
-            # Sort by amount (largest first)
-            result.sort(key=lambda x: x["amount"], reverse=True)
-            
-            return result
-        except Exception as e:
-            print(f"Error getting expenses by category: {e}")
-            return []
+                # Filter for expenses (negative amounts) and total them per category
+                expenses = df[df['amount'] < 0]
+                totals = (-expenses['amount']).groupby(expenses['category'], sort=False, dropna=False).sum()
+                
+                # Convert to list of dicts for visualization, largest first
+                totals = totals.sort_values(ascending=False, kind='stable')
+                self._expenses_cache = [{"category": None if pd.isna(cat) else cat, "amount": amt}
+                                        for cat, amt in totals.items()]
+            except Exception as e:
+                print(f"Error getting expenses by category: {e}")
+                return []
+        
+        # Hand out copies so callers can't edit the cached totals
+        return [dict(row) for row in self._expenses_cache]
@@ -19,6 +19,9 @@ class MentalWellnessCoach:
         self.coping_strategies = data_manager.load_data(student_id, "wellness", "coping_strategies") or []
         self.resources = data_manager.load_data(student_id, "wellness", "resources") or []
         self.habits = data_manager.load_data(student_id, "wellness", "habits") or []
+        
+        # Bumped whenever a mood entry is logged, so cached views of the history can be invalidated
+        self.mood_version = 0
     
     def log_mood(self, mood_data: Dict[str, Any]) -> bool:
         """Log a new mood entry"""
@@ -32,6 +35,7 @@ class MentalWellnessCoach:
         
         # Add the mood entry
         self.mood_entries.append(mood_data)
+        self.mood_version += 1
         
         # Extract sleep data if provided
         if "sleep_hours" in mood_data:
@@ -11,6 +11,9 @@ class StudentProfile:
         self.student_id = student_id
         self.profile_data = profile_data
         
+        # Bumped on every profile or preference change, so cached views can be invalidated
+        self.version = 0
+        
         # Set defaults for any missing fields
         self._set_defaults()
     
@@ -61,6 +64,7 @@ class StudentProfile:
     def update_profile(self, updates: Dict[str, Any]) -> bool:
         """Update the student profile with new values"""
         self.profile_data.update(updates)
+        self.version += 1
         # In a real implementation, we would save the profile here
         return True
     
@@ -70,6 +74,7 @@ class StudentProfile:
             self.profile_data["preferences"] = {}
         
         self.profile_data["preferences"][key] = value
+        self.version += 1
         # In a real implementation, we would save the profile here
         return True
     
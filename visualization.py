@@ -2,6 +2,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
+import math
 from typing import Dict, List, Any, Optional
 
 def create_gauge_chart(current_value: float, min_value: float, max_value: float, 
@@ -61,8 +62,104 @@ def create_gauge_chart(current_value: float, min_value: float, max_value: float,
     
     return fig
 
+def create_gauge_svg(current_value: float, min_value: float, max_value: float,
+                     threshold: float, title: str, is_percent: bool = False) -> str:
+    """
+    Create a lightweight inline SVG gauge with the same colour bands as create_gauge_chart
+    
+    Args:
+        current_value: The current value to display
+        min_value: Minimum value on the gauge
+        max_value: Maximum value on the gauge
+        threshold: Threshold value for color coding
+        title: Title for the gauge
+        is_percent: Whether the value is a percentage
+    
+    Returns:
+        SVG markup suitable for st.markdown(..., unsafe_allow_html=True)
+    """
+    # Set up colors based on threshold
+    if current_value >= threshold:
+        color = "green"
+    elif current_value >= threshold * 0.7:
+        color = "orange"
+    else:
+        color = "red"
+    
+    display_value = f"{current_value:.1f}%" if is_percent else f"{current_value:.1f}"
+    span = (max_value - min_value) or 1
+    
+    def point(value, radius=80):
+        # Map a value onto the half circle, left (min) to right (max)
+        fraction = min(max((value - min_value) / span, 0.0), 1.0)
+        angle = math.pi * (1 - fraction)
+        return 100 + radius * math.cos(angle), 115 - radius * math.sin(angle)
+    
+    def arc(start, end, stroke, width):
+        x0, y0 = point(start)
+        x1, y1 = point(end)
+        return (f'<path d="M {x0:.1f} {y0:.1f} A 80 80 0 0 1 {x1:.1f} {y1:.1f}" '
+                f'fill="none" stroke="{stroke}" stroke-width="{width}"/>')
+    
+    tick_x0, tick_y0 = point(threshold, 66)
+    tick_x1, tick_y1 = point(threshold, 94)
+    
+    return (
+        '<div style="text-align: center;">'
+        '<svg viewBox="0 0 200 150" style="width: 100%; max-width: 240px;">'
+        f'<text x="100" y="14" text-anchor="middle" font-size="13" fill="#333">{title}</text>'
+        + arc(min_value, threshold * 0.7, "rgba(255, 0, 0, 0.2)", 24)
+        + arc(threshold * 0.7, threshold, "rgba(255, 165, 0, 0.3)", 24)
+        + arc(threshold, max_value, "rgba(0, 128, 0, 0.2)", 24)
+        + arc(min_value, current_value, color, 10)
+        + f'<line x1="{tick_x0:.1f}" y1="{tick_y0:.1f}" x2="{tick_x1:.1f}" y2="{tick_y1:.1f}" stroke="black" stroke-width="2"/>'
+        f'<text x="100" y="112" text-anchor="middle" font-size="26" font-weight="bold" fill="#333">{display_value}</text>'
+        f'<text x="20" y="140" text-anchor="middle" font-size="10" fill="#666">{min_value}</text>'
+        f'<text x="180" y="140" text-anchor="middle" font-size="10" fill="#666">{max_value}</text>'
+        '</svg></div>'
+    )
+
+def downsample_points(data: List[Dict[str, Any]], y_key: str, max_points: int = 500) -> List[Dict[str, Any]]:
+    """
+    Reduce a long series to roughly max_points entries, keeping the low and high point of each bucket
+    
+    Args:
+        data: List of dictionaries in plotting order
+        y_key: Key for the y-axis values used to pick each bucket's extremes
+        max_points: Upper bound on the number of points returned
+    
+    Returns:
+        The original list when it is already short enough, otherwise a decimated copy in the same order
+    """
+    if len(data) <= max_points:
+        return data
+    
+    buckets = max(max_points // 2, 1)
+    size = len(data) / buckets
+    result = []
+    for bucket in range(buckets):
+        chunk = data[int(bucket * size):int((bucket + 1) * size)]
+        if not chunk:
+            continue
+        values = [entry.get(y_key) or 0 for entry in chunk]
+        low = values.index(min(values))
+        high = values.index(max(values))
+        result.extend(chunk[i] for i in sorted({low, high}))
+    
+    return result
+
+# Series shorter than this render as SVG regardless of the requested mode
+WEBGL_MIN_POINTS = 1000
+
+# Upper bound on the points a WebGL series sends to the browser; SVG series use downsample_points' default
+WEBGL_MAX_POINTS = 5000
+
+# Shared layouts for the trend and pie helpers, applied on figure construction
+_TREND_LAYOUT = dict(height=300, margin=dict(l=20, r=20, t=50, b=30), hovermode="x unified")
+_PIE_LAYOUT = dict(height=300, margin=dict(l=20, r=20, t=50, b=30), showlegend=True)
+
 def create_trend_chart(data: List[Dict[str, Any]], x_key: str, y_key: str, 
-                     title: str, color: str) -> go.Figure:
+                     title: str, color: str, render_mode: str = "auto") -> go.Figure:
     """
     Create a line chart for visualizing trends over time
     
@@ -72,31 +169,26 @@ def create_trend_chart(data: List[Dict[str, Any]], x_key: str, y_key: str,
         y_key: Key for the y-axis values in the data dictionaries
         title: Chart title
         color: Line color
+        render_mode: Plotly render mode; "svg" forces SVG, otherwise WebGL is used
+            once the series reaches WEBGL_MIN_POINTS
     
     Returns:
         Plotly figure object
     """
-    # Convert to DataFrame
-    df = pd.DataFrame(data)
-    
-    # Create line chart
-    fig = px.line(
-        df,
-        x=x_key,
-        y=y_key,
-        title=title,
-        markers=True
-    )
-    
-    # Update line color
-    fig.update_traces(line_color=color)
-    
-    # Update layout
-    fig.update_layout(
-        height=300,
-        margin=dict(l=20, r=20, t=50, b=30),
-        hovermode="x unified"
+    # WebGL only pays for its context setup on long series; short ones draw faster as SVG
+    use_webgl = render_mode != "svg" and len(data) >= WEBGL_MIN_POINTS
+    trace = go.Scattergl if use_webgl else go.Scatter
+    fig = go.Figure(
+        trace(
+            x=[entry.get(x_key) for entry in data],
+            y=[entry.get(y_key) for entry in data],
+            mode="lines+markers",
+            line=dict(color=color),
+            name=y_key
+        ),
+        layout=_TREND_LAYOUT
     )
+    fig.update_layout(title=title, xaxis_title=x_key, yaxis_title=y_key)
     
     return fig
 
@@ -114,25 +206,16 @@ def create_pie_chart(data: List[Dict[str, Any]], labels_key: str, values_key: st
     Returns:
         Plotly figure object
     """
-    # Convert to DataFrame
-    df = pd.DataFrame(data)
-    
-    # Create pie chart
-    fig = px.pie(
-        df,
-        names=labels_key,
-        values=values_key,
-        title=title
+    fig = go.Figure(
+        go.Pie(
+            labels=[entry.get(labels_key) for entry in data],
+            values=[entry.get(values_key) for entry in data],
+            textposition='inside',
+            textinfo='percent+label'
+        ),
+        layout=_PIE_LAYOUT
     )
-    
-    # Update layout
-    fig.update_layout(
-        height=300,
-        margin=dict(l=20, r=20, t=50, b=30)
-    )
-    
-    # Update trace
-    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(title=title)
     
     return fig
 